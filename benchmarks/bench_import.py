@@ -0,0 +1,109 @@
+"""Benchmark the time it takes to import sportypy's surfaces.
+
+Each import is timed in a fresh interpreter so that nothing is already cached
+in sys.modules. The surfaces only import matplotlib once they are drawn, so
+importing a surface is compared against importing it along with
+matplotlib.pyplot (which every surface module imported before matplotlib was
+loaded lazily).
+
+Usage
+-----
+    python benchmarks/bench_import.py [--repeat N] [--module MODULE]
+
+@author: Ross Drucker
+"""
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+
+# The statement run in each fresh interpreter. This prints the time taken by
+# the imports, followed by which of the heavy dependencies were loaded
+_timing_script = '''
+import sys
+import time
+start = time.perf_counter()
+{imports}
+elapsed = time.perf_counter() - start
+heavy = [m for m in ('matplotlib', 'pandas', 'scipy') if m in sys.modules]
+print(elapsed, ','.join(heavy))
+'''
+
+
+def time_import(imports, repeat = 10):
+    """Time a set of imports, each time in a fresh interpreter.
+
+    Parameters
+    ----------
+    imports : str
+        The import statements to time
+
+    repeat : int (default: 10)
+        The number of times to time the imports
+
+    Returns
+    -------
+    median : float
+        The median time (in seconds) taken by the imports
+
+    loaded : str
+        The heavy dependencies that were loaded by the imports
+    """
+    # Make sure that the copy of sportypy being benchmarked is the one that
+    # gets imported
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        p for p in (repo_root, env.get('PYTHONPATH')) if p
+    )
+
+    times = []
+    loaded = ''
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', _timing_script.format(imports = imports)],
+            check = True,
+            capture_output = True,
+            text = True,
+            env = env
+        ).stdout.split()
+
+        times.append(float(output[0]))
+        loaded = output[1] if len(output) > 1 else ''
+
+    return statistics.median(times), loaded
+
+
+def main():
+    """Run the benchmark and print its results."""
+    parser = argparse.ArgumentParser(description = __doc__.splitlines()[0])
+    parser.add_argument('--repeat', type = int, default = 10)
+    parser.add_argument('--module', default = 'sportypy.surfaces.hockey')
+    args = parser.parse_args()
+
+    cases = [
+        ('lazy', f'import {args.module}'),
+        (
+            'with pyplot',
+            f'import {args.module}\nimport matplotlib.pyplot'
+        ),
+    ]
+
+    results = {}
+    for name, imports in cases:
+        results[name], loaded = time_import(imports, args.repeat)
+        print(
+            f'{name:>12}: {results[name] * 1000:8.1f} ms  ' +
+            f'(loaded: {loaded or "none"})'
+        )
+
+    print(
+        f'{"saved":>12}: ' +
+        f'{(results["with pyplot"] - results["lazy"]) * 1000:8.1f} ms'
+    )
+
+
+if __name__ == '__main__':
+    main()
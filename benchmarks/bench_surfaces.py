@@ -0,0 +1,282 @@
+"""Benchmark the construction, geometry, and rendering of every surface.
+
+For each surface, this times:
+
+    construct : creating the surface from scratch (with the template cache
+        disabled)
+    clone : creating the surface again once its template is cached
+    geometry : instantiating the surface's features and computing their
+        coordinates
+    draw : drawing the surface's features on a new figure and rendering it
+    convert_xy : repositioning 10^6 points with the surface's convert_xy()
+    png : rendering the surface to a PNG with its render() method
+
+along with the number of vertices in the surface's features and the peak
+memory (as measured by tracemalloc) used to build the surface and compute
+its geometry. Stages that fail for a surface are reported as errors rather
+than stopping the benchmark. The results may be written as JSON so that they
+can be compared across releases.
+
+Usage
+-----
+    python benchmarks/bench_surfaces.py [--repeat N] [--surface NAME ...]
+                                        [--json PATH]
+
+@author: Ross Drucker
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import importlib
+import statistics
+import tracemalloc
+import numpy as np
+
+
+# Make sure that the copy of sportypy being benchmarked is the one that gets
+# imported
+sys.path.insert(
+    0,
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+import sportypy  # noqa: E402
+from sportypy._base_classes import _base_surface  # noqa: E402
+
+
+# The surfaces to benchmark, as (module, class name) pairs
+_surfaces = (
+    ('sportypy.surfaces.hockey', 'NHLRink'),
+    ('sportypy.surfaces.hockey', 'IIHFRink'),
+    ('sportypy.surfaces.hockey', 'NCAARink'),
+    ('sportypy.surfaces.basketball', 'NBACourt'),
+    ('sportypy.surfaces.basketball', 'WNBACourt'),
+    ('sportypy.surfaces.basketball', 'NCAACourt'),
+    ('sportypy.surfaces.basketball', 'FIBACourt'),
+    ('sportypy.surfaces.basketball', 'NFHSCourt'),
+    ('sportypy.surfaces.baseball', 'BaseballField'),
+)
+
+# The number of points repositioned by the convert_xy benchmark
+_n_points = 10 ** 6
+
+
+def time_call(function, repeat):
+    """Time a function, returning the median of several calls.
+
+    Parameters
+    ----------
+    function : callable
+        The function to time. It is called with no arguments
+
+    repeat : int
+        The number of times to call the function
+
+    Returns
+    -------
+    median : float
+        The median time (in seconds) taken by the function
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return statistics.median(times)
+
+
+def build_uncached(surface_class):
+    """Build a surface from scratch, bypassing the template cache."""
+    maxsize = _base_surface._surface_templates_maxsize
+    _base_surface.set_surface_cache_size(0)
+
+    try:
+        return surface_class()
+
+    finally:
+        _base_surface.set_surface_cache_size(maxsize)
+
+
+def compute_geometry(surface):
+    """Instantiate a surface's features and compute their coordinates.
+
+    Parameters
+    ----------
+    surface : BaseSurface
+        The surface whose geometry should be computed
+
+    Returns
+    -------
+    n_vertices : int
+        The number of vertices in the surface's features and its constraint
+    """
+    return sum(
+        len(feature._translate_feature())
+        for feature in surface._get_all_features()
+    )
+
+
+def draw_surface(surface):
+    """Draw a surface on a new figure and render it, without using pyplot."""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize = (10, 5))
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(1, 1, 1)
+    surface.draw(ax = ax)
+    canvas.draw()
+
+
+def benchmark_surface(surface_class, repeat):
+    """Run every benchmark on a single surface.
+
+    Parameters
+    ----------
+    surface_class : type
+        The class of the surface to benchmark
+
+    repeat : int
+        The number of times to time each stage
+
+    Returns
+    -------
+    results : dict
+        The time (in seconds) taken by each stage, the surface's vertex
+        count, and the peak memory (in bytes) used to build it. Any stage
+        that fails is given the error it raised instead
+    """
+    results = {}
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-100.0, 100.0, _n_points)
+    y = rng.uniform(-50.0, 50.0, _n_points)
+
+    stages = {
+        'construct': lambda: build_uncached(surface_class),
+        'clone': lambda: surface_class(),
+        'geometry': lambda: compute_geometry(build_uncached(surface_class)),
+        'draw': lambda: draw_surface(surface_class()),
+        'convert_xy': lambda: surface_class().convert_xy(x, y),
+        'png': lambda: surface_class().render(width = 1000),
+    }
+
+    # Make sure that the surface's template is cached before timing any of
+    # the stages that use it
+    try:
+        surface_class()
+
+    except Exception as e:
+        return {'error': f'{type(e).__name__}: {e}'}
+
+    for stage, function in stages.items():
+        try:
+            results[stage] = time_call(function, repeat)
+
+        except Exception as e:
+            results[stage] = f'{type(e).__name__}: {e}'
+
+    try:
+        results['vertices'] = compute_geometry(surface_class())
+
+        tracemalloc.start()
+        compute_geometry(build_uncached(surface_class))
+        results['peak_memory'] = tracemalloc.get_traced_memory()[1]
+
+    except Exception as e:
+        results['vertices'] = f'{type(e).__name__}: {e}'
+
+    finally:
+        tracemalloc.stop()
+
+    return results
+
+
+def format_result(value, scale = 1000.0, digits = 8):
+    """Format a time (or an error) for the table of results."""
+    if isinstance(value, str):
+        return f'{"error":>{digits}}'
+
+    if value is None:
+        return f'{"-":>{digits}}'
+
+    return f'{value * scale:{digits}.2f}'
+
+
+def main():
+    """Run the benchmarks and print their results."""
+    parser = argparse.ArgumentParser(description = __doc__.splitlines()[0])
+    parser.add_argument('--repeat', type = int, default = 5)
+    parser.add_argument(
+        '--surface',
+        nargs = '+',
+        default = None,
+        help = 'the names of the surfaces to benchmark (default: all)'
+    )
+    parser.add_argument(
+        '--json',
+        default = None,
+        help = 'a path to write the results to as JSON'
+    )
+    args = parser.parse_args()
+
+    stages = ('construct', 'clone', 'geometry', 'draw', 'convert_xy', 'png')
+    print(
+        f'{"surface":<14}' +
+        ''.join(f'{stage:>11}' for stage in stages) +
+        f'{"vertices":>10}{"peak KiB":>10}'
+    )
+    print(f'{"":<14}' + ''.join(f'{"(ms)":>11}' for _ in stages))
+
+    all_results = {}
+    for module_name, class_name in _surfaces:
+        if args.surface and class_name not in args.surface:
+            continue
+
+        surface_class = getattr(
+            importlib.import_module(module_name),
+            class_name
+        )
+
+        results = benchmark_surface(surface_class, args.repeat)
+        all_results[class_name] = results
+
+        if 'error' in results:
+            print(f'{class_name:<14}  {results["error"]}')
+            continue
+
+        vertices = results.get('vertices')
+        peak = results.get('peak_memory')
+        print(
+            f'{class_name:<14}' +
+            ''.join(
+                '   ' + format_result(results.get(stage)) for stage in stages
+            ) +
+            f'{vertices if isinstance(vertices, int) else "error":>10}' +
+            f'{format_result(peak, 1 / 1024, 10)}'
+        )
+
+        for stage, value in results.items():
+            if isinstance(value, str):
+                print(f'{"":<14}  {stage}: {value}')
+
+    if args.json:
+        with open(args.json, 'w', encoding = 'utf-8') as f:
+            json.dump(
+                {
+                    'sportypy_version': sportypy.__version__,
+                    'python_version': platform.python_version(),
+                    'numpy_version': np.__version__,
+                    'repeat': args.repeat,
+                    'results': all_results
+                },
+                f,
+                indent = 4
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -17,7 +17,6 @@ setuptools.setup(
         'pandas',
         'numpy',
         'matplotlib',
-        'scipy',
     ],
     classifiers=[
         'Programming Language :: Python',
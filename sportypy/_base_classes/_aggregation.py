@@ -0,0 +1,563 @@
+"""Streaming aggregators used to bin data on a surface.
+
+The aggregators accumulate the number of points and the sum of their values in
+each bin one chunk of points at a time, so that any number of points can be
+binned without holding all of them in memory. Once all of the points have been
+added, the accumulated counts and sums can be reduced to the statistic to be
+plotted.
+
+@author: Ross Drucker
+"""
+import math
+import numpy as np
+from abc import ABC, abstractmethod
+
+
+class _BinnedAggregator(ABC):
+    """A base class for accumulating points into a fixed set of bins.
+
+    Each subclass defines the bins through its _bin_index() method, which maps
+    points to the flat index of the bin they lie in.
+
+    Attributes
+    ----------
+    n_bins : int
+        The total number of bins
+
+    counts : numpy.ndarray
+        The number of points that have been added to each bin
+
+    sums : numpy.ndarray
+        The sum of the values of the points that have been added to each bin
+    """
+
+    def __init__(self, n_bins):
+        self.n_bins = n_bins
+        self.counts = np.zeros(n_bins, dtype = np.int64)
+        self.sums = np.zeros(n_bins, dtype = np.float64)
+
+    @abstractmethod
+    def _bin_index(self, x, y):
+        """Find the bin that each point lies in.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            The x coordinates of the points
+
+        y : numpy.ndarray
+            The y coordinates of the points
+
+        Returns
+        -------
+        bin_index : numpy.ndarray
+            The flat index of the bin that each point lies in, or -1 if the
+            point doesn't lie in any bin
+        """
+        pass
+
+    def add(self, x, y, values = None):
+        """Add a chunk of points to the bins.
+
+        Parameters
+        ----------
+        x : array-like
+            The x coordinates of the points
+
+        y : array-like
+            The y coordinates of the points
+
+        values : array-like or None (default: None)
+            The value of each point. If None, each point has a value of 1
+
+        Returns
+        -------
+        Nothing, but the counts and sums of the bins are updated
+        """
+        x = np.ravel(np.asarray(x, dtype = np.float64))
+        y = np.ravel(np.asarray(y, dtype = np.float64))
+
+        bin_index = self._bin_index(x, y)
+        is_binned = bin_index >= 0
+        bin_index = bin_index[is_binned]
+
+        self.counts += np.bincount(bin_index, minlength = self.n_bins)
+
+        if values is None:
+            self.sums += np.bincount(bin_index, minlength = self.n_bins)
+        else:
+            values = np.ravel(np.asarray(values, dtype = np.float64))
+            self.sums += np.bincount(
+                bin_index,
+                weights = values[is_binned],
+                minlength = self.n_bins
+            )
+
+    def reduce(self, statistic = 'count', mincnt = None):
+        """Reduce the accumulated points to a statistic for each bin.
+
+        Parameters
+        ----------
+        statistic : str (default: 'count')
+            The statistic to compute. This may be 'count' (the number of points
+            in each bin), 'sum' (the sum of the points' values), or 'mean' (the
+            average of the points' values)
+
+        mincnt : int or None (default: None)
+            The minimum number of points a bin must contain to have a value.
+            Bins with fewer points are set to be nan. If None, only bins
+            without any points have no mean
+
+        Returns
+        -------
+        reduced : numpy.ndarray
+            The statistic for each bin
+        """
+        statistic = statistic.lower()
+
+        if statistic == 'count':
+            reduced = self.counts.astype(np.float64)
+
+        elif statistic == 'sum':
+            reduced = self.sums.copy()
+
+        elif statistic == 'mean':
+            with np.errstate(invalid = 'ignore', divide = 'ignore'):
+                reduced = self.sums / self.counts
+
+        else:
+            raise ValueError(
+                "statistic must be one of 'count', 'sum', or 'mean'"
+            )
+
+        if mincnt is not None:
+            reduced[self.counts < mincnt] = np.nan
+
+        return reduced
+
+
+class _GridAggregator(_BinnedAggregator):
+    """Accumulate points into a rectangular grid of square bins.
+
+    Attributes
+    ----------
+    x_edges : numpy.ndarray
+        The edges of the bins in the x direction
+
+    y_edges : numpy.ndarray
+        The edges of the bins in the y direction
+
+    shape : tuple (int, int)
+        The number of bins in the y and x directions (in that order)
+    """
+
+    def __init__(self, xlim, ylim, bin_size = 1.0):
+        # The bins start at the lower limits and extend at least as far as the
+        # upper limits
+        n_x = max(int(math.ceil((xlim[1] - xlim[0]) / bin_size)), 1)
+        n_y = max(int(math.ceil((ylim[1] - ylim[0]) / bin_size)), 1)
+
+        self.bin_size = bin_size
+        self.x_edges = xlim[0] + (np.arange(n_x + 1) * bin_size)
+        self.y_edges = ylim[0] + (np.arange(n_y + 1) * bin_size)
+        self.shape = (n_y, n_x)
+
+        super().__init__(n_x * n_y)
+
+    def _bin_index(self, x, y):
+        n_y, n_x = self.shape
+
+        with np.errstate(invalid = 'ignore'):
+            ix = np.floor((x - self.x_edges[0]) / self.bin_size)
+            iy = np.floor((y - self.y_edges[0]) / self.bin_size)
+
+        # Points on the upper edge of the grid belong to the last bin
+        ix[x == self.x_edges[-1]] = n_x - 1
+        iy[y == self.y_edges[-1]] = n_y - 1
+
+        is_binned = (ix >= 0) & (ix < n_x) & (iy >= 0) & (iy < n_y)
+
+        return np.where(
+            is_binned,
+            (np.where(is_binned, iy, 0) * n_x) + np.where(is_binned, ix, 0),
+            -1
+        ).astype(np.int64)
+
+    def get_centers(self):
+        """Get the centers of the bins.
+
+        Returns
+        -------
+        x_centers : numpy.ndarray
+            The centers of the bins in the x direction
+
+        y_centers : numpy.ndarray
+            The centers of the bins in the y direction
+        """
+        x_centers = (self.x_edges[:-1] + self.x_edges[1:]) / 2.0
+        y_centers = (self.y_edges[:-1] + self.y_edges[1:]) / 2.0
+
+        return x_centers, y_centers
+
+    def reduce(self, statistic = 'count', mincnt = None):
+        """Reduce the accumulated points to a statistic for each bin.
+
+        See _BinnedAggregator.reduce() for more information
+
+        Returns
+        -------
+        reduced : numpy.ndarray
+            The statistic for each bin, with one row per bin in the y
+            direction and one column per bin in the x direction
+        """
+        return super().reduce(statistic, mincnt).reshape(self.shape)
+
+
+class _HexAggregator(_BinnedAggregator):
+    """Accumulate points into a hexagonal grid.
+
+    The grid is the same as the one used by matplotlib's hexbin(), so the
+    accumulated bins can be drawn by passing their centers to it.
+
+    Attributes
+    ----------
+    extent : tuple (float, float, float, float)
+        The (xmin, xmax, ymin, ymax) limits of the grid
+
+    gridsize : tuple (int, int)
+        The number of hexagons in the x and y directions
+    """
+
+    def __init__(self, extent, gridsize = 100):
+        if np.iterable(gridsize):
+            n_x, n_y = gridsize
+        else:
+            n_x = gridsize
+            n_y = int(n_x / math.sqrt(3))
+
+        self.extent = tuple(extent)
+        self.gridsize = (n_x, n_y)
+
+        # The grid is made up of two offset lattices of hexagons. As in
+        # matplotlib, the grid is padded slightly to avoid roundoff errors
+        xmin, xmax, ymin, ymax = self.extent
+        padding = 1.e-9 * (xmax - xmin)
+        self._xmin = xmin - padding
+        self._ymin = ymin
+        self._sx = ((xmax + padding) - self._xmin) / n_x
+        self._sy = (ymax - ymin) / n_y
+        self._n_lattice_1 = (n_x + 1) * (n_y + 1)
+
+        super().__init__(self._n_lattice_1 + (n_x * n_y))
+
+    def _bin_index(self, x, y):
+        n_x, n_y = self.gridsize
+
+        # Find the positions of the points in hexagon index coordinates
+        ix = (x - self._xmin) / self._sx
+        iy = (y - self._ymin) / self._sy
+
+        with np.errstate(invalid = 'ignore'):
+            ix1 = np.round(ix)
+            iy1 = np.round(iy)
+            ix2 = np.floor(ix)
+            iy2 = np.floor(iy)
+
+        # Each point belongs to the nearer of the centers of the two lattices
+        d1 = ((ix - ix1) ** 2) + (3.0 * ((iy - iy1) ** 2))
+        d2 = ((ix - ix2 - 0.5) ** 2) + (3.0 * ((iy - iy2 - 0.5) ** 2))
+        in_lattice_1 = d1 < d2
+
+        with np.errstate(invalid = 'ignore'):
+            i1 = np.where(
+                (0 <= ix1) & (ix1 < n_x + 1) & (0 <= iy1) & (iy1 < n_y + 1),
+                (ix1 * (n_y + 1)) + iy1,
+                -1
+            )
+            i2 = np.where(
+                (0 <= ix2) & (ix2 < n_x) & (0 <= iy2) & (iy2 < n_y),
+                self._n_lattice_1 + (ix2 * n_y) + iy2,
+                -1
+            )
+
+        bin_index = np.where(in_lattice_1, i1, i2)
+
+        # Points with a missing coordinate don't lie in any bin
+        bin_index[np.isnan(d1) | np.isnan(d2)] = -1
+
+        return bin_index.astype(np.int64)
+
+    def get_centers(self):
+        """Get the centers of the hexagons.
+
+        Returns
+        -------
+        centers : numpy.ndarray
+            An (N, 2) array of the centers of the hexagons, in the same order
+            as the bins
+        """
+        n_x, n_y = self.gridsize
+
+        centers = np.zeros((self.n_bins, 2))
+        centers[:self._n_lattice_1, 0] = np.repeat(np.arange(n_x + 1), n_y + 1)
+        centers[:self._n_lattice_1, 1] = np.tile(np.arange(n_y + 1), n_x + 1)
+        centers[self._n_lattice_1:, 0] = np.repeat(np.arange(n_x) + 0.5, n_y)
+        centers[self._n_lattice_1:, 1] = np.tile(np.arange(n_y), n_x) + 0.5
+        centers[:, 0] = (centers[:, 0] * self._sx) + self._xmin
+        centers[:, 1] = (centers[:, 1] * self._sy) + self._ymin
+
+        return centers
+
+
+class SurfaceAccumulator(_GridAggregator):
+    """A 2D histogram of points on a surface that can be updated over time.
+
+    An accumulator is created by a surface's accumulator() method, and bins
+    points in that surface's coordinate system: points are shifted by the
+    surface's x_trans and y_trans before they are binned, and (if the
+    accumulator is constrained) points that lie outside of the surface are
+    ignored. New points can be added at any time, so a density map only needs
+    to be updated with the points that have been recorded since it was last
+    updated
+
+    Accumulators with the same bins (e.g. those filled by different workers)
+    can be merged together, and accumulators can be saved to and loaded from
+    .npz files
+
+    Attributes
+    ----------
+    surface : BaseSurfacePlot
+        The surface whose coordinate system the accumulator uses
+
+    symmetrize : bool
+        Whether or not each point is also binned after being reflected over
+        the x axis
+
+    is_constrained : bool
+        Whether or not points that lie outside of the surface are ignored
+    """
+
+    def __init__(self, surface, xlim, ylim, bin_size = 1.0,
+                 symmetrize = False, is_constrained = True):
+        super().__init__(xlim, ylim, bin_size)
+
+        self.surface = surface
+        self.symmetrize = symmetrize
+        self.is_constrained = is_constrained
+
+    def add(self, x, y, weights = None):
+        """Add points to the accumulator.
+
+        Parameters
+        ----------
+        x : array-like
+            The x coordinates of the points, in the same coordinate system as
+            the surface before it is shifted
+
+        y : array-like
+            The y coordinates of the points, in the same coordinate system as
+            the surface before it is shifted
+
+        weights : array-like or None (default: None)
+            The weight of each point. If None, each point has a weight of 1
+
+        Returns
+        -------
+        self : SurfaceAccumulator
+            The accumulator, with the points added to its bins
+        """
+        x = np.ravel(x)
+        y = np.ravel(y)
+        if weights is not None:
+            weights = np.ravel(weights)
+
+            if len(weights) != len(x):
+                raise Exception('x, y, and weights must all be of same length')
+
+        if len(x) != len(y):
+            raise Exception('x, y, and weights must all be of same length')
+
+        super().add(*self.surface._prepare_chunk(
+            x,
+            y,
+            weights,
+            (self.x_edges[0], self.x_edges[-1]),
+            (self.y_edges[0], self.y_edges[-1]),
+            self.symmetrize,
+            self.is_constrained
+        ))
+
+        return self
+
+    def is_compatible(self, other):
+        """Check whether another accumulator has the same bins as this one.
+
+        Parameters
+        ----------
+        other : SurfaceAccumulator
+            The accumulator to compare against
+
+        Returns
+        -------
+        is_compatible : bool
+            Whether or not the two accumulators bin points in the same way
+        """
+        return (
+            isinstance(other, SurfaceAccumulator) and
+            np.array_equal(self.x_edges, other.x_edges) and
+            np.array_equal(self.y_edges, other.y_edges) and
+            self.symmetrize == other.symmetrize and
+            self.is_constrained == other.is_constrained and
+            self.surface.x_trans == other.surface.x_trans and
+            self.surface.y_trans == other.surface.y_trans
+        )
+
+    def merge(self, *others):
+        """Merge other accumulators' points into this one.
+
+        Parameters
+        ----------
+        *others : SurfaceAccumulator
+            The accumulators to merge. These must have the same bins as this
+            accumulator
+
+        Returns
+        -------
+        self : SurfaceAccumulator
+            The accumulator, with the other accumulators' points added to its
+            bins
+        """
+        for other in others:
+            if not self.is_compatible(other):
+                raise ValueError(
+                    'Only accumulators with the same bins can be merged'
+                )
+
+        for other in others:
+            self.counts += other.counts
+            self.sums += other.sums
+
+        return self
+
+    def __iadd__(self, other):
+        return self.merge(other)
+
+    def save(self, path):
+        """Save the accumulator to a .npz file.
+
+        Parameters
+        ----------
+        path : str or file-like
+            Where to save the accumulator
+
+        Returns
+        -------
+        Nothing, but the accumulator is saved
+        """
+        np.savez(
+            path,
+            x_edges = self.x_edges,
+            y_edges = self.y_edges,
+            bin_size = self.bin_size,
+            counts = self.counts,
+            sums = self.sums,
+            symmetrize = self.symmetrize,
+            is_constrained = self.is_constrained,
+            x_trans = self.surface.x_trans,
+            y_trans = self.surface.y_trans,
+            surface = type(self.surface).__name__
+        )
+
+    @classmethod
+    def load(cls, path, surface):
+        """Load an accumulator from a .npz file.
+
+        Parameters
+        ----------
+        path : str or file-like
+            Where the accumulator was saved
+
+        surface : BaseSurfacePlot
+            The surface whose coordinate system the accumulator uses. This
+            must be the same kind of surface, with the same shift, as the one
+            that the saved accumulator used
+
+        Returns
+        -------
+        accumulator : SurfaceAccumulator
+            The loaded accumulator
+        """
+        with np.load(path) as saved:
+            if (
+                str(saved['surface']) != type(surface).__name__ or
+                float(saved['x_trans']) != surface.x_trans or
+                float(saved['y_trans']) != surface.y_trans
+            ):
+                raise ValueError(
+                    'The accumulator was saved from a ' +
+                    f'{saved["surface"]} with a shift of ' +
+                    f'({float(saved["x_trans"])}, ' +
+                    f'{float(saved["y_trans"])}), which does not match the ' +
+                    'supplied surface'
+                )
+
+            x_edges = saved['x_edges']
+            y_edges = saved['y_edges']
+
+            accumulator = cls(
+                surface,
+                (x_edges[0], x_edges[-1]),
+                (y_edges[0], y_edges[-1]),
+                float(saved['bin_size']),
+                bool(saved['symmetrize']),
+                bool(saved['is_constrained'])
+            )
+
+            accumulator.x_edges = x_edges
+            accumulator.y_edges = y_edges
+            accumulator.counts = saved['counts']
+            accumulator.sums = saved['sums']
+
+        return accumulator
+
+    def heatmap(self, statistic = 'count', mincnt = 1, ax = None, **kwargs):
+        """Draw the accumulated points as a heatmap on the surface.
+
+        Parameters
+        ----------
+        statistic : str (default: 'count')
+            The statistic of each bin to plot. This may be 'count', 'sum', or
+            'mean'
+
+        mincnt : int or None (default: 1)
+            The minimum number of points a bin must contain to be drawn
+
+        ax : matplotlib.Axes or None (default: None)
+            An axes object onto which the plot can be drawn. If None is
+            supplied, then the currently-active Axes object will be used
+
+        **kwargs : dict or None (default: None)
+            Any keyword arguments to pass to matplotlib's pcolormesh() function
+
+        Returns
+        -------
+        mesh : matplotlib.collections.QuadMesh
+            The bins that were drawn
+        """
+        if ax is None:
+            import matplotlib.pyplot as plt
+            ax = plt.gca()
+
+        transform = self.surface._get_transform(ax)
+        mesh = ax.pcolormesh(
+            self.x_edges,
+            self.y_edges,
+            np.ma.masked_invalid(self.reduce(statistic, mincnt)),
+            transform = transform,
+            **kwargs
+        )
+
+        if self.is_constrained:
+            self.surface._constrain_plot([mesh], ax, transform)
+
+        return mesh
@@ -0,0 +1,325 @@
+"""Play back tracking data over a surface, one frame at a time.
+
+Redrawing the surface for every frame of a replay is what makes it slow. The
+functions in this module draw the surface only once, and keep a copy of the
+rendered surface as the background of every frame. Each frame then only
+restores that background and draws the artists for the players, ball, or puck
+that moved (this is known as blitting).
+
+A frame is a dictionary that maps the name of each group of objects (e.g.
+'home', 'away', 'puck') to their coordinates, given as an (x, y) pair or as
+anything with 'x' and 'y' columns (such as a data frame). Each group is drawn
+as a single scatter collection, styled by the keyword arguments given for it.
+
+@author: Ross Drucker
+"""
+import numpy as np
+from sportypy._base_classes._base_surface import _Rotation
+
+
+# The style of a group of objects that isn't given its own
+_default_style = {'s': 60, 'zorder': 1000}
+
+
+def _get_frame_coordinates(coordinates):
+    """Get the x and y coordinates of a group of objects in a frame.
+
+    Parameters
+    ----------
+    coordinates : tuple, array-like, or data frame
+        The coordinates, as an (x, y) pair or as anything with 'x' and 'y'
+        columns
+
+    Returns
+    -------
+    x : numpy.ndarray
+        The x coordinates of the objects
+
+    y : numpy.ndarray
+        The y coordinates of the objects
+    """
+    if not isinstance(coordinates, (tuple, list, np.ndarray)):
+        try:
+            return (
+                np.asarray(coordinates['x'], dtype = np.float64),
+                np.asarray(coordinates['y'], dtype = np.float64)
+            )
+
+        except (KeyError, TypeError, IndexError, ValueError):
+            pass
+
+    x, y = coordinates
+
+    return np.asarray(x, dtype = np.float64), np.asarray(y, dtype = np.float64)
+
+
+class _FramePainter:
+    """Keep the artists of each group of objects up to date with a frame.
+
+    Parameters
+    ----------
+    surface : BaseSurfacePlot
+        The surface that the objects are drawn over
+
+    ax : matplotlib.Axes
+        The Axes that the surface is drawn on
+
+    styles : dict or None
+        The keyword arguments to pass to matplotlib's scatter() function for
+        each group of objects, keyed by the group's name
+    """
+
+    def __init__(self, surface, ax, styles):
+        self.surface = surface
+        self.ax = ax
+        self.styles = styles or {}
+        self.artists = {}
+
+        # Create the artists for the styled groups up front, so that they're
+        # layered in the order that their styles are given
+        for name in self.styles:
+            self._get_artist(name)
+
+    def _get_artist(self, name):
+        """Get (or create) the scatter collection of a group of objects."""
+        artist = self.artists.get(name)
+
+        if artist is None:
+            style = {**_default_style, **self.styles.get(name, {})}
+            artist = self.ax.scatter(
+                np.empty(0),
+                np.empty(0),
+                animated = True,
+                **style
+            )
+            self.artists[name] = artist
+
+        return artist
+
+    def update(self, frame):
+        """Move the artists to the positions of the objects in a frame.
+
+        Parameters
+        ----------
+        frame : dict
+            The coordinates of each group of objects in the frame. Groups
+            that aren't in the frame are hidden
+
+        Returns
+        -------
+        artists : list
+            Every artist of the animation, which must all be redrawn
+        """
+        for name in frame:
+            self._get_artist(name)
+
+        for name, artist in self.artists.items():
+            if name in frame:
+                x, y = _get_frame_coordinates(frame[name])
+                x, y = self.surface.convert_xy(x, y)
+                artist.set_offsets(np.column_stack((x, y)))
+
+            else:
+                artist.set_offsets(np.empty((0, 2)))
+
+        return list(self.artists.values())
+
+
+def draw_static_surface(surface, ax, display_range, xlim, ylim, rotation,
+                        use_background):
+    """Draw the surface that every frame of an animation is drawn over.
+
+    Parameters
+    ----------
+    See BaseSurfacePlot.animate() for a description of each parameter
+
+    Returns
+    -------
+    Nothing, but the surface is drawn on the Axes
+    """
+    if use_background:
+        surface.draw_background(
+            ax = ax,
+            display_range = display_range,
+            xlim = xlim,
+            ylim = ylim,
+            rotation = rotation
+        )
+
+    else:
+        surface.draw(
+            ax = ax,
+            display_range = display_range,
+            xlim = xlim,
+            ylim = ylim,
+            rotation = rotation,
+            batched = True
+        )
+
+
+def create_animation(surface, frames, styles, ax, interval, display_range,
+                     xlim, ylim, rotation, use_background, **kwargs):
+    """Create a blitted FuncAnimation of frames of tracking data.
+
+    Parameters
+    ----------
+    See BaseSurfacePlot.animate() for a description of each parameter
+
+    Returns
+    -------
+    animation : matplotlib.animation.FuncAnimation
+        The animation
+    """
+    from matplotlib.animation import FuncAnimation
+
+    if ax is None:
+        import matplotlib.pyplot as plt
+        ax = plt.gca()
+
+    draw_static_surface(
+        surface,
+        ax,
+        display_range,
+        xlim,
+        ylim,
+        rotation,
+        use_background
+    )
+
+    painter = _FramePainter(surface, ax, styles)
+
+    # Frames are drawn as they're generated, and aren't kept once drawn
+    kwargs.setdefault('cache_frame_data', False)
+
+    return FuncAnimation(
+        ax.figure,
+        painter.update,
+        frames = frames,
+        init_func = lambda: painter.update({}),
+        interval = interval,
+        blit = True,
+        **kwargs
+    )
+
+
+def write_frames(surface, frames, path, fps, styles, width, dpi,
+                 display_range, xlim, ylim, rotation, facecolor,
+                 use_background, codec, ffmpeg_args, first_frame = 0):
+    """Write frames of tracking data to a video or a series of PNG files.
+
+    Parameters
+    ----------
+    See BaseSurfacePlot.write_animation() for a description of each parameter
+
+    Returns
+    -------
+    n_frames : int
+        The number of frames that were written
+    """
+    import subprocess
+    import matplotlib as mpl
+    from matplotlib.image import imsave
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    if facecolor is None:
+        facecolor = getattr(surface, 'feature_colors', {}).get(
+            'plot_background',
+            'none'
+        )
+
+    fig = Figure(dpi = dpi, facecolor = facecolor)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_axes([0.0, 0.0, 1.0, 1.0])
+
+    # The extent of the displayed region depends on the rotation, so apply it
+    # first
+    if rotation:
+        surface._rotation = _Rotation().rotate_deg(rotation)
+
+    x_min, x_max, y_min, y_max = surface._get_display_extent(
+        display_range,
+        xlim,
+        ylim
+    )
+
+    # Size the figure so that the displayed region exactly fills it. Videos
+    # must have an even width and height
+    width = int(width) + (int(width) % 2)
+    height = max(int(round(width * (y_max - y_min) / (x_max - x_min))), 2)
+    height += height % 2
+    fig.set_size_inches(width / dpi, height / dpi)
+
+    draw_static_surface(
+        surface,
+        ax,
+        display_range,
+        xlim,
+        ylim,
+        None,
+        use_background
+    )
+
+    painter = _FramePainter(surface, ax, styles)
+
+    # Render the surface once, and keep it as the background of every frame
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox)
+
+    is_png = '{' in str(path)
+    process = None
+    if not is_png:
+        ffmpeg_path = mpl.rcParams['animation.ffmpeg_path']
+        command = [
+            ffmpeg_path, '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'rgba',
+            '-s', f'{width}x{height}', '-r', str(fps),
+            '-i', '-',
+            '-c:v', codec, '-pix_fmt', 'yuv420p',
+            *(ffmpeg_args or []),
+            str(path)
+        ]
+
+        try:
+            process = subprocess.Popen(command, stdin = subprocess.PIPE)
+
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f'ffmpeg was not found at {ffmpeg_path}. Install ffmpeg, ' +
+                "set matplotlib's animation.ffmpeg_path, or write PNG files " +
+                "by giving a path with a '{frame}' field"
+            ) from None
+
+    n_frames = 0
+    try:
+        for frame in frames:
+            canvas.restore_region(background)
+
+            for artist in painter.update(frame):
+                ax.draw_artist(artist)
+
+            # Only the current frame is ever held in memory
+            pixels = np.asarray(canvas.buffer_rgba())
+
+            if is_png:
+                imsave(
+                    str(path).format(frame = first_frame + n_frames),
+                    pixels
+                )
+
+            else:
+                process.stdin.write(pixels.tobytes())
+
+            n_frames += 1
+
+    finally:
+        if process is not None:
+            process.stdin.close()
+            return_code = process.wait()
+
+    if process is not None and return_code:
+        raise RuntimeError(
+            f'ffmpeg exited with status {return_code} while writing {path}'
+        )
+
+    return n_frames
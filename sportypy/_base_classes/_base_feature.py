@@ -9,9 +9,8 @@ building blocks of each surface's features.
 """
 
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
 from abc import ABC, abstractmethod
+from sportypy._base_classes import _profiling
 
 
 class BaseFeature(ABC):
@@ -22,8 +21,9 @@ class BaseFeature(ABC):
 
     Attributes
     ----------
-    feature_df : pandas.DataFrame (default: empty data frame)
-        The dataframe containing the coordinates necessary to draw the feature
+    feature_df : numpy.ndarray or None (default: None)
+        Unused. Each feature's coordinates are determined by its
+        _get_centered_feature() method
 
     x_anchor : float (default: 0.0)
         The x coordinate corresponding to the feature's anchored position in
@@ -52,14 +52,20 @@ class BaseFeature(ABC):
     visible : bool (default: False)
         Whether or not the feature should be visible on the final plot
 
+    arc_tolerance : float or None (default: None)
+        The maximum allowable distance (in the units of the surface) between
+        any arc of the feature and the chords used to draw it. This determines
+        how many points are used to trace each arc. If None, each arc's
+        tolerance will be 0.1% of its radius
+
     plot_kwargs : dict
         Additional arguments the feature requires to be plotted
     """
 
-    def __init__(self, feature_df = pd.DataFrame(), x_anchor = 0.0,
+    def __init__(self, feature_df = None, x_anchor = 0.0,
                  y_anchor = 0.0, x_justify = 'center', y_justify = 'center',
                  reflect_x = False, reflect_y = True, is_constrained = True,
-                 visible = True, **plot_kwargs):
+                 visible = True, arc_tolerance = None, **plot_kwargs):
         """Initialize the attributes of the class.
 
         The attributes for features will be provided in the feature's
@@ -88,10 +94,17 @@ class BaseFeature(ABC):
         # Set the feature's visibility
         self.visible = visible
 
+        # Set the maximum chord error allowed when tracing the feature's arcs
+        self.arc_tolerance = arc_tolerance
+
         # Set the rest of the arguments that will be passed to the matplotlib
         # plotting functions
         self.plot_kwargs = plot_kwargs
 
+        # Initialize the cache of the feature's translated coordinates. This
+        # is populated the first time the feature is translated
+        self._geometry_cache = None
+
     @abstractmethod
     def _get_centered_feature(self):
         """Determine the feature's position if it were centered at (0, 0).
@@ -103,46 +116,145 @@ class BaseFeature(ABC):
 
         Returns
         -------
-        feature_df : pandas.DataFrame
-            The data frame containing the feature's x and y coordinates if they
-            were to be drawn at (0, 0)
+        feature_pts : numpy.ndarray
+            An (N, 2) array containing the feature's x and y coordinates if
+            they were to be drawn at (0, 0)
         """
         pass
 
-    def _translate_feature(self):
+    def _geometry_key(self):
+        """Get the key that identifies the feature's current geometry.
+
+        The key is made up of every attribute of the feature that may affect
+        its coordinates (its dimensions, anchors, reflections, etc.). The
+        attributes that only affect how the feature is displayed are excluded
+
+        Returns
+        -------
+        geometry_key : tuple
+            A hashable tuple of the feature's attribute names and values
+        """
+        geometry_key = []
+
+        for attr, value in sorted(vars(self).items()):
+            # Skip the attributes that don't change the feature's coordinates
+            if attr in ('plot_kwargs', 'visible', '_geometry_cache'):
+                continue
+
+            # Attributes such as lists aren't hashable, so use their
+            # representation instead
+            try:
+                hash(value)
+            except TypeError:
+                value = repr(value)
+
+            geometry_key.append((attr, value))
+
+        return tuple(geometry_key)
+
+    def _translate_feature(self, as_frame = False):
         """Translate the feature to the proper (x, y) location on the surface.
 
-        Return a pandas data frame of the x and y coordinates necessary for
-        plotting the feature in the correct location on the surface.
+        Return an array of the x and y coordinates necessary for plotting the
+        feature in the correct location on the surface. The coordinates are
+        cached after they are first computed, and are only recomputed if one of
+        the feature's attributes changes
 
         Parameters
         ----------
-        None passed, but utilizes the data frame returned by the
-        _get_centered_feature() method
+        as_frame : bool (default: False)
+            Whether to return the coordinates as a pandas data frame with
+            columns x and y rather than as an array
+
+        Returns
+        -------
+        feature_pts : numpy.ndarray or pandas.DataFrame
+            An (N, 2) array (or a data frame, if as_frame is True) containing
+            the feature's x and y coordinates in the correct location on the
+            surface. The array is the cached, read-only array itself (which
+            may be shared with other surfaces or memory-mapped from the
+            geometry cache), so it must be copied before it's modified
+        """
+        # If the feature's geometry hasn't changed since it was last
+        # translated, use the cached coordinates. Otherwise, start by getting
+        # the coordinates of the feature as if it were centered around the
+        # point (0, 0) through using the _get_centered_feature() method
+        geometry_key = self._geometry_key()
+        geometry_cache = getattr(self, '_geometry_cache', None)
+
+        if geometry_cache is not None and geometry_cache[0] == geometry_key:
+            feature_pts = geometry_cache[1]
+
+        else:
+            with _profiling.stage(self, 'geometry'):
+                feature_pts = np.array(
+                    self._get_centered_feature(),
+                    dtype = np.float64
+                ).reshape(-1, 2)
+
+            # Then, reflect and shift all values as appropriate
+            with _profiling.stage(self, 'translate'):
+                feature_pts[:, 0] *= self.x_reflection
+                feature_pts[:, 0] += self.x_anchor
+                feature_pts[:, 1] *= self.y_reflection
+                feature_pts[:, 1] += self.y_anchor
+
+            # Cache the translated coordinates. The cached array is never
+            # modified, so it is made read-only
+            feature_pts.setflags(write = False)
+            self._geometry_cache = (geometry_key, feature_pts)
+
+        if as_frame:
+            import pandas as pd
+
+            return pd.DataFrame({
+                'x': feature_pts[:, 0],
+                'y': feature_pts[:, 1]
+            })
+
+        return feature_pts
+
+    def contains(self, x, y):
+        """Determine which points lie inside of the feature.
+
+        By default, this tests the points against the polygon that forms the
+        feature. Features with simple shapes (such as the constraints of each
+        surface) override this with an analytic test, which is much faster
+
+        Parameters
+        ----------
+        x : float or array-like
+            The x coordinate(s) of the points, in the surface's coordinate
+            system before any shift or rotation is applied
+
+        y : float or array-like
+            The y coordinate(s) of the points, in the surface's coordinate
+            system before any shift or rotation is applied
 
         Returns
         -------
-        feature_df: pandas.DataFrame
-            The data frame containing the feature's x and y coordinates in the
-            correct location on the surface.
+        is_inside : numpy.ndarray
+            A boolean array that is True for the points that lie inside of (or
+            on the boundary of) the feature. Points with a missing coordinate
+            are never inside of the feature
         """
-        # Start by getting the coordinates of the feature as if it were
-        # centered around the point (0, 0) through using the
-        # _get_centered_feature() method
-        feature_df = self._get_centered_feature()
+        from matplotlib.path import Path
+
+        points = np.column_stack((
+            np.ravel(np.asarray(x, dtype = np.float64)),
+            np.ravel(np.asarray(y, dtype = np.float64))
+        ))
 
-        # Then, reflect and shift all values as appropriate
-        feature_df['x'] = (feature_df['x'] * self.x_reflection) + self.x_anchor
-        feature_df['y'] = (feature_df['y'] * self.y_reflection) + self.y_anchor
+        feature_path = Path(self._translate_feature())
 
-        return feature_df
+        return feature_path.contains_points(points)
 
     def create_feature_mpl_polygon(self):
         """Generate a matplotlib.Polygon object that will display the feature.
 
         Parameters
         ----------
-        None passed, but uses the numpy ndarrays returned by the
+        None passed, but uses the numpy ndarray returned by the
         self._translate_feature() method
 
         Returns
@@ -151,12 +263,14 @@ class BaseFeature(ABC):
             An object from matplotlib's Polygon class that contains the polygon
             that represents the desired feature
         """
-        # Get the polygon's data frame
-        feature_df = self._translate_feature()
+        from matplotlib.patches import Polygon
+
+        # Get the polygon's coordinates
+        feature_pts = self._translate_feature()
 
         # Create a matplotlib.Polygon object that composes the feature
-        feature_polygon = plt.Polygon(
-            feature_df,
+        feature_polygon = Polygon(
+            feature_pts,
             visible = self.visible,
             **self.plot_kwargs
         )
@@ -164,9 +278,100 @@ class BaseFeature(ABC):
         return feature_polygon
 
     @staticmethod
-    def create_circle(center = (0.0, 0.0), npoints = 10000, r = 1.0,
+    def create_points(x = (), y = ()):
+        """Generate an array of points from their x and y coordinates.
+
+        This is the building block of every feature's coordinates. A scalar
+        passed as one of the coordinates is repeated for each of the points
+
+        Parameters
+        ----------
+        x : float or iterable (default: ())
+            The x coordinates of the points
+
+        y : float or iterable (default: ())
+            The y coordinates of the points
+
+        Returns
+        -------
+        pts : numpy.ndarray
+            An (N, 2) array containing the points' x and y coordinates
+        """
+        x, y = np.broadcast_arrays(
+            np.asarray(x, dtype = np.float64).ravel(),
+            np.asarray(y, dtype = np.float64).ravel()
+        )
+
+        pts = np.empty((len(x), 2))
+        pts[:, 0] = x
+        pts[:, 1] = y
+
+        return pts
+
+    @staticmethod
+    def get_arc_npoints(r = 1.0, start = 0.0, end = 2.0, tolerance = None):
+        """Determine how many points are needed to trace an arc.
+
+        The number of points is chosen so that the largest distance between
+        the arc and the chords connecting its consecutive points (the chord
+        error, or sagitta) does not exceed the supplied tolerance. For an arc
+        of radius r traced in steps of angle dtheta, this error is
+        r * (1 - cos(dtheta / 2)), so dtheta = 2 * arccos(1 - tolerance / r)
+
+        Parameters
+        ----------
+        r : float (default: 1.0)
+            Radius of the arc IN THE UNITS OF THE SURFACE
+
+        start : float (default: 0.0)
+            The angle (in radians / pi) at which the arc starts
+
+        end : float (default: 2.0)
+            The angle (in radians / pi) at which the arc ends
+
+        tolerance : float or None (default: None)
+            The maximum allowable chord error IN THE UNITS OF THE SURFACE. If
+            None, this will be 0.1% of the arc's radius
+
+        Returns
+        -------
+        npoints : int
+            The number of points with which to trace the arc. This is never
+            fewer than 3, so that the arc keeps its midpoint
+
+        Raises
+        ------
+        ValueError
+            If the tolerance is not a positive number
+        """
+        if tolerance is not None and not tolerance > 0.0:
+            raise ValueError(
+                f'The arc tolerance must be a positive number, not {tolerance}'
+            )
+
+        # Get the radius and the angle (in radians) through which the arc is
+        # traced
+        r = abs(r)
+        sweep = abs(end - start) * np.pi
+
+        # A degenerate arc only needs its endpoints and midpoint
+        if r == 0.0 or sweep == 0.0:
+            return 3
+
+        # If no tolerance is supplied, default to 0.1% of the radius
+        if tolerance is None:
+            tolerance = r / 1000.0
+
+        # Find the largest angular step that keeps the chord error within the
+        # tolerance. Once the tolerance reaches the radius, every step up to
+        # a half-turn is acceptable
+        step = 2.0 * np.arccos(1.0 - min(tolerance / r, 1.0))
+
+        return max(int(np.ceil(sweep / step)), 2) + 1
+
+    def create_circle(self, center = (0.0, 0.0), npoints = None, r = 1.0,
                       start = 0.0, end = 2.0):
-        """Generate a data frame that contains the points that form a circle.
+        """Generate an array that contains the points that form a circle.
 
         This function generates a set of x and y coordinates that form a circle
         (or the arc of a circle)
@@ -176,9 +381,11 @@ class BaseFeature(ABC):
         center : tuple (float, float) (default: (0.0, 0.0))
             The (x, y) coordinates of the center of the circle
 
-        npoints : int (default: 1000)
+        npoints : int or None (default: None)
             The number of points with which to create the circle. This will
-            also be the length of the resulting data frame
+            also be the length of the resulting array. If None, the number
+            of points is determined by the feature's arc_tolerance attribute.
+            See get_arc_npoints() for more information
 
         r : float (default: 1.0)
             Radius of the circle IN THE UNITS OF THE SURFACE
@@ -193,10 +400,20 @@ class BaseFeature(ABC):
 
         Returns
         -------
-        circle_pts : pandas.DataFrame
-            A pandas data frame containing the necessary x and y coordinates
-            for a circle
+        circle_pts : numpy.ndarray
+            An (N, 2) array containing the necessary x and y coordinates for a
+            circle
         """
+        # If the number of points isn't specified, use as few as possible while
+        # keeping the arc within the feature's tolerance
+        if npoints is None:
+            npoints = self.get_arc_npoints(
+                r = r,
+                start = start,
+                end = end,
+                tolerance = self.arc_tolerance
+            )
+
         # Create a vector of numbers that are evenly spaced apart between the
         # starting and ending angles. They should be multiplied by pi to be in
         # radians. This vector represents the angle through which the circle is
@@ -210,10 +427,7 @@ class BaseFeature(ABC):
         x = center[0] + (r * np.cos(theta))
         y = center[1] + (r * np.sin(theta))
 
-        circle_pts = pd.DataFrame({
-            'x': x,
-            'y': y
-        })
+        circle_pts = np.column_stack((x, y))
 
         return circle_pts
 
@@ -221,7 +435,7 @@ class BaseFeature(ABC):
     def create_rectangle(x_min = 0.0, x_max = 0.0, y_min = 0.0, y_max = 0.0):
         """Generate a bounding box for a rectangle.
 
-        This method generates a data frame that contains the coordinates
+        This method generates an array that contains the coordinates
         forming the bounding box of a rectangle
 
         Parameters
@@ -240,9 +454,9 @@ class BaseFeature(ABC):
 
         Returns
         -------
-        rect_pts : pandas.DataFrame
-            A pandas data frame containing the necessary x and y coordinates
-            for a rectangle
+        rect_pts : numpy.ndarray
+            An (N, 2) array containing the necessary x and y coordinates for
+            a rectangle
         """
         # A rectangle's bounding box is described by going along the following
         # path:
@@ -253,8 +467,8 @@ class BaseFeature(ABC):
         # (x_min, y_min)
         #
         # This is the same path that a rectangle will follow
-        rect_pts = pd.DataFrame({
-            'x': [
+        rect_pts = BaseFeature.create_points(
+            x = [
                 x_min,
                 x_max,
                 x_max,
@@ -262,14 +476,14 @@ class BaseFeature(ABC):
                 x_min
             ],
 
-            'y': [
+            y = [
                 y_min,
                 y_min,
                 y_max,
                 y_max,
                 y_min
             ]
-        })
+        )
 
         return rect_pts
 
@@ -277,7 +491,7 @@ class BaseFeature(ABC):
     def create_square(side_length = 1.0, center = (0, 0)):
         """Generate a bound box for a square.
 
-        This function generates a data frame that contains the coordinates
+        This function generates an array that contains the coordinates
         forming the bounding box of a square
 
         Parameters
@@ -290,9 +504,9 @@ class BaseFeature(ABC):
 
         Returns
         -------
-        square_pts : pandas.DataFrame
-            A pandas data frame containing the necessary x and y coordinates
-            for a square
+        square_pts : numpy.ndarray
+            An (N, 2) array containing the necessary x and y coordinates for
+            a square
         """
         # A unit square centered at (0, 0) can have its boundary described as
         # the path traced by the following:
@@ -304,8 +518,8 @@ class BaseFeature(ABC):
         #
         # This is the same path that a generated square will follow, with the
         # side lengths variable
-        square_pts = pd.DataFrame({
-            'x': [
+        square_pts = BaseFeature.create_points(
+            x = [
                 center[0] - side_length / 2,
                 center[0] + side_length / 2,
                 center[0] + side_length / 2,
@@ -313,14 +527,14 @@ class BaseFeature(ABC):
                 center[0] - side_length / 2
             ],
 
-            'y': [
+            y = [
                 center[1] - side_length / 2,
                 center[1] - side_length / 2,
                 center[1] + side_length / 2,
                 center[1] + side_length / 2,
                 center[1] - side_length / 2,
             ]
-        })
+        )
 
         return square_pts
 
@@ -328,7 +542,7 @@ class BaseFeature(ABC):
     def create_diamond(height = 0.0, width = 0.0, center = (0.0, 0.0)):
         """Generate a bound box for a diamond.
 
-        This function generates a data frame that contains the coordinates
+        This function generates an array that contains the coordinates
         forming the bounding box of a diamond
 
         Parameters
@@ -344,9 +558,9 @@ class BaseFeature(ABC):
 
         Returns
         -------
-        diamond_pts : pandas.DataFrame
-            A pandas data frame containing the necessary x and y coordinates
-            for a diamond
+        diamond_pts : numpy.ndarray
+            An (N, 2) array containing the necessary x and y coordinates for
+            a diamond
         """
         # A unit diamond's bounding box is described by going along the
         # following path:
@@ -358,8 +572,8 @@ class BaseFeature(ABC):
         #
         # This is the path that a diamond feature will also trace, with the
         # appropriate height and width
-        diamond_pts = pd.DataFrame({
-            'x': [
+        diamond_pts = BaseFeature.create_points(
+            x = [
                 center[0] - width / 2,
                 center[0],
                 center[0] + width / 2,
@@ -367,14 +581,14 @@ class BaseFeature(ABC):
                 center[0] - width / 2
             ],
 
-            'y': [
+            y = [
                 center[1],
                 center[1] - height / 2,
                 center[1],
                 center[1] + height / 2,
                 center[1]
             ]
-        })
+        )
 
         return diamond_pts
 
@@ -399,13 +613,13 @@ class BaseFeature(ABC):
             transform = ax.transData
 
         # Get the feature's matplotlib.Polygon
-        patch = self.create_feature_mpl_polygon()
+        with _profiling.stage(self, 'polygon'):
+            patch = self.create_feature_mpl_polygon()
 
-        # Add the patch to the Axes object
-        patch = ax.add_patch(patch)
-
-        # Set the transformation of the patch
-        patch.set_transform(transform)
+        # Add the patch to the Axes object, and set its transformation
+        with _profiling.stage(self, 'add_patch'):
+            patch = ax.add_patch(patch)
+            patch.set_transform(transform)
 
         return patch
 
@@ -460,6 +674,8 @@ class TeamLogo(BaseFeature):
         if not self.visible:
             return None
 
+        import matplotlib.pyplot as plt
+
         if transform is None:
             transform = ax.transData
 
@@ -3,12 +3,282 @@
 @author: Ross Drucker
 """
 
+import copy
+import math
+import threading
 import numpy as np
-import matplotlib.pyplot as plt
-from abc import ABC, abstractmethod
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from sportypy._base_classes import _profiling, _disk_cache
 
 
-class BaseSurface(ABC):
+# The fully-built surfaces that new surfaces are cloned from. These are keyed by
+# the surface's class and the parameters used to create it, and are evicted in
+# least-recently-used order once the cache reaches its maximum size
+_surface_templates = OrderedDict()
+_surface_templates_lock = threading.Lock()
+_surface_templates_maxsize = 32
+
+# The number of coordinates that convert_xy() transforms at a time when the
+# surface is rotated
+_convert_block_size = 65536
+
+
+def set_surface_cache_size(maxsize):
+    """Set the maximum number of surface templates to keep in the cache.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of distinct surfaces to cache. A value of 0
+        disables the cache, so that every surface is built from scratch
+
+    Returns
+    -------
+    Nothing, but the least-recently-used templates are evicted if the cache
+    holds more than maxsize templates
+    """
+    global _surface_templates_maxsize
+
+    with _surface_templates_lock:
+        _surface_templates_maxsize = max(int(maxsize), 0)
+
+        while len(_surface_templates) > _surface_templates_maxsize:
+            _surface_templates.popitem(last = False)
+
+
+def clear_surface_cache():
+    """Remove all surface templates from the cache."""
+    with _surface_templates_lock:
+        _surface_templates.clear()
+
+
+# The plotting arguments that a feature may have and still be drawn as part of a
+# PolyCollection. Colors may vary within a collection, but the rest of these
+# must be the same for every feature in it
+_batched_color_kwargs = ('facecolor', 'fc', 'edgecolor', 'ec', 'color')
+_batched_style_kwargs = (
+    'zorder', 'linewidth', 'lw', 'linestyle', 'ls', 'alpha', 'antialiased',
+    'aa', 'hatch', 'joinstyle', 'capstyle'
+)
+
+
+def _freeze(value):
+    """Convert a parameter into a hashable value for use in a cache key.
+
+    Parameters
+    ----------
+    value : object
+        The parameter to convert. Dictionaries, lists, tuples, and sets are
+        converted recursively
+
+    Returns
+    -------
+    frozen : object
+        A hashable equivalent of the parameter
+
+    Raises
+    ------
+    TypeError
+        If the parameter (or any of its elements) isn't hashable
+    """
+    if isinstance(value, dict):
+        return (
+            dict,
+            tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+        )
+
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+
+    if isinstance(value, (set, frozenset)):
+        return (frozenset, frozenset(_freeze(v) for v in value))
+
+    hash(value)
+
+    return value
+
+
+class _Rotation:
+    """The rotation of a surface about its center.
+
+    This provides the parts of matplotlib's Affine2D that a surface uses, so
+    that matplotlib only needs to be imported once the surface is drawn.
+    Adding a matplotlib transform to a rotation (e.g. rotation + ax.transData)
+    gives the equivalent matplotlib transform
+
+    Parameters
+    ----------
+    matrix : numpy.ndarray or None (default: None)
+        The 3x3 affine transformation matrix of the rotation. If None, the
+        rotation is the identity
+    """
+
+    def __init__(self, matrix = None):
+        if matrix is None:
+            self._mtx = np.identity(3)
+        else:
+            self._mtx = np.array(matrix, dtype = np.float64)
+
+    def rotate_deg(self, degrees):
+        """Add a rotation (in degrees) to the transformation.
+
+        Parameters
+        ----------
+        degrees : float
+            The angle through which to rotate, counterclockwise
+
+        Returns
+        -------
+        self : _Rotation
+            The rotation, so that calls may be chained
+        """
+        theta = math.radians(degrees)
+        a = math.cos(theta)
+        b = math.sin(theta)
+
+        # This matches the arithmetic of matplotlib's Affine2D.rotate()
+        (xx, xy, x0), (yx, yy, y0), _ = self._mtx.tolist()
+        self._mtx[0] = [a * xx - b * yx, a * xy - b * yy, a * x0 - b * y0]
+        self._mtx[1] = [b * xx + a * yx, b * xy + a * yy, b * x0 + a * y0]
+
+        return self
+
+    def get_matrix(self):
+        """Get the 3x3 affine transformation matrix of the rotation."""
+        return self._mtx
+
+    def transform(self, values):
+        """Apply the rotation to an (N, 2) array of points.
+
+        Parameters
+        ----------
+        values : array-like
+            The points to rotate
+
+        Returns
+        -------
+        rotated : numpy.ndarray
+            The rotated points
+        """
+        values = np.asarray(values, dtype = np.float64)
+
+        return (values @ self._mtx[:2, :2].T) + self._mtx[:2, 2]
+
+    def to_affine(self):
+        """Convert the rotation to a matplotlib Affine2D transform."""
+        from matplotlib.transforms import Affine2D
+
+        return Affine2D(self._mtx.copy())
+
+    def __add__(self, other):
+        return self.to_affine() + other
+
+
+class _FeatureSpec:
+    """The class and parameters of a feature that hasn't been instantiated.
+
+    Surfaces store their features this way when they are created, and only
+    instantiate them the first time that they're needed
+    """
+
+    __slots__ = ('feature_class', 'params')
+
+    def __init__(self, feature_class, params):
+        self.feature_class = feature_class
+        self.params = params
+
+    def build(self):
+        """Instantiate the feature.
+
+        Returns
+        -------
+        feature : BaseFeature
+            The instantiated feature
+        """
+        return self.feature_class(**self.params)
+
+
+class _FromTemplate:
+    """A placeholder for a feature that is copied from a surface's template.
+
+    The feature is copied the first time that it's needed. This is a class
+    rather than an instance so that it is still recognized after a surface is
+    pickled
+    """
+
+
+def _clone_feature(feature):
+    """Copy a feature, sharing its cached geometry.
+
+    Parameters
+    ----------
+    feature : BaseFeature
+        The feature to copy
+
+    Returns
+    -------
+    feature_clone : BaseFeature
+        A copy of the feature that shares the original's cached coordinates
+    """
+    feature_clone = copy.copy(feature)
+    feature_clone.plot_kwargs = dict(feature.plot_kwargs)
+
+    return feature_clone
+
+
+class _SurfaceMeta(ABCMeta):
+    """Metaclass that builds each distinct surface only once per process.
+
+    The first time a surface is created with a given set of parameters, it is
+    built and kept as a template. Every surface, including the first, is
+    returned as a clone of its template. The template's features (and their
+    geometry) are only built the first time any of its clones needs them, and
+    are then shared by every clone, which shares none of the template's
+    mutable state
+    """
+
+    def __call__(cls, *args, **kwargs):
+        # Build the surface directly if the cache is disabled or if any
+        # parameter can't be used in a cache key
+        try:
+            surface_key = (
+                cls,
+                _freeze(args),
+                _freeze(kwargs),
+                _freeze(cls._get_cache_token(*args, **kwargs))
+            )
+        except TypeError:
+            surface_key = None
+
+        if surface_key is None or not _surface_templates_maxsize:
+            surface = super().__call__(*args, **kwargs)
+            surface._surface_key = None
+
+            return surface
+
+        with _surface_templates_lock:
+            template = _surface_templates.get(surface_key)
+
+            if template is not None:
+                _surface_templates.move_to_end(surface_key)
+
+        if template is None:
+            # Build the template and compute the geometry of all of its
+            # features so that the clones can share it
+            template = super().__call__(*args, **kwargs)
+            template._surface_key = surface_key
+
+            with _surface_templates_lock:
+                _surface_templates[surface_key] = template
+
+                while len(_surface_templates) > _surface_templates_maxsize:
+                    _surface_templates.popitem(last = False)
+
+        return template._clone()
+
+
+class BaseSurface(metaclass = _SurfaceMeta):
     """Abstract base class for plotting any sports surface.
 
     This class is not meant to be used directly, as it will be extended by each
@@ -33,8 +303,8 @@ class BaseSurface(ABC):
         the plot, however this behavior may be overridden by a user supplying
         their own units
 
-    _rotation : float or None (default: None)
-        The angle through which the plot will be rotated. This should be passed
+    _rotation : _Rotation or None (default: None)
+        The rotation applied to the plot. This is created from an angle passed
         in degrees, not radians
 
     _feature_xlim : float or None (default: None)
@@ -49,11 +319,22 @@ class BaseSurface(ABC):
 
     _features : list
         The instantiated feature objects that comprise the surface. These are
-        the features that get plotted
+        the features that get plotted. They are instantiated from
+        self._feature_specs the first time they are needed
+
+    _feature_specs : list
+        The classes and parameters of the surface's features, as stored by the
+        _initialize_feature() method
+
+    _surface_key : tuple or None (default: None)
+        The key under which the surface's template is cached. This is made up
+        of the surface's class and the parameters used to create it, and is
+        None if the surface wasn't cached
 
     _surface_constraint : object or None (default: None)
         A class object that constrains the plotting region to be inside of the
-        playing surface
+        playing surface. Like the surface's features, this is instantiated the
+        first time it is needed
 
     _display_ranges : dict or None (default: None)
         A dictionary that stores the display ranges that are available for a
@@ -62,6 +343,16 @@ class BaseSurface(ABC):
         that are themselves a dictionary of x limits, y limits, and a brief
         description of what each display range corresponds to. This will be
         created by the surface class' _get_display_ranges_dict() method
+
+    arc_tolerance : float or None (default: None)
+        The maximum allowable distance (in the units of the surface) between
+        the arcs of the surface's features and the chords used to draw them.
+        This is passed to each feature when it is initialized
+
+    last_draw_profile : DrawProfile
+        The time taken by each of the surface's features during the most
+        recent call to draw(). This is only set once profiling has been
+        enabled with the enable_profiling() method
     """
 
     def __init__(self):
@@ -87,8 +378,9 @@ class BaseSurface(ABC):
         self._feature_ylim = None
 
         # Initialize an empty list to contain a surface's features. This list
-        # will be appended to by the _initialize_feature() method below
-        self._features = []
+        # will be appended to by the _initialize_feature() method below, and
+        # the features will be instantiated when they are first needed
+        self._feature_specs = []
 
         # Initialize a constraint on the surface. For example, don't allow any
         # plots or features to extend beyond the boards in a hockey rink
@@ -98,6 +390,36 @@ class BaseSurface(ABC):
         # be set by each surface's _get_display_range_dict() method
         self._display_ranges = None
 
+        # Initialize the key of the surface in the template cache. This will
+        # be set if the surface is cached when it is created
+        self._surface_key = None
+
+        # Initialize the tolerance used to trace the arcs of the surface's
+        # features. This will be set by each surface's _get_arc_tolerance()
+        # method
+        self.arc_tolerance = None
+
+    @classmethod
+    def _get_cache_token(cls, *args, **kwargs):
+        """Get anything other than its parameters that a surface depends on.
+
+        The token is added to the key under which the surface's template is
+        cached, so a surface that is built from something that may change
+        (such as a file) is rebuilt once it does
+
+        Parameters
+        ----------
+        *args, **kwargs
+            The parameters used to create the surface
+
+        Returns
+        -------
+        token : object
+            A hashable token. By default, surfaces depend only on their
+            parameters, so this is None
+        """
+        return None
+
     @staticmethod
     def copy_(param):
         """Copy what's passed in (if possible).
@@ -126,13 +448,180 @@ class BaseSurface(ABC):
 
         return param
 
+    @property
+    def _features(self):
+        """The surface's features, instantiated when they are first needed."""
+        features = self.__dict__.get('_built_features')
+
+        if features is None:
+            template = self.__dict__.get('_template')
+
+            with _profiling.stage(None, 'instantiate'):
+                features = []
+
+                if template is not None:
+                    features = [
+                        _clone_feature(feature)
+                        for feature in template._get_template_features()
+                    ]
+
+                # Features added to a copy of a template after it was created
+                # follow the template's
+                features += [
+                    spec.build()
+                    for spec in self.__dict__.get('_feature_specs', [])
+                ]
+
+            self._built_features = features
+
+        return features
+
+    @_features.setter
+    def _features(self, features):
+        self._feature_specs = []
+        self._built_features = list(features)
+
+    @property
+    def _surface_constraint(self):
+        """The surface's constraint, instantiated when it is first needed."""
+        constraint = self.__dict__.get('_constraint')
+
+        if constraint is _FromTemplate:
+            with _profiling.stage(None, 'instantiate'):
+                constraint = self._template._surface_constraint
+                constraint._translate_feature()
+                constraint = _clone_feature(constraint)
+
+            self._constraint = constraint
+
+        elif isinstance(constraint, _FeatureSpec):
+            with _profiling.stage(None, 'instantiate'):
+                constraint = constraint.build()
+
+            self._constraint = constraint
+
+        return constraint
+
+    @_surface_constraint.setter
+    def _surface_constraint(self, constraint):
+        self._constraint = constraint
+
+    def _get_template_features(self):
+        """Get the features of a template, with their geometry computed.
+
+        Computing the geometry before the features are copied means that
+        every copy shares it
+
+        Returns
+        -------
+        features : list
+            The surface's features
+        """
+        if not self.__dict__.get('_template_features_translated', False):
+            surface_key = self.__dict__.get('_surface_key')
+
+            if surface_key is not None and _disk_cache.get_cache_dir():
+                self._use_disk_cache(surface_key)
+
+            else:
+                for feature in self._features:
+                    feature._translate_feature()
+
+            self._template_features_translated = True
+
+        return self._features
+
+    def _use_disk_cache(self, surface_key):
+        """Load the geometry of a template from the disk cache.
+
+        If the geometry isn't cached yet, it's computed and written to the
+        cache for other processes to use
+
+        Parameters
+        ----------
+        surface_key : tuple
+            The key under which the template is cached
+
+        Returns
+        -------
+        Nothing, but the cached coordinates of the surface's features (and
+        its constraint) are set
+        """
+        features = self._get_all_features()
+        arrays = _disk_cache.load_geometry(surface_key)
+
+        if arrays is None or len(arrays) != len(features):
+            _disk_cache.store_geometry(
+                surface_key,
+                [feature._translate_feature() for feature in features]
+            )
+
+            return
+
+        # Each feature's coordinates are a read-only view of the memory-mapped
+        # file, so none of them are computed or read until they're used
+        for feature, feature_pts in zip(features, arrays):
+            feature._geometry_cache = (feature._geometry_key(), feature_pts)
+
+    def _get_all_features(self):
+        """Get all of the surface's features, including its constraint.
+
+        Returns
+        -------
+        features : list
+            The surface's features, followed by its constraint (if it has one)
+        """
+        features = list(getattr(self, '_features', []))
+
+        if getattr(self, '_surface_constraint', None) is not None:
+            features.append(self._surface_constraint)
+
+        return features
+
+    def _clone(self):
+        """Create a copy of the surface that shares its features' geometry.
+
+        The features' cached coordinates are never modified in place, so they
+        can be shared safely. Everything else that may be modified after the
+        surface is created (its rotation, dictionaries and lists of
+        parameters, the features themselves and their plotting arguments) is
+        copied so that the clone can't affect the original
+
+        Returns
+        -------
+        clone : BaseSurface
+            The copy of the surface
+        """
+        clone = copy.copy(self)
+
+        # Copy any mutable attributes of the surface
+        for attr, value in vars(self).items():
+            if isinstance(value, (dict, list)):
+                setattr(clone, attr, copy.copy(value))
+
+        # The clone copies the features (but not their cached geometry) from
+        # the surface the first time that they're needed
+        clone._built_features = None
+        clone._feature_specs = []
+        clone._template = self
+
+        if self.__dict__.get('_constraint') is not None:
+            clone._constraint = _FromTemplate
+
+        # Copy the rotation of the surface
+        if getattr(self, '_rotation', None) is not None:
+            clone._rotation = _Rotation(self._rotation.get_matrix())
+
+        return clone
+
     def _initialize_feature(self, params):
         """Initialize a feature on the surface at its required coordinates.
 
         Each feature is parameterized in its own class method, but is
-        instantiated by this method in the surface's __init__() method. This
-        method appends the instance of the feature to the surface class'
-        self._features attribute.
+        initialized by this method in the surface's __init__() method. This
+        method appends the feature's class and parameters to the surface
+        class' self._feature_specs attribute, and the feature is instantiated
+        the first time the surface's self._features attribute is used.
 
         Parameters
         ----------
@@ -142,13 +631,17 @@ class BaseSurface(ABC):
 
         Returns
         -------
-        Nothing, but it does instantiate a feature and append it to the
-        surface class' self._features attribute
+        Nothing, but it does append the feature to the surface class'
+        self._feature_specs attribute
         """
         # Get the feature's class. This will be instantiated later, but removed
         # from the feature's parameter dictionary now
         feature_class = params.pop('class')
 
+        # Trace the feature's arcs with the surface's tolerance unless the
+        # feature specifies its own
+        params.setdefault('arc_tolerance', self.arc_tolerance)
+
         # Get the coordinates of the feature's center in the final plot. If
         # none exist, set the default to be 0. These will be numpy ndarrays
         center_of_feature_x = np.ravel(params.get('x_anchor', [0]))
@@ -196,9 +689,228 @@ class BaseSurface(ABC):
                         feature_params['reflect_x'] = x_reflection
                         feature_params['reflect_y'] = y_reflection
 
-                        # Instantiate the feature and append it to the
-                        # surface's self._features attribute
-                        self._features.append(feature_class(**feature_params))
+                        # Store the feature so that it can be instantiated
+                        # when it's first needed. If the surface's features
+                        # have already been instantiated, instantiate it now
+                        spec = _FeatureSpec(feature_class, feature_params)
+
+                        # A copy of a template that gains features of its own
+                        # no longer matches the template, so nothing cached
+                        # under the template's key may be used for it
+                        if self.__dict__.get('_template') is not None:
+                            self._surface_key = None
+
+                        if self.__dict__.get('_built_features') is not None:
+                            self._built_features.append(spec.build())
+
+                        else:
+                            self._feature_specs.append(spec)
+
+    def enable_profiling(self, callback = None):
+        """Record the time taken by each feature whenever the surface is drawn.
+
+        Once enabled, each call to the surface's draw() method stores a
+        DrawProfile as the surface's last_draw_profile attribute. The profile
+        gives the time each feature spent computing its geometry, translating
+        it, creating its Polygon, and being added to the Axes, along with its
+        number of vertices
+
+        Parameters
+        ----------
+        callback : callable or None (default: None)
+            A function to call with the DrawProfile after each call to draw(),
+            such as one that sends the profile's to_dict() to a metrics system
+
+        Returns
+        -------
+        Nothing, but profiling is enabled
+        """
+        self._draw_profiling = {'callback': callback}
+
+    def disable_profiling(self):
+        """Stop recording the time taken to draw the surface.
+
+        Returns
+        -------
+        Nothing, but profiling is disabled. The surface's last_draw_profile
+        attribute is kept
+        """
+        self._draw_profiling = None
+
+    def _draw_features_batched(self, ax, transform):
+        """Draw the surface's features using as few artists as possible.
+
+        Rather than adding each feature to the Axes as its own Polygon, the
+        visible features are grouped into matplotlib PolyCollections. The
+        features are ordered by their zorder (keeping the order in which they
+        were initialized among features with the same zorder, which is how
+        matplotlib orders the patches), and each run of consecutive features
+        that share all of their plotting arguments except for their colors
+        becomes a single collection. The features are therefore layered
+        exactly as they would be if they were drawn individually
+
+        Features that draw themselves differently (such as logos) or that
+        have plotting arguments that a PolyCollection doesn't support are
+        still drawn individually
+
+        Parameters
+        ----------
+        ax : matplotlib.Axes
+            Axes onto which the features should be drawn
+
+        transform : matplotlib.Transform
+            The transformation to apply to the features
+
+        Returns
+        -------
+        artists : list
+            The collections (and any individually-drawn patches) added to the
+            Axes object
+        """
+        import matplotlib as mpl
+        from matplotlib.collections import PolyCollection
+        from sportypy._base_classes._base_feature import BaseFeature
+
+        # Order the visible features as matplotlib would when drawing them as
+        # individual patches
+        features = sorted(
+            [f for f in self._features if getattr(f, 'visible', True)],
+            key = lambda f: f.plot_kwargs.get('zorder', 1)
+        )
+
+        artists = []
+        run = []
+        run_style = None
+
+        def draw_run():
+            # Combine the current run of features into a single collection
+            if not run:
+                return
+
+            facecolors = []
+            edgecolors = []
+            for feature in run:
+                kwargs = feature.plot_kwargs
+                color = kwargs.get('color')
+                facecolors.append(kwargs.get(
+                    'facecolor',
+                    kwargs.get('fc', color or mpl.rcParams['patch.facecolor'])
+                ))
+                edgecolors.append(kwargs.get(
+                    'edgecolor',
+                    kwargs.get('ec', color or 'none')
+                ))
+
+            verts = [feature._translate_feature() for feature in run]
+
+            with _profiling.stage(None, 'collection'):
+                collection = PolyCollection(
+                    verts,
+                    closed = True,
+                    facecolors = facecolors,
+                    edgecolors = edgecolors,
+                    transform = transform,
+                    **dict(run_style)
+                )
+
+                artists.append(ax.add_collection(collection))
+
+            run.clear()
+
+        for feature in features:
+            kwargs = feature.plot_kwargs
+            is_batchable = type(feature).draw is BaseFeature.draw and all(
+                k in _batched_color_kwargs or k in _batched_style_kwargs
+                for k in kwargs
+            )
+
+            # Features that can't be batched end the current run and are
+            # drawn by themselves
+            if not is_batchable:
+                draw_run()
+                artists.append(feature.draw(ax, transform))
+                continue
+
+            # The style of the feature is everything except its colors. A
+            # change in style starts a new run
+            style = tuple(sorted(
+                (k, v) for k, v in kwargs.items()
+                if k in _batched_style_kwargs
+            ))
+
+            if style != run_style:
+                draw_run()
+                run_style = style
+
+            run.append(feature)
+
+        draw_run()
+
+        return artists
+
+    def _get_arc_tolerance(self, arc_tolerance = None, dpi = None,
+                           figure_width = 50.0):
+        """Get the tolerance with which to trace the arcs of the features.
+
+        The tolerance is the maximum allowable distance between an arc and the
+        chords used to draw it. It may be supplied directly in the units of
+        the surface, or derived from the resolution at which the surface will
+        be rendered. In the latter case, the tolerance is half of the width of
+        a pixel when the full surface spans the width of the figure, which
+        keeps every arc's chord error below what can be displayed
+
+        Parameters
+        ----------
+        arc_tolerance : float or None (default: None)
+            The maximum allowable chord error IN THE UNITS OF THE SURFACE. If
+            supplied, this takes precedence over dpi
+
+        dpi : float or None (default: None)
+            The resolution (in dots per inch) of the rendered surface
+
+        figure_width : float (default: 50.0)
+            The width (in inches) of the figure onto which the surface will be
+            rendered. This defaults to the size of the figure created by each
+            surface's draw() method
+
+        Returns
+        -------
+        arc_tolerance : float or None
+            The chord error tolerance IN THE UNITS OF THE SURFACE, or None if
+            neither arc_tolerance nor dpi is supplied
+
+        Raises
+        ------
+        ValueError
+            If arc_tolerance or dpi is supplied but is not a positive number
+        """
+        # A directly-supplied tolerance is used as-is
+        if arc_tolerance is not None:
+            if not arc_tolerance > 0.0:
+                raise ValueError(
+                    'arc_tolerance must be a positive number, not ' +
+                    f'{arc_tolerance}'
+                )
+
+            return arc_tolerance
+
+        # Without a tolerance or a resolution, leave it to each feature to
+        # determine its own tolerance
+        if dpi is None:
+            return None
+
+        if not dpi > 0.0:
+            raise ValueError(f'dpi must be a positive number, not {dpi}')
+
+        # Find the largest extent of the full surface, as this is what will
+        # span the width of the figure
+        xlim, ylim = self._get_plot_range_limits('full')
+        surface_extent = max(xlim[1] - xlim[0], ylim[1] - ylim[0])
+
+        # The width of a single pixel in the units of the surface
+        pixel_width = surface_extent / (figure_width * dpi)
+
+        return pixel_width / 2.0
 
     def _get_transform(self, ax, transform = None):
         """Get a matplotlib.Transform to apply to the features of the surface.
@@ -225,43 +937,109 @@ class BaseSurface(ABC):
 
         return transform
 
-    def convert_xy(self, x, y):
+    def convert_xy(self, x, y, out = None):
         """Reposition and scale the x and y coordinates.
 
         The x and y coordinates must be moved to the proper position and
-        rescaled to the size used for the final surface plot.
+        rescaled to the size used for the final surface plot. The shift and
+        rotation are applied as a single affine transformation directly to the
+        arrays of coordinates, so this works efficiently on very large inputs
 
         Parameters
         ----------
-        x : float
-            The x coordinate(s)
+        x : float or array-like
+            The x coordinate(s). This may be a pandas Series or any NumPy
+            array (including a memory-mapped array)
+
+        y : float or array-like
+            The y coordinate(s). This may be a pandas Series or any NumPy
+            array (including a memory-mapped array)
 
-        y : float
-            The y coordinate(s)
+        out : tuple (numpy.ndarray, numpy.ndarray) or None (default: None)
+            Arrays into which the converted x and y coordinates should be
+            written. Each must have one element per coordinate, and they may
+            be the x and y arrays themselves. If None, new arrays are created
 
         Returns
         -------
-        x : float
-            The x coordinate(s) adjusted to the proper position and scale
-
-        y : float
-            The y coordinate(s) adjusted to the proper position and scale
+        x : numpy.ndarray
+            The x coordinate(s) adjusted to the proper position and scale.
+            Floating-point coordinates keep their precision, and any other
+            coordinates are converted to float64
+
+        y : numpy.ndarray
+            The y coordinate(s) adjusted to the proper position and scale.
+            Floating-point coordinates keep their precision, and any other
+            coordinates are converted to float64
         """
-        # Copy the features' x and y coordinates so as not to overwrite them
-        x = self.copy_(x)
-        y = self.copy_(y)
+        # Flatten the coordinates without copying them
+        x = np.ravel(np.asarray(x))
+        y = np.ravel(np.asarray(y))
+
+        # Keep the precision of floating-point coordinates
+        if (np.issubdtype(x.dtype, np.floating) and
+                np.issubdtype(y.dtype, np.floating)):
+            dtype = np.result_type(x.dtype, y.dtype)
+        else:
+            dtype = np.float64
+
+        # Get the coefficients of the surface's rotation as Python floats so
+        # that they don't change the precision of the coordinates
+        if self._rotation is not None:
+            matrix = self._rotation.get_matrix()
+            a, b, c = (float(v) for v in matrix[0])
+            d, e, f = (float(v) for v in matrix[1])
+        else:
+            a, b, c = 1.0, 0.0, 0.0
+            d, e, f = 0.0, 1.0, 0.0
+
+        # If the surface isn't rotated, the coordinates only need to be
+        # shifted according to how the final plot should be rendered
+        if a == e == 1.0 and b == d == 0.0:
+            if out is None:
+                out = (None, None)
+
+            x_out = np.subtract(x, self.x_trans - c, out = out[0],
+                                dtype = dtype, casting = 'same_kind')
+            y_out = np.subtract(y, self.y_trans - f, out = out[1],
+                                dtype = dtype, casting = 'same_kind')
+
+            return x_out, y_out
+
+        # Otherwise, fold the shift into the rotation's translation and apply
+        # the transformation
+        x_shift = c - (a * self.x_trans) - (b * self.y_trans)
+        y_shift = f - (d * self.x_trans) - (e * self.y_trans)
+
+        if out is None:
+            out = (
+                np.empty(len(x), dtype = dtype),
+                np.empty(len(y), dtype = dtype)
+            )
+
+        x_out, y_out = out
+
+        # Transform the coordinates one block at a time, so that the only
+        # temporary arrays are the size of a block. Each block of the
+        # coordinates is read before its results are written, so the results
+        # may be written over the coordinates themselves
+        for start in range(0, len(x), _convert_block_size):
+            block = slice(start, start + _convert_block_size)
+            x_block = x[block]
+            y_block = y[block]
+
+            x_new = np.multiply(x_block, a, dtype = dtype)
+            x_new += np.multiply(y_block, b, dtype = dtype)
+            x_new += x_shift
 
-        # Flatten and shift them according to how the final plot should be
-        # rendered
-        x = np.ravel(x) - self.x_trans
-        y = np.ravel(y) - self.y_trans
+            y_new = np.multiply(x_block, d, dtype = dtype)
+            y_new += np.multiply(y_block, e, dtype = dtype)
+            y_new += y_shift
 
-        # If the surface's plot needs to be rotated, perform the rotation
-        if self._rotation:
-            xy = self._rotation.transform(tuple(zip(x, y)))
-            x, y = xy[:, 0], xy[:, 1]
+            np.copyto(x_out[block], x_new, casting = 'same_kind')
+            np.copyto(y_out[block], y_new, casting = 'same_kind')
 
-        return x, y
+        return x_out, y_out
 
     @abstractmethod
     def _get_plot_range_limits(self):
@@ -281,6 +1059,50 @@ class BaseSurface(ABC):
         """
         pass
 
+    def _get_display_extent(self, display_range = 'full', xlim = None,
+                            ylim = None):
+        """Get the extent of the displayed region of the surface.
+
+        The extent is that of the rotated surface, so it is the region that
+        the surface covers on the final plot. See set_plot_display_range() for
+        more information on the parameters
+
+        Returns
+        -------
+        extent : tuple (float, float, float, float)
+            The (xmin, xmax, ymin, ymax) limits of the displayed region
+        """
+        # Get the limits of the display range
+        xlim, ylim = self._get_plot_range_limits(
+            display_range,
+            xlim,
+            ylim
+        )
+
+        # Get the constraining feature's polygon's x and y coordinates
+        constraint_pts = self._surface_constraint._get_centered_feature()
+        mask = (constraint_pts[:, 0] >= xlim[0]) & \
+               (constraint_pts[:, 0] <= xlim[1]) & \
+               (constraint_pts[:, 1] >= ylim[0]) & \
+               (constraint_pts[:, 1] <= ylim[1])
+
+        x = np.concatenate((constraint_pts[:, 0][mask], xlim, xlim))
+        y = np.concatenate((constraint_pts[:, 1][mask], ylim, ylim[::-1]))
+
+        # If the full display range is desired, set the x and y limit
+        # attributes
+        if display_range == 'full':
+            if self._feature_xlim:
+                x = np.concatenate((x, self._feature_xlim))
+            if self._feature_ylim:
+                y = np.concatenate((y, self._feature_ylim))
+
+        # Shift the x and y limits so that convert_xy can undo the shift
+        # correctly
+        xs, ys = self.convert_xy(x + self.x_trans, y + self.y_trans)
+
+        return np.min(xs), np.max(xs), np.min(ys), np.max(ys)
+
     def set_plot_display_range(self, ax = None, display_range = 'full',
                                xlim = None, ylim = None):
         """Set the x and y limits for the matplotlib Axes object for the plot.
@@ -317,39 +1139,209 @@ class BaseSurface(ABC):
         """
         # If no Axes object is provided, create one
         if ax is None:
+            import matplotlib.pyplot as plt
             ax = plt.gca()
 
-        # Set the display limits
-        xlim, ylim = self._get_plot_range_limits(
+        x_min, x_max, y_min, y_max = self._get_display_extent(
             display_range,
             xlim,
             ylim
         )
 
-        # Get the constraining feature's polygon's x and y coordinates
-        constraint_df = self._surface_constraint._get_centered_feature()
-        mask = (constraint_df['x'] >= xlim[0]) & \
-               (constraint_df['x'] <= xlim[1]) & \
-               (constraint_df['y'] >= ylim[0]) & \
-               (constraint_df['y'] <= ylim[1])
+        # Set the x and y limits on the Axes object
+        ax.set_xlim(x_min, x_max)
+        ax.set_ylim(y_min, y_max)
 
-        x = np.concatenate((constraint_df['x'][mask], xlim, xlim))
-        y = np.concatenate((constraint_df['y'][mask], ylim, ylim[::-1]))
+        return ax
 
-        # If the full display range is desired, set the x and y limit
-        # attributes
-        if display_range == 'full':
-            if self._feature_xlim:
-                x = np.concatenate((x, self._feature_xlim))
-            if self._feature_ylim:
-                y = np.concatenate((y, self._feature_ylim))
+    def export_geometry(self, path, fmt = None, display_ranges = ('full',)):
+        """Write the surface's precomputed geometry to a file.
 
-        # Shift the x and y limits so that convert_xy can undo the shift
-        # correctly
-        xs, ys = self.convert_xy(x + self.x_trans, y + self.y_trans)
+        Every feature is written with its translated coordinates, colors,
+        z-order, and visibility, along with everything else needed to draw
+        the surface (its shift, rotation, units, and display ranges). The file
+        can be read by other tools, or loaded by PrecomputedSurface to draw the
+        surface without computing any of its geometry. Features that aren't
+        drawn as polygons (such as logos) are not written
 
-        # Set the x and y limits on the Axes object
-        ax.set_xlim(np.min(xs), np.max(xs))
-        ax.set_ylim(np.min(ys), np.max(ys))
+        Parameters
+        ----------
+        path : str
+            The path of the file to write
 
-        return ax
+        fmt : str or None (default: None)
+            The format of the file. This may be 'geojson' (a GeoJSON
+            FeatureCollection) or 'binary' (an index followed by a flat array
+            of float32 coordinates). If None, files ending in .geojson or .json
+            are written as GeoJSON and all others as binary
+
+        display_ranges : iterable of str (default: ('full',))
+            The display ranges whose limits should be written, so that they
+            may be used when drawing the loaded surface. See the surface's
+            draw() method for the display ranges that are available
+
+        Returns
+        -------
+        path : str
+            The path of the file that was written
+        """
+        from sportypy import __version__
+        from sportypy._base_classes._base_feature import BaseFeature
+        from sportypy._base_classes import _geometry_io
+
+        if fmt is None:
+            is_json = str(path).lower().endswith(('.geojson', '.json'))
+            fmt = 'geojson' if is_json else 'binary'
+
+        fmt = fmt.lower()
+        if fmt not in ('geojson', 'binary'):
+            raise ValueError("fmt must be either 'geojson' or 'binary'")
+
+        constraint = self._surface_constraint
+        features = [
+            feature for feature in self._features
+            if type(feature).draw is BaseFeature.draw
+        ]
+
+        # Find the extent of the visible features (other than the constraint)
+        # as the surface's draw() method would
+        feature_xlim = None
+        feature_ylim = None
+        extent_pts = [
+            feature._translate_feature() for feature in features
+            if getattr(feature, 'visible', True) and not (
+                constraint is not None and
+                isinstance(feature, type(constraint))
+            )
+        ]
+
+        if extent_pts:
+            extent_pts = np.concatenate(extent_pts)
+            feature_xlim = [
+                np.nanmin(extent_pts[:, 0]),
+                np.nanmax(extent_pts[:, 0])
+            ]
+            feature_ylim = [
+                np.nanmin(extent_pts[:, 1]),
+                np.nanmax(extent_pts[:, 1])
+            ]
+
+        ranges = {}
+        for display_range in display_ranges:
+            xlim, ylim = self._get_plot_range_limits(display_range)
+            ranges[display_range] = {'xlim': list(xlim), 'ylim': list(ylim)}
+
+        rotation = np.identity(3)
+        if self._rotation is not None:
+            rotation = self._rotation.get_matrix()
+
+        metadata = {
+            'format': 'sportypy-geometry',
+            'version': _geometry_io._geometry_version,
+            'sportypy_version': __version__,
+            'surface': type(self).__name__,
+            'rulebook_unit': getattr(self, 'rulebook_unit', 'ft'),
+            'x_trans': self.x_trans,
+            'y_trans': self.y_trans,
+            'rotation': rotation,
+            'feature_xlim': feature_xlim,
+            'feature_ylim': feature_ylim,
+            'display_ranges': ranges,
+            'feature_colors': getattr(self, 'feature_colors', None)
+        }
+
+        if fmt == 'geojson':
+            _geometry_io.write_geojson(path, metadata, features, constraint)
+        else:
+            _geometry_io.write_binary(path, metadata, features, constraint)
+
+        return path
+
+    def share_geometry(self):
+        """Publish the coordinates of the surface's features in shared memory.
+
+        Other processes can attach to the shared coordinates with their own
+        copy of the surface's attach_geometry() method, rather than computing
+        and holding their own copies of them
+
+        Returns
+        -------
+        shared : SharedGeometry
+            The shared coordinates. This may be pickled and sent to other
+            processes. The current process owns the shared memory, and should
+            close it (or use it as a context manager) once it's no longer
+            needed
+        """
+        from sportypy._base_classes._shared_geometry import SharedGeometry
+
+        shared = SharedGeometry.publish(self)
+
+        # The key identifies the parameters the surface was created with, so
+        # that it can only be attached to by surfaces with the same ones
+        if getattr(self, '_surface_key', None) is not None:
+            shared.surface_key = repr(self._surface_key)
+
+        return shared
+
+    def attach_geometry(self, shared):
+        """Use coordinates published by another process' surface.
+
+        Each feature's cached coordinates become a read-only view of the
+        shared memory, so none of them are computed. If the surface was cloned
+        from a cached template, the template is attached as well, so that
+        every surface later created with the same parameters shares them too
+
+        Parameters
+        ----------
+        shared : SharedGeometry
+            The coordinates published by the share_geometry() method of a
+            surface created with the same class and parameters as this one
+
+        Returns
+        -------
+        Nothing, but the features' cached coordinates are replaced
+
+        Raises
+        ------
+        ValueError
+            If the coordinates were published by a different surface
+        """
+        # Surfaces that weren't cached can't be compared by their parameters
+        surface_key = getattr(self, '_surface_key', None)
+        is_same_key = (
+            surface_key is None or
+            shared.surface_key is None or
+            repr(surface_key) == shared.surface_key
+        )
+
+        if shared.surface != type(self).__name__ or not is_same_key:
+            raise ValueError(
+                f'The shared geometry was published by a {shared.surface} ' +
+                f'with different parameters than this {type(self).__name__}'
+            )
+
+        arrays = shared.get_arrays()
+
+        surfaces = [self]
+        template = self.__dict__.get('_template')
+        if template is not None:
+            surfaces.insert(0, template)
+
+        for surface in surfaces:
+            features = surface._get_all_features()
+
+            if len(features) != len(arrays):
+                raise ValueError(
+                    f'The shared geometry has {len(arrays)} features, but ' +
+                    f'this {type(self).__name__} has {len(features)}'
+                )
+
+            for feature, feature_pts in zip(features, arrays):
+                feature._geometry_cache = (
+                    feature._geometry_key(),
+                    feature_pts
+                )
+
+            # Keep the shared memory open for as long as the surface uses it
+            surface._template_features_translated = True
+            surface._shared_geometry = shared
@@ -6,10 +6,47 @@ or sport surface will be an inherit this class.
 
 @author: Ross Drucker
 """
+import io
+import os
+import hashlib
+import zipfile
+import threading
 import numpy as np
 from functools import wraps
-import matplotlib.pyplot as plt
-from sportypy._base_classes._base_surface import BaseSurface
+from collections import OrderedDict
+from sportypy import __version__
+from sportypy._base_classes._base_surface import BaseSurface, _Rotation
+from sportypy._base_classes._aggregation import (
+    SurfaceAccumulator,
+    _GridAggregator,
+    _HexAggregator
+)
+
+
+# The rasterized surfaces used as the backgrounds of plots. These are keyed by
+# the surface and how it was rendered, and are evicted in least-recently-used
+# order once the cache reaches its maximum size
+_background_cache = OrderedDict()
+_background_cache_lock = threading.Lock()
+_background_cache_maxsize = 16
+
+
+def clear_background_cache():
+    """Remove all rasterized surface backgrounds from the in-memory cache."""
+    with _background_cache_lock:
+        _background_cache.clear()
+
+
+# The statistics that hexbin() computes for each of the reduce_C_function
+# arguments that matplotlib's hexbin() is commonly given. Other functions
+# can't be computed one chunk of points at a time
+_hexbin_reduce_statistics = {
+    np.sum: 'sum',
+    sum: 'sum',
+    np.mean: 'mean',
+    len: 'count',
+    np.size: 'count'
+}
 
 
 class BaseSurfacePlot(BaseSurface):
@@ -23,8 +60,9 @@ class BaseSurfacePlot(BaseSurface):
         """Ensure values passed to the plotting function are constrained.
 
         A point is considered "valid" if the point lies within the boundaries
-        of the surface or constraint. Those points that do not are not plotted
-        and are instead converted to be np.nan
+        of the surface or constraint. Those points that do not are not plotted.
+        The points are masked by _get_plot_mask(), as they are for the binned
+        plots
 
         This is a decorator which will be used with plotting methods of this
         class.
@@ -42,21 +80,19 @@ class BaseSurfacePlot(BaseSurface):
 
             # If no values are supplied, use the binning parameter C described
             # above
-            if not values:
+            if values is None:
                 values = C
 
+            # Keep track of whether any values were supplied, as the plotting
+            # function should only receive values that were actually supplied
+            has_values = values is not None
+
             # Make a copy of the values so as not to overwrite the original
             # values
             values = self.copy_(values)
 
-            # If there are no values, make a series of 1s to serve as
-            # placeholders that is the same shape as the x and y values
-            if not values:
-                values = np.ones(x.shape)
-
-            # Otherwise, use the actual values and flatten them (if necessary)
-            # to a one-dimensional array
-            else:
+            # Flatten the values (if necessary) to a one-dimensional array
+            if has_values:
                 values = np.ravel(values)
 
                 # Force the x and y values to be symmetric
@@ -64,53 +100,41 @@ class BaseSurfacePlot(BaseSurface):
                     values = np.concatenate((values, values))
 
             # If x, y, and values are not symmetric in length, raise an error
-            if len(x) != len(y) or len(x) != len(values):
+            if len(x) != len(y) or (has_values and len(x) != len(values)):
                 raise Exception('x, y, and values must all be of same length')
 
-            if plot_range is None and plot_xlim is None and plot_ylim is None:
-                plot_xlim, plot_ylim = self._get_limits('full')
-
-            # Initialize the mask to be be false. The mask will indicate
-            # whether a point lies within the defined limits for the plot
-            mask = False
-
             # If no plot_range is specified, and no x or y limitations are
-            # imposed, set the plot limits to that of a full-surface plot
+            # imposed, set the plot limits to that of a full-surface plot. No
+            # points are removed for lying outside of these limits
             if plot_range is None and plot_xlim is None and plot_ylim is None:
-                plot_xlim, plot_ylim = self._get_limits('full')
+                plot_xlim, plot_ylim = self.get_limits('full')
+                mask_xlim, mask_ylim = None, None
 
             # Otherwise, get the limits of the plot based on the supplied
-            # values and set the mask to identify points who are outside of its
-            # bounds
+            # values, and remove the points that lie outside of them
             else:
                 plot_xlim, plot_ylim = self.get_limits(
-                    plot_range,
+                    plot_range or 'full',
                     self.copy_(plot_xlim),
                     self.copy_(plot_ylim)
                 )
+                mask_xlim, mask_ylim = plot_xlim, plot_ylim
 
-                # The mask finds points that are below the minimum allowable x
-                # and y values or above the maximum allowable x and y values
-                mask = (
-                    (x < plot_xlim[0]) | (x > plot_xlim[1]) |
-                    (y < plot_ylim[0]) | (y > plot_ylim[1])
-                )
-
-            # If the plot is constrained to exclude values outside its bounds,
-            # then values outside of the boundaries of the surface should be
-            # set to be nan
-            if kwargs.get('is_constrained', True):
-                values = self._outside_boundaries_to_nan(x, y, values)
-
-            # Create the final mask to exclude points that are outside the
-            # boundary of the surface or are non-existent (nan)
-            mask = mask | np.isnan(x) | np.isnan(y) | np.isnan(values)
+            # Remove the points that are outside of the limits, outside of the
+            # boundary of the surface (if the plot is constrained), or are
+            # non-existent (nan)
+            keep = self._get_plot_mask(
+                x,
+                y,
+                values,
+                mask_xlim,
+                mask_ylim,
+                kwargs.get('is_constrained', True)
+            )
 
-            # Apply the mask to both the x and y coordinates as well as the
-            # values
-            x = x[~mask]
-            y = y[~mask]
-            values = values[~mask]
+            x = x[keep]
+            y = y[keep]
+            values = values[keep] if has_values else None
 
             return plot_function(
                 self,
@@ -137,6 +161,7 @@ class BaseSurfacePlot(BaseSurface):
             # If no Axes object is passed as a keyword argument, create one to
             # use for the plot
             if 'ax' not in kwargs:
+                import matplotlib.pyplot as plt
                 kwargs['ax'] = plt.gca()
 
             # Convert the non-keyword arguments to a list
@@ -150,18 +175,11 @@ class BaseSurfacePlot(BaseSurface):
                     args.append(kwargs.pop(coord))
 
             for i in range(len(args)):
-                args[i] = self.copy_(args[i])
-                args[i] = np.ravel(args[i])
-
-                is_y = i % 2
-
-                if kwargs.get('symmetrize', False):
-                    args[i] = np.concatenate((
-                        args[i],
-                        args[i] * (-1 if is_y else 1)
-                    ))
-
-                args[i] = args[i] - (self.y_shift if is_y else self.x_shift)
+                args[i] = self._shift_coordinates(
+                    args[i],
+                    is_y = i % 2 == 1,
+                    symmetrize = kwargs.get('symmetrize', False)
+                )
 
             kwargs['transform'] = self._get_transform(kwargs['ax'])
 
@@ -171,6 +189,1662 @@ class BaseSurfacePlot(BaseSurface):
 
         return wrapper
 
+    def get_limits(self, display_range = 'full', xlim = None, ylim = None):
+        """Get the x and y limits of a display range of the surface.
+
+        Parameters
+        ----------
+        display_range : str (default: 'full')
+            The portion of the surface to display. See the surface's draw()
+            method for more information
+
+        xlim : float, tuple (float, float), or None (default: None)
+            The display range in the x direction to be used. See the surface's
+            draw() method for more information
+
+        ylim : float, tuple (float, float), or None (default: None)
+            The display range in the y direction to be used. See the surface's
+            draw() method for more information
+
+        Returns
+        -------
+        xlim : tuple (float, float)
+            The x-directional limits of the display range
+
+        ylim : tuple (float, float)
+            The y-directional limits of the display range
+        """
+        return self._get_plot_range_limits(display_range, xlim, ylim)
+
+    def contains(self, x, y):
+        """Determine which points lie inside of the surface.
+
+        Parameters
+        ----------
+        x : float or array-like
+            The x coordinate(s) of the points, in the same coordinate system as
+            the data being plotted (before the surface's shift is undone)
+
+        y : float or array-like
+            The y coordinate(s) of the points, in the same coordinate system as
+            the data being plotted (before the surface's shift is undone)
+
+        Returns
+        -------
+        is_inside : numpy.ndarray
+            A boolean array that is True for the points that lie inside of (or
+            on the boundary of) the surface's constraint
+        """
+        x = np.ravel(x) - self.x_trans
+        y = np.ravel(y) - self.y_trans
+
+        return self._surface_constraint.contains(x, y)
+
+    def _shift_coordinates(self, coords, is_y, symmetrize = False):
+        """Shift coordinates into the surface's coordinate system.
+
+        Every plotting method shifts its points this way, so that the shift
+        (and the reflection of a symmetrized plot) is undone by convert_xy()
+
+        Parameters
+        ----------
+        coords : array-like
+            The x or y coordinates of the points
+
+        is_y : bool
+            Whether the coordinates are y coordinates
+
+        symmetrize : bool (default: False)
+            Whether or not to also include each point reflected over the x
+            axis. The reflected points follow all of the original points
+
+        Returns
+        -------
+        coords : numpy.ndarray
+            A new, one-dimensional array of the shifted coordinates
+        """
+        coords = np.ravel(np.asarray(coords, dtype = np.float64))
+
+        if symmetrize:
+            coords = np.concatenate((coords, -coords if is_y else coords))
+
+        return coords - (self.y_trans if is_y else self.x_trans)
+
+    def _get_plot_mask(self, x, y, values = None, xlim = None, ylim = None,
+                       is_constrained = True):
+        """Find the points that should be plotted.
+
+        This expects that x and y have already been shifted to be plotted
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            The x coordinates of the points
+
+        y : numpy.ndarray
+            The y coordinates of the points
+
+        values : numpy.ndarray or None (default: None)
+            The value associated with each point. Points whose values are nan
+            are not plotted
+
+        xlim : tuple (float, float) or None (default: None)
+            The x-directional limits of the plot. If None, the points aren't
+            limited in x
+
+        ylim : tuple (float, float) or None (default: None)
+            The y-directional limits of the plot. If None, the points aren't
+            limited in y
+
+        is_constrained : bool (default: True)
+            Whether or not to remove the points that lie outside of the
+            surface's constraint
+
+        Returns
+        -------
+        keep : numpy.ndarray
+            A boolean array that is True for the points that should be plotted
+        """
+        keep = ~(np.isnan(x) | np.isnan(y))
+
+        if values is not None:
+            keep &= ~np.isnan(values)
+
+        if xlim is not None:
+            keep &= (x >= xlim[0]) & (x <= xlim[1])
+
+        if ylim is not None:
+            keep &= (y >= ylim[0]) & (y <= ylim[1])
+
+        # Only the points that haven't already been removed need to be tested
+        # against the constraint
+        if is_constrained:
+            keep[keep] = self._surface_constraint.contains(x[keep], y[keep])
+
+        return keep
+
+    def _render_background(self, display_range, xlim, ylim, figsize, dpi):
+        """Rasterize the surface onto an offscreen figure.
+
+        Parameters
+        ----------
+        display_range : str
+            The portion of the surface to display. See the surface's draw()
+            method for more information
+
+        xlim : float, tuple (float, float), or None
+            The display range in the x direction to be used
+
+        ylim : float, tuple (float, float), or None
+            The display range in the y direction to be used
+
+        figsize : tuple (float, float)
+            The size (in inches) of the rendered image
+
+        dpi : float
+            The resolution (in dots per inch) of the rendered image
+
+        Returns
+        -------
+        background : numpy.ndarray
+            An (H, W, 4) array of the RGBA pixels of the rendered surface.
+            Anything that isn't part of the surface is transparent
+
+        extent : numpy.ndarray
+            The (left, right, bottom, top) data coordinates spanned by the
+            image
+        """
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        # Render the surface onto an Axes that spans the whole figure without
+        # going through pyplot, so that no window or global state is touched
+        fig = Figure(figsize = figsize, dpi = dpi)
+        fig.patch.set_alpha(0.0)
+        FigureCanvasAgg(fig)
+        ax = fig.add_axes([0.0, 0.0, 1.0, 1.0])
+
+        self.draw(
+            ax = ax,
+            display_range = display_range,
+            xlim = xlim,
+            ylim = ylim,
+            batched = True
+        )
+
+        fig.canvas.draw()
+
+        # Keeping the aspect ratio equal may shrink the Axes, so only keep the
+        # part of the image that lies within it. The pixel buffer's rows start
+        # at the top of the figure
+        buffer = np.asarray(fig.canvas.buffer_rgba())
+        x0, y0, x1, y1 = np.round(ax.bbox.extents).astype(int)
+        height = buffer.shape[0]
+        background = buffer[height - y1:height - y0, x0:x1].copy()
+
+        extent = np.array([*ax.get_xlim(), *ax.get_ylim()])
+
+        return background, extent
+
+    def draw_background(self, ax = None, display_range = 'full', xlim = None,
+                        ylim = None, rotation = None, dpi = None,
+                        cache_dir = None):
+        """Draw the surface as a pre-rendered image.
+
+        The first time the surface is drawn for a given set of parameters, it
+        is rasterized and the image is cached. Every later call with the same
+        surface (and the same display range, rotation, Axes size, and
+        resolution) only needs to add the cached image to the Axes, so that
+        only the data plotted on top of the surface has to be rendered
+
+        Parameters
+        ----------
+        ax : matplotlib.Axes or None (default: None)
+            An axes object onto which the surface can be drawn. If None is
+            supplied, then the currently-active Axes object will be used
+
+        display_range : str (default: 'full')
+            The portion of the surface to display. See the surface's draw()
+            method for more information
+
+        xlim : float, tuple (float, float), or None (default: None)
+            The display range in the x direction to be used. See the surface's
+            draw() method for more information
+
+        ylim : float, tuple (float, float), or None (default: None)
+            The display range in the y direction to be used. See the surface's
+            draw() method for more information
+
+        rotation : float or None (default: None)
+            Angle (in degrees) through which to rotate the surface. If used,
+            this will set the class attribute of self._rotation
+
+        dpi : float or None (default: None)
+            The resolution (in dots per inch) at which to rasterize the
+            surface. If None, the resolution of the Axes' figure is used
+
+        cache_dir : str or None (default: None)
+            A directory in which to also store the rasterized surfaces, so
+            that they can be reused by other processes. If None, the images
+            are only cached in memory
+
+        Returns
+        -------
+        ax : matplotlib.Axes
+            A matplotlib Axes object with the surface drawn on it
+        """
+        # If there is a rotation to be applied, apply it first so that any
+        # data plotted on the surface is rotated with it
+        if rotation:
+            self._rotation = _Rotation().rotate_deg(rotation)
+
+        if ax is None:
+            import matplotlib.pyplot as plt
+            ax = plt.gca()
+
+        if dpi is None:
+            dpi = ax.figure.dpi
+
+        # Render the surface at the size of the Axes it will be drawn on
+        figsize = (
+            round(ax.bbox.width / ax.figure.dpi, 4),
+            round(ax.bbox.height / ax.figure.dpi, 4)
+        )
+
+        # The surface can only be cached if it was cached when it was created
+        surface_key = getattr(self, '_surface_key', None)
+        if surface_key is not None:
+            background_key = (
+                surface_key,
+                tuple(np.round(self._rotation.get_matrix().ravel(), 12)),
+                display_range,
+                repr(xlim),
+                repr(ylim),
+                figsize,
+                dpi
+            )
+
+            with _background_cache_lock:
+                cached = _background_cache.get(background_key)
+
+                if cached is not None:
+                    _background_cache.move_to_end(background_key)
+
+        else:
+            background_key = None
+            cached = None
+
+        # Check the disk for the image before rendering it
+        cache_path = None
+        if background_key is not None and cache_dir is not None:
+            key_hash = hashlib.sha1(
+                repr((__version__, background_key)).encode()
+            ).hexdigest()
+            cache_path = os.path.join(cache_dir, f'{key_hash}.npz')
+
+            if cached is None and os.path.exists(cache_path):
+                # A file that can't be read (such as one removed by another
+                # process) is treated as if it weren't cached
+                try:
+                    with np.load(cache_path) as cached_file:
+                        cached = (
+                            cached_file['background'],
+                            cached_file['extent']
+                        )
+
+                except (OSError, ValueError, KeyError, EOFError,
+                        zipfile.BadZipFile):
+                    cached = None
+
+        if cached is None:
+            cached = self._render_background(
+                display_range,
+                xlim,
+                ylim,
+                figsize,
+                dpi
+            )
+
+            # Write the image under a temporary name and then rename it, so
+            # that other processes never read a partially-written file
+            if cache_path is not None:
+                temp_path = (
+                    f'{cache_path[:-4]}.{os.getpid()}.' +
+                    f'{threading.get_ident()}.tmp'
+                )
+
+                try:
+                    os.makedirs(cache_dir, exist_ok = True)
+
+                    with open(temp_path, 'wb') as f:
+                        np.savez(
+                            f,
+                            background = cached[0],
+                            extent = cached[1]
+                        )
+
+                    os.replace(temp_path, cache_path)
+
+                # The cache is only an optimization, so a cache that can't be
+                # written to is ignored
+                except OSError:
+                    try:
+                        os.remove(temp_path)
+
+                    except OSError:
+                        pass
+
+        if background_key is not None:
+            with _background_cache_lock:
+                _background_cache[background_key] = cached
+
+                while len(_background_cache) > _background_cache_maxsize:
+                    _background_cache.popitem(last = False)
+
+        background, extent = cached
+
+        # Add the image beneath anything else that's plotted on the Axes
+        ax.imshow(
+            background,
+            extent = tuple(extent),
+            origin = 'upper',
+            interpolation = 'nearest',
+            zorder = 0
+        )
+
+        ax.set_xlim(extent[0], extent[1])
+        ax.set_ylim(extent[2], extent[3])
+        ax.set_aspect('equal')
+        ax.axis('off')
+
+        return ax
+
+    def render(self, width = 1000, output = 'png', display_range = 'full',
+               xlim = None, ylim = None, rotation = None, dpi = 100.0,
+               facecolor = None, layers = None, batched = True):
+        """Render the surface (and any data on it) without using pyplot.
+
+        The surface is drawn on a matplotlib Figure with its own Agg canvas,
+        so no figure is registered with pyplot and nothing is left open once
+        the image has been rendered. The image is sized to the aspect ratio of
+        the displayed portion of the surface
+
+        Parameters
+        ----------
+        width : int (default: 1000)
+            The width of the image, in pixels. The height is chosen so that the
+            displayed portion of the surface fills the image
+
+        output : str (default: 'png')
+            What to return. This may be 'png' (the bytes of a PNG image) or
+            'rgba' (an array of the image's pixels)
+
+        display_range : str (default: 'full')
+            The portion of the surface to display. See the surface's draw()
+            method for more information
+
+        xlim : float, tuple (float, float), or None (default: None)
+            The display range in the x direction to be used. See the surface's
+            draw() method for more information
+
+        ylim : float, tuple (float, float), or None (default: None)
+            The display range in the y direction to be used. See the surface's
+            draw() method for more information
+
+        rotation : float or None (default: None)
+            Angle (in degrees) through which to rotate the surface. If used,
+            this will set the class attribute of self._rotation
+
+        dpi : float (default: 100.0)
+            The resolution (in dots per inch) of the image. This only affects
+            the size of text and the widths of lines relative to the image
+
+        facecolor : str or None (default: None)
+            The color of the image's background. If None, the surface's
+            plot_background color is used if it has one, and the background is
+            otherwise transparent
+
+        layers : list of dict or None (default: None)
+            Any data to plot on the surface. Each layer is a dictionary naming
+            the plotting method to use (one of 'scatter', 'hexbin', 'heatmap',
+            or 'contourf') under 'kind', along with the keyword arguments to
+            pass to that method
+
+        batched : bool (default: True)
+            Whether to draw the surface's features as batched collections. See
+            the surface's draw() method for more information
+
+        Returns
+        -------
+        image : bytes or numpy.ndarray
+            The bytes of the PNG image, or an (H, W, 4) array of the RGBA
+            values of the image's pixels
+        """
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        output = output.lower()
+        if output not in ('png', 'rgba'):
+            raise ValueError("output must be either 'png' or 'rgba'")
+
+        if facecolor is None:
+            facecolor = getattr(self, 'feature_colors', {}).get(
+                'plot_background',
+                'none'
+            )
+
+        fig = Figure(dpi = dpi, facecolor = facecolor)
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_axes([0.0, 0.0, 1.0, 1.0])
+
+        self.draw(
+            ax = ax,
+            display_range = display_range,
+            xlim = xlim,
+            ylim = ylim,
+            rotation = rotation,
+            batched = batched
+        )
+
+        for layer in layers or []:
+            layer = dict(layer)
+            kind = layer.pop('kind', 'scatter')
+
+            if kind not in ('scatter', 'hexbin', 'heatmap', 'contourf'):
+                raise ValueError(
+                    "kind must be one of 'scatter', 'hexbin', 'heatmap', or " +
+                    f"'contourf', not {kind}"
+                )
+
+            getattr(self, kind)(ax = ax, **layer)
+
+        # Size the figure so that the displayed region exactly fills it
+        x0, x1 = ax.get_xlim()
+        y0, y1 = ax.get_ylim()
+        height = max(int(round(width * abs(y1 - y0) / abs(x1 - x0))), 1)
+        fig.set_size_inches(width / dpi, height / dpi)
+
+        if output == 'png':
+            buffer = io.BytesIO()
+            canvas.print_png(buffer)
+
+            return buffer.getvalue()
+
+        canvas.draw()
+
+        return np.asarray(canvas.buffer_rgba()).copy()
+
+    def _vector_export(self, writer, width, display_range, xlim, ylim,
+                       rotation, facecolor):
+        """Write the surface with one of the vector export functions.
+
+        See to_svg() for a description of each parameter
+
+        Returns
+        -------
+        document : str or bytes
+            The document produced by the writer
+        """
+        if rotation:
+            self._rotation = _Rotation().rotate_deg(rotation)
+
+        if facecolor is None:
+            facecolor = getattr(self, 'feature_colors', {}).get(
+                'plot_background',
+                'none'
+            )
+
+        extent = self._get_display_extent(display_range, xlim, ylim)
+
+        return writer(self, width, extent, facecolor)
+
+    def to_svg(self, path = None, width = 1000, display_range = 'full',
+               xlim = None, ylim = None, rotation = None, facecolor = None):
+        """Write the surface as an SVG image without using matplotlib.
+
+        Each feature is written as a single path in which its arcs are true
+        SVG arcs rather than the many short segments used to draw them, so the
+        image is only a few kilobytes. Features that aren't drawn as polygons
+        (such as logos) are not included
+
+        Parameters
+        ----------
+        path : str or None (default: None)
+            The path of the file to write the image to. If None, the image is
+            only returned
+
+        width : float (default: 1000)
+            The width of the image, in pixels. The height is chosen so that the
+            displayed portion of the surface fills the image
+
+        display_range : str (default: 'full')
+            The portion of the surface to display. See the surface's draw()
+            method for more information
+
+        xlim : float, tuple (float, float), or None (default: None)
+            The display range in the x direction to be used. See the surface's
+            draw() method for more information
+
+        ylim : float, tuple (float, float), or None (default: None)
+            The display range in the y direction to be used. See the surface's
+            draw() method for more information
+
+        rotation : float or None (default: None)
+            Angle (in degrees) through which to rotate the surface. If used,
+            this will set the class attribute of self._rotation
+
+        facecolor : str or None (default: None)
+            The color of the image's background. If None, the surface's
+            plot_background color is used if it has one, and the background is
+            otherwise transparent
+
+        Returns
+        -------
+        svg : str
+            The SVG image
+        """
+        from sportypy._base_classes._vector_export import write_svg
+
+        svg = self._vector_export(
+            write_svg,
+            width,
+            display_range,
+            xlim,
+            ylim,
+            rotation,
+            facecolor
+        )
+
+        if path is not None:
+            with open(path, 'w', encoding = 'utf-8') as f:
+                f.write(svg)
+
+        return svg
+
+    def to_pdf(self, path = None, width = 720, display_range = 'full',
+               xlim = None, ylim = None, rotation = None, facecolor = None):
+        """Write the surface as a single-page PDF without using matplotlib.
+
+        This is the PDF counterpart of to_svg(), with each feature's arcs
+        written as cubic Bézier curves
+
+        Parameters
+        ----------
+        path : str or None (default: None)
+            The path of the file to write the PDF to. If None, the PDF is only
+            returned
+
+        width : float (default: 720)
+            The width of the page, in points. The height is chosen so that the
+            displayed portion of the surface fills the page
+
+        display_range : str (default: 'full')
+            The portion of the surface to display. See the surface's draw()
+            method for more information
+
+        xlim : float, tuple (float, float), or None (default: None)
+            The display range in the x direction to be used. See the surface's
+            draw() method for more information
+
+        ylim : float, tuple (float, float), or None (default: None)
+            The display range in the y direction to be used. See the surface's
+            draw() method for more information
+
+        rotation : float or None (default: None)
+            Angle (in degrees) through which to rotate the surface. If used,
+            this will set the class attribute of self._rotation
+
+        facecolor : str or None (default: None)
+            The color of the page's background. If None, the surface's
+            plot_background color is used if it has one, and the background is
+            otherwise transparent
+
+        Returns
+        -------
+        pdf : bytes
+            The PDF document
+        """
+        from sportypy._base_classes._vector_export import write_pdf
+
+        pdf = self._vector_export(
+            write_pdf,
+            width,
+            display_range,
+            xlim,
+            ylim,
+            rotation,
+            facecolor
+        )
+
+        if path is not None:
+            with open(path, 'wb') as f:
+                f.write(pdf)
+
+        return pdf
+
+    def animate(self, frames, styles = None, ax = None, interval = 40,
+                display_range = 'full', xlim = None, ylim = None,
+                rotation = None, use_background = True, **kwargs):
+        """Animate frames of tracking data over the surface.
+
+        The surface is drawn only once. Each frame only redraws the objects
+        (players, the ball, the puck, etc.) on top of it, using blitting, so
+        that playback isn't slowed down by redrawing the surface
+
+        Parameters
+        ----------
+        frames : iterable of dict
+            The frames to animate. Each frame maps the name of each group of
+            objects (e.g. 'home', 'away', 'puck') to their coordinates, as an
+            (x, y) pair or as anything with 'x' and 'y' columns (such as a data
+            frame). The coordinates are in the same coordinate system as the
+            surface before it is shifted. Frames may be generated lazily, and
+            are not kept once they've been drawn
+
+        styles : dict or None (default: None)
+            The keyword arguments to pass to matplotlib's scatter() function
+            for each group of objects, keyed by the group's name. Groups are
+            layered in the order that their styles are given
+
+        ax : matplotlib.Axes or None (default: None)
+            An axes object onto which the animation can be drawn. If None is
+            supplied, then the currently-active Axes object will be used
+
+        interval : float (default: 40)
+            The delay (in milliseconds) between frames
+
+        display_range : str (default: 'full')
+            The portion of the surface to display. See the surface's draw()
+            method for more information
+
+        xlim : float, tuple (float, float), or None (default: None)
+            The display range in the x direction to be used. See the surface's
+            draw() method for more information
+
+        ylim : float, tuple (float, float), or None (default: None)
+            The display range in the y direction to be used. See the surface's
+            draw() method for more information
+
+        rotation : float or None (default: None)
+            Angle (in degrees) through which to rotate the surface. If used,
+            this will set the class attribute of self._rotation
+
+        use_background : bool (default: True)
+            Whether to draw the surface as a cached, pre-rendered image (see
+            the draw_background() method). If False, the surface's features
+            are drawn as batched collections
+
+        **kwargs : dict or None (default: None)
+            Any keyword arguments to pass to matplotlib's FuncAnimation
+
+        Returns
+        -------
+        animation : matplotlib.animation.FuncAnimation
+            The animation. A reference to it must be kept for as long as it
+            is playing
+        """
+        from sportypy._base_classes._animation import create_animation
+
+        return create_animation(
+            self,
+            frames,
+            styles,
+            ax,
+            interval,
+            display_range,
+            xlim,
+            ylim,
+            rotation,
+            use_background,
+            **kwargs
+        )
+
+    def write_animation(self, frames, path, fps = 25, styles = None,
+                        width = 1000, dpi = 100.0, display_range = 'full',
+                        xlim = None, ylim = None, rotation = None,
+                        facecolor = None, use_background = True,
+                        codec = 'libx264', ffmpeg_args = None,
+                        first_frame = 0):
+        """Write frames of tracking data over the surface to a video or PNGs.
+
+        Like animate(), the surface is rendered only once and each frame only
+        redraws the objects on top of it. Frames are streamed as they're
+        drawn, either to ffmpeg's standard input or to their own PNG files,
+        so only one frame is ever held in memory. This doesn't use pyplot
+
+        Parameters
+        ----------
+        frames : iterable of dict
+            The frames to write. See animate() for more information
+
+        path : str
+            The path to write to. A path with a '{frame}' field (for example,
+            'frames/{frame:05d}.png') writes each frame as its own PNG file,
+            numbered from 0. Any other path is the video that ffmpeg writes,
+            so ffmpeg must be installed (see matplotlib's
+            animation.ffmpeg_path setting)
+
+        fps : float (default: 25)
+            The number of frames per second of the video
+
+        styles : dict or None (default: None)
+            The keyword arguments to pass to matplotlib's scatter() function
+            for each group of objects. See animate() for more information
+
+        width : int (default: 1000)
+            The width of each frame, in pixels. The height is chosen so that
+            the displayed portion of the surface fills the frame. Both are
+            rounded up to even numbers, as most video codecs require
+
+        dpi : float (default: 100.0)
+            The resolution (in dots per inch) of each frame. This only affects
+            the size of markers and the widths of lines relative to the frame
+
+        display_range : str (default: 'full')
+            The portion of the surface to display. See the surface's draw()
+            method for more information
+
+        xlim : float, tuple (float, float), or None (default: None)
+            The display range in the x direction to be used. See the surface's
+            draw() method for more information
+
+        ylim : float, tuple (float, float), or None (default: None)
+            The display range in the y direction to be used. See the surface's
+            draw() method for more information
+
+        rotation : float or None (default: None)
+            Angle (in degrees) through which to rotate the surface. If used,
+            this will set the class attribute of self._rotation
+
+        facecolor : str or None (default: None)
+            The color of each frame's background. If None, the surface's
+            plot_background color is used if it has one, and the background is
+            otherwise transparent
+
+        use_background : bool (default: True)
+            Whether to draw the surface as a cached, pre-rendered image. See
+            animate() for more information
+
+        codec : str (default: 'libx264')
+            The video codec for ffmpeg to use
+
+        ffmpeg_args : list of str or None (default: None)
+            Any additional arguments to pass to ffmpeg before the output path
+
+        first_frame : int (default: 0)
+            The number of the first frame when writing PNG files. This lets
+            a long replay be written in several parts
+
+        Returns
+        -------
+        n_frames : int
+            The number of frames that were written
+        """
+        from sportypy._base_classes._animation import write_frames
+
+        return write_frames(
+            self,
+            frames,
+            path,
+            fps,
+            styles,
+            width,
+            dpi,
+            display_range,
+            xlim,
+            ylim,
+            rotation,
+            facecolor,
+            use_background,
+            codec,
+            ffmpeg_args,
+            first_frame
+        )
+
+    def _iter_plot_chunks(self, x, y, values = None, xlim = None,
+                          ylim = None, symmetrize = False,
+                          is_constrained = True, chunk_size = 1000000):
+        """Iterate over the points to be plotted in fixed-size chunks.
+
+        Each chunk is shifted into the surface's coordinate system and has the
+        points that should not be plotted removed. Only one chunk's worth of
+        points is copied at a time, so memory-mapped or otherwise very large
+        arrays can be binned without being read into memory all at once
+
+        Parameters
+        ----------
+        x : array-like
+            The x coordinates of the points
+
+        y : array-like
+            The y coordinates of the points
+
+        values : array-like or None (default: None)
+            The value associated with each point
+
+        xlim : tuple (float, float) or None (default: None)
+            The x-directional limits of the plot. Points outside of these
+            limits are removed
+
+        ylim : tuple (float, float) or None (default: None)
+            The y-directional limits of the plot. Points outside of these
+            limits are removed
+
+        symmetrize : bool (default: False)
+            Whether or not to also include each point reflected over the x axis
+
+        is_constrained : bool (default: True)
+            Whether or not to remove points that lie outside of the surface's
+            constraint
+
+        chunk_size : int (default: 1000000)
+            The maximum number of points in each chunk
+
+        Yields
+        ------
+        x : numpy.ndarray
+            The x coordinates of the chunk's points, after being shifted
+
+        y : numpy.ndarray
+            The y coordinates of the chunk's points, after being shifted
+
+        values : numpy.ndarray or None
+            The values of the chunk's points, or None if no values were
+            supplied
+        """
+        x = np.ravel(np.asarray(x))
+        y = np.ravel(np.asarray(y))
+
+        if values is not None:
+            values = np.ravel(np.asarray(values))
+
+        if len(x) != len(y) or (values is not None and len(x) != len(values)):
+            raise Exception('x, y, and values must all be of same length')
+
+        for start in range(0, len(x), chunk_size):
+            stop = start + chunk_size
+            chunk_values = None
+            if values is not None:
+                chunk_values = values[start:stop]
+
+            yield self._prepare_chunk(
+                x[start:stop],
+                y[start:stop],
+                chunk_values,
+                xlim,
+                ylim,
+                symmetrize,
+                is_constrained
+            )
+
+    def _prepare_chunk(self, x, y, values = None, xlim = None, ylim = None,
+                       symmetrize = False, is_constrained = True):
+        """Shift a chunk of points and remove those that shouldn't be plotted.
+
+        This shifts and masks the points in the same way as the
+        _validate_plot() and _validate_values() decorators. See
+        _iter_plot_chunks() for more information on the parameters
+
+        Returns
+        -------
+        x : numpy.ndarray
+            The x coordinates of the chunk's points, after being shifted
+
+        y : numpy.ndarray
+            The y coordinates of the chunk's points, after being shifted
+
+        values : numpy.ndarray or None
+            The values of the chunk's points, or None if no values were
+            supplied
+        """
+        x = self._shift_coordinates(x, False, symmetrize)
+        y = self._shift_coordinates(y, True, symmetrize)
+
+        if values is not None:
+            values = np.ravel(np.asarray(values, dtype = np.float64))
+
+            if symmetrize:
+                values = np.concatenate((values, values))
+
+        keep = self._get_plot_mask(x, y, values, xlim, ylim, is_constrained)
+
+        return x[keep], y[keep], None if values is None else values[keep]
+
+    @staticmethod
+    def _get_chunk_column(chunk, column):
+        """Get a column of a chunk of data as a NumPy array.
+
+        Parameters
+        ----------
+        chunk : pandas.DataFrame, numpy.ndarray, pyarrow.RecordBatch, or dict
+            The chunk of data. A NumPy array must be a record (structured)
+            array, and a pyarrow object may be either a RecordBatch or a Table
+
+        column : str
+            The name of the column to get
+
+        Returns
+        -------
+        column : numpy.ndarray
+            The column's data. Missing values in an Arrow column are nan
+        """
+        # pyarrow RecordBatches and Tables
+        if hasattr(chunk, 'schema') and hasattr(chunk, 'column'):
+            column = chunk.column(column)
+            if hasattr(column, 'combine_chunks'):
+                column = column.combine_chunks()
+
+            return column.to_numpy(zero_copy_only = False)
+
+        # pandas DataFrames, NumPy record arrays, and dictionaries of arrays
+        return np.asarray(chunk[column])
+
+    def iter_chunks(self, data, x = 'x', y = 'y', values = None,
+                    plot_range = None, plot_xlim = None, plot_ylim = None,
+                    symmetrize = False, is_constrained = True,
+                    rotate = False):
+        """Iterate over chunks of data in the surface's coordinate system.
+
+        This is intended for data that is too large to be held in memory all
+        at once, like a season of player-tracking data. Each chunk is read,
+        shifted, and masked in turn, so only one chunk is ever held in memory
+
+        Parameters
+        ----------
+        data : iterable or chunk
+            The chunks of data. Each chunk may be a pandas DataFrame, a NumPy
+            record array, a pyarrow RecordBatch or Table, or a dictionary of
+            arrays. An iterator of chunks, like the one returned by
+            pandas.read_csv(..., chunksize = n) or
+            pyarrow.parquet.ParquetFile.iter_batches(), may be used, as may a
+            single chunk
+
+        x : str (default: 'x')
+            The name of the column containing the points' x coordinates
+
+        y : str (default: 'y')
+            The name of the column containing the points' y coordinates
+
+        values : str or None (default: None)
+            The name of the column containing the points' values, if any
+
+        plot_range : str or None (default: None)
+            The portion of the surface to which the points are limited. See
+            the surface's draw() method for more information
+
+        plot_xlim : float, tuple (float, float), or None (default: None)
+            The x-directional limits of the points
+
+        plot_ylim : float, tuple (float, float), or None (default: None)
+            The y-directional limits of the points
+
+        symmetrize : bool (default: False)
+            Whether or not to also yield each point reflected over the x axis
+
+        is_constrained : bool (default: True)
+            Whether or not to remove points that lie outside of the surface
+
+        rotate : bool (default: False)
+            Whether or not to also apply the surface's rotation to the points.
+            The surface's plotting methods bin the points before they are
+            rotated, as the rotation is applied when the plot is drawn
+
+        Yields
+        ------
+        x : numpy.ndarray
+            The x coordinates of the chunk's points
+
+        y : numpy.ndarray
+            The y coordinates of the chunk's points
+
+        values : numpy.ndarray or None
+            The values of the chunk's points, or None if no values column was
+            named
+        """
+        xlim, ylim = self.get_limits(
+            plot_range or 'full',
+            plot_xlim,
+            plot_ylim
+        )
+
+        for chunk_x, chunk_y, chunk_values in self._iter_data_chunks(
+            data,
+            x,
+            y,
+            values,
+            xlim,
+            ylim,
+            symmetrize,
+            is_constrained
+        ):
+            if rotate:
+                rotated = self._rotation.transform(
+                    np.column_stack((chunk_x, chunk_y))
+                )
+                chunk_x = rotated[:, 0]
+                chunk_y = rotated[:, 1]
+
+            yield chunk_x, chunk_y, chunk_values
+
+    def _iter_data_chunks(self, data, x, y, values, xlim, ylim, symmetrize,
+                          is_constrained):
+        """Iterate over the points in chunks of data.
+
+        See iter_chunks() for more information on the parameters
+
+        Yields
+        ------
+        x : numpy.ndarray
+            The x coordinates of the chunk's points, after being shifted
+
+        y : numpy.ndarray
+            The y coordinates of the chunk's points, after being shifted
+
+        values : numpy.ndarray or None
+            The values of the chunk's points, or None if no values column was
+            named
+        """
+        # A single chunk is treated as an iterator of only that chunk
+        is_chunk = (
+            hasattr(data, 'columns') or
+            hasattr(data, 'schema') or
+            getattr(getattr(data, 'dtype', None), 'names', None) is not None or
+            isinstance(data, dict)
+        )
+        if is_chunk:
+            data = (data,)
+
+        for chunk in data:
+            yield self._prepare_chunk(
+                self._get_chunk_column(chunk, x),
+                self._get_chunk_column(chunk, y),
+                (
+                    self._get_chunk_column(chunk, values)
+                    if values is not None
+                    else None
+                ),
+                xlim,
+                ylim,
+                symmetrize,
+                is_constrained
+            )
+
+    def _aggregate(self, aggregator, x, y, values, xlim, ylim, symmetrize,
+                   is_constrained, chunk_size, data = None):
+        """Stream the points to be plotted into an aggregator.
+
+        See _iter_plot_chunks() and iter_chunks() for more information on the
+        parameters
+
+        Returns
+        -------
+        aggregator : _BinnedAggregator
+            The aggregator, after all of the points have been added to it
+        """
+        if data is None:
+            chunks = self._iter_plot_chunks(
+                x,
+                y,
+                values,
+                xlim,
+                ylim,
+                symmetrize,
+                is_constrained,
+                chunk_size
+            )
+
+        else:
+            chunks = self._iter_data_chunks(
+                data,
+                x,
+                y,
+                values,
+                xlim,
+                ylim,
+                symmetrize,
+                is_constrained
+            )
+
+        for chunk_x, chunk_y, chunk_values in chunks:
+            aggregator.add(chunk_x, chunk_y, chunk_values)
+
+        return aggregator
+
+    @_validate_plot
+    @_validate_values
+    def scatter(self, x, y, *, values = None, **kwargs):
+        """Draw a scatter plot of points on the surface.
+
+        Parameters
+        ----------
+        x : array-like
+            The x coordinates of the points, in the same coordinate system as
+            the surface before it is shifted
+
+        y : array-like
+            The y coordinates of the points, in the same coordinate system as
+            the surface before it is shifted
+
+        values : array-like or None (default: None)
+            The value associated with each point. If supplied, the points are
+            colored by their values
+
+        plot_range : str or None (default: None)
+            The portion of the surface to which the points are limited. See
+            the surface's draw() method for more information
+
+        plot_xlim : float, tuple (float, float), or None (default: None)
+            The x-directional limits of the points
+
+        plot_ylim : float, tuple (float, float), or None (default: None)
+            The y-directional limits of the points
+
+        symmetrize : bool (default: False)
+            Whether or not to also plot each point reflected over the x axis
+
+        is_constrained : bool (default: True)
+            Whether or not to remove points that lie outside of the surface
+
+        ax : matplotlib.Axes or None (default: None)
+            An axes object onto which the points can be drawn. If None is
+            supplied, then the currently-active Axes object will be used
+
+        **kwargs : dict or None (default: None)
+            Any keyword arguments to pass to matplotlib's scatter() function
+
+        Returns
+        -------
+        collection : matplotlib.collections.PathCollection
+            The points that were drawn
+        """
+        ax = kwargs.pop('ax')
+        kwargs.pop('symmetrize', None)
+        kwargs.pop('is_constrained', None)
+        for limit in ('plot_range', 'plot_xlim', 'plot_ylim'):
+            kwargs.pop(limit, None)
+
+        if values is not None:
+            kwargs.setdefault('c', values)
+
+        return ax.scatter(x, y, **kwargs)
+
+    def hexbin(self, x, y, values = None, statistic = None, gridsize = 100,
+               mincnt = 1, plot_range = None, plot_xlim = None,
+               plot_ylim = None, symmetrize = False, is_constrained = True,
+               chunk_size = 1000000, data = None, ax = None,
+               **kwargs):
+        """Draw a hexbin plot of points on the surface.
+
+        The points are binned in chunks, so any number of points may be
+        plotted without all of them needing to be held in memory at once
+
+        Parameters
+        ----------
+        x : array-like or str
+            The x coordinates of the points, in the same coordinate system as
+            the surface before it is shifted
+
+        y : array-like or str
+            The y coordinates of the points, in the same coordinate system as
+            the surface before it is shifted
+
+        values : array-like, str, or None (default: None)
+            The value associated with each point
+
+        statistic : str or None (default: None)
+            The statistic of each hexagon to plot. This may be 'count', 'sum',
+            or 'mean'. If None, the number of points in each hexagon is plotted
+            when no values are supplied, and the average of their values
+            otherwise
+
+        gridsize : int or tuple (int, int) (default: 100)
+            The number of hexagons in the x direction, or in both the x and y
+            directions. See matplotlib's hexbin() function for more information
+
+        mincnt : int or None (default: 1)
+            The minimum number of points a hexagon must contain to be drawn
+
+        plot_range : str or None (default: None)
+            The portion of the surface over which to bin the points. See the
+            surface's draw() method for more information
+
+        plot_xlim : float, tuple (float, float), or None (default: None)
+            The x-directional limits of the binned region
+
+        plot_ylim : float, tuple (float, float), or None (default: None)
+            The y-directional limits of the binned region
+
+        symmetrize : bool (default: False)
+            Whether or not to also bin each point reflected over the x axis
+
+        is_constrained : bool (default: True)
+            Whether or not to remove points that lie outside of the surface,
+            and to clip the plot to the surface's boundary
+
+        chunk_size : int (default: 1000000)
+            The number of points to bin at a time
+
+        data : iterable, chunk, or None (default: None)
+            Chunks of data containing the points. If supplied, x, y, and values
+            are the names of the chunks' columns, and the chunks are binned one
+            at a time. See iter_chunks() for more information
+
+        ax : matplotlib.Axes or None (default: None)
+            An axes object onto which the plot can be drawn. If None is
+            supplied, then the currently-active Axes object will be used
+
+        **kwargs : dict or None (default: None)
+            Any keyword arguments to pass to matplotlib's hexbin() function. A
+            reduce_C_function of np.sum, np.mean, or len is used as the
+            statistic of 'sum', 'mean', or 'count' respectively
+
+        Returns
+        -------
+        collection : matplotlib.collections.PolyCollection
+            The hexagons that were drawn
+
+        Raises
+        ------
+        ValueError
+            If reduce_C_function is any other function, or doesn't match the
+            supplied statistic
+        """
+        if ax is None:
+            import matplotlib.pyplot as plt
+            ax = plt.gca()
+
+        # The points are binned one chunk at a time, so only the statistics
+        # that can be accumulated that way may be used to reduce them
+        reduce_C_function = kwargs.pop('reduce_C_function', None)
+        if reduce_C_function is not None:
+            try:
+                reduce_statistic = _hexbin_reduce_statistics[reduce_C_function]
+
+            except (KeyError, TypeError):
+                raise ValueError(
+                    'hexbin() bins the points one chunk at a time, so its ' +
+                    'reduce_C_function may only be np.sum, np.mean, or len. ' +
+                    "Use statistic = 'count', 'sum', or 'mean' instead"
+                ) from None
+
+            if statistic is not None and statistic != reduce_statistic:
+                raise ValueError(
+                    f'reduce_C_function computes the {reduce_statistic} of ' +
+                    f"each hexagon, but statistic is '{statistic}'"
+                )
+
+            statistic = reduce_statistic
+
+        if statistic is None:
+            statistic = 'count' if values is None else 'mean'
+
+        xlim, ylim = self.get_limits(
+            plot_range or 'full',
+            plot_xlim,
+            plot_ylim
+        )
+        aggregator = self._aggregate(
+            _HexAggregator((*xlim, *ylim), gridsize),
+            x,
+            y,
+            values,
+            xlim,
+            ylim,
+            symmetrize,
+            is_constrained,
+            chunk_size,
+            data
+        )
+
+        reduced = aggregator.reduce(statistic, mincnt)
+        is_drawn = ~np.isnan(reduced)
+        centers = aggregator.get_centers()[is_drawn]
+
+        # Each hexagon's center is binned into that same hexagon, so drawing
+        # the centers with their reduced values as the binning parameter
+        # reproduces the aggregated plot
+        transform = self._get_transform(ax)
+        collection = ax.hexbin(
+            centers[:, 0],
+            centers[:, 1],
+            C = reduced[is_drawn],
+            gridsize = aggregator.gridsize,
+            extent = aggregator.extent,
+            reduce_C_function = np.sum,
+            transform = transform,
+            **kwargs
+        )
+
+        # The hexagons' centers must be transformed along with their shapes
+        from matplotlib.transforms import AffineDeltaTransform
+        collection.set_offset_transform(AffineDeltaTransform(transform))
+
+        if is_constrained:
+            self._constrain_plot([collection], ax, transform)
+
+        return collection
+
+    def heatmap(self, x, y, values = None, statistic = None, bin_size = 1.0,
+                mincnt = 1, plot_range = None, plot_xlim = None,
+                plot_ylim = None, symmetrize = False, is_constrained = True,
+                chunk_size = 1000000, data = None, ax = None,
+                **kwargs):
+        """Draw a heatmap of points on the surface.
+
+        The points are binned in chunks, so any number of points may be
+        plotted without all of them needing to be held in memory at once
+
+        Parameters
+        ----------
+        x : array-like or str
+            The x coordinates of the points, in the same coordinate system as
+            the surface before it is shifted
+
+        y : array-like or str
+            The y coordinates of the points, in the same coordinate system as
+            the surface before it is shifted
+
+        values : array-like, str, or None (default: None)
+            The value associated with each point
+
+        statistic : str or None (default: None)
+            The statistic of each bin to plot. This may be 'count', 'sum', or
+            'mean'. If None, the number of points in each bin is plotted when
+            no values are supplied, and the average of their values otherwise
+
+        bin_size : float (default: 1.0)
+            The length of each side of the square bins, in the units of the
+            surface
+
+        mincnt : int or None (default: 1)
+            The minimum number of points a bin must contain to be drawn
+
+        plot_range : str or None (default: None)
+            The portion of the surface over which to bin the points. See the
+            surface's draw() method for more information
+
+        plot_xlim : float, tuple (float, float), or None (default: None)
+            The x-directional limits of the binned region
+
+        plot_ylim : float, tuple (float, float), or None (default: None)
+            The y-directional limits of the binned region
+
+        symmetrize : bool (default: False)
+            Whether or not to also bin each point reflected over the x axis
+
+        is_constrained : bool (default: True)
+            Whether or not to remove points that lie outside of the surface,
+            and to clip the plot to the surface's boundary
+
+        chunk_size : int (default: 1000000)
+            The number of points to bin at a time
+
+        data : iterable, chunk, or None (default: None)
+            Chunks of data containing the points. If supplied, x, y, and values
+            are the names of the chunks' columns, and the chunks are binned one
+            at a time. See iter_chunks() for more information
+
+        ax : matplotlib.Axes or None (default: None)
+            An axes object onto which the plot can be drawn. If None is
+            supplied, then the currently-active Axes object will be used
+
+        **kwargs : dict or None (default: None)
+            Any keyword arguments to pass to matplotlib's pcolormesh() function
+
+        Returns
+        -------
+        mesh : matplotlib.collections.QuadMesh
+            The bins that were drawn
+        """
+        if ax is None:
+            import matplotlib.pyplot as plt
+            ax = plt.gca()
+
+        if statistic is None:
+            statistic = 'count' if values is None else 'mean'
+
+        xlim, ylim = self.get_limits(
+            plot_range or 'full',
+            plot_xlim,
+            plot_ylim
+        )
+        aggregator = self._aggregate(
+            _GridAggregator(xlim, ylim, bin_size),
+            x,
+            y,
+            values,
+            xlim,
+            ylim,
+            symmetrize,
+            is_constrained,
+            chunk_size,
+            data
+        )
+
+        transform = self._get_transform(ax)
+        mesh = ax.pcolormesh(
+            aggregator.x_edges,
+            aggregator.y_edges,
+            np.ma.masked_invalid(aggregator.reduce(statistic, mincnt)),
+            transform = transform,
+            **kwargs
+        )
+
+        if is_constrained:
+            self._constrain_plot([mesh], ax, transform)
+
+        return mesh
+
+    def contourf(self, x, y, values = None, statistic = None, bin_size = 1.0,
+                 plot_range = None, plot_xlim = None, plot_ylim = None,
+                 symmetrize = False, is_constrained = True,
+                 chunk_size = 1000000, data = None, ax = None,
+                 **kwargs):
+        """Draw filled contours of the density of points on the surface.
+
+        The points are binned in chunks, and the contours are drawn through
+        the centers of the bins. This means that any number of points may be
+        plotted without all of them needing to be held in memory at once
+
+        Parameters
+        ----------
+        x : array-like or str
+            The x coordinates of the points, in the same coordinate system as
+            the surface before it is shifted
+
+        y : array-like or str
+            The y coordinates of the points, in the same coordinate system as
+            the surface before it is shifted
+
+        values : array-like, str, or None (default: None)
+            The value associated with each point
+
+        statistic : str or None (default: None)
+            The statistic of each bin to contour. This may be 'count', 'sum',
+            or 'mean'. If None, the number of points in each bin is contoured
+            when no values are supplied, and the average of their values
+            otherwise. Empty bins are treated as 0 for counts and sums, and are
+            left out of the contours for means
+
+        bin_size : float (default: 1.0)
+            The length of each side of the square bins, in the units of the
+            surface
+
+        plot_range : str or None (default: None)
+            The portion of the surface over which to bin the points. See the
+            surface's draw() method for more information
+
+        plot_xlim : float, tuple (float, float), or None (default: None)
+            The x-directional limits of the binned region
+
+        plot_ylim : float, tuple (float, float), or None (default: None)
+            The y-directional limits of the binned region
+
+        symmetrize : bool (default: False)
+            Whether or not to also bin each point reflected over the x axis
+
+        is_constrained : bool (default: True)
+            Whether or not to remove points that lie outside of the surface,
+            and to clip the plot to the surface's boundary
+
+        chunk_size : int (default: 1000000)
+            The number of points to bin at a time
+
+        data : iterable, chunk, or None (default: None)
+            Chunks of data containing the points. If supplied, x, y, and values
+            are the names of the chunks' columns, and the chunks are binned one
+            at a time. See iter_chunks() for more information
+
+        ax : matplotlib.Axes or None (default: None)
+            An axes object onto which the plot can be drawn. If None is
+            supplied, then the currently-active Axes object will be used
+
+        **kwargs : dict or None (default: None)
+            Any keyword arguments to pass to matplotlib's contourf() function
+
+        Returns
+        -------
+        contours : matplotlib.contour.QuadContourSet
+            The contours that were drawn
+        """
+        if ax is None:
+            import matplotlib.pyplot as plt
+            ax = plt.gca()
+
+        if statistic is None:
+            statistic = 'count' if values is None else 'mean'
+
+        xlim, ylim = self.get_limits(
+            plot_range or 'full',
+            plot_xlim,
+            plot_ylim
+        )
+        aggregator = self._aggregate(
+            _GridAggregator(xlim, ylim, bin_size),
+            x,
+            y,
+            values,
+            xlim,
+            ylim,
+            symmetrize,
+            is_constrained,
+            chunk_size,
+            data
+        )
+
+        x_centers, y_centers = aggregator.get_centers()
+        transform = self._get_transform(ax)
+        contours = ax.contourf(
+            x_centers,
+            y_centers,
+            np.ma.masked_invalid(aggregator.reduce(statistic)),
+            transform = transform,
+            **kwargs
+        )
+
+        if is_constrained:
+            self._constrain_plot([contours], ax, transform)
+
+        return contours
+
+    def accumulator(self, bin_size = 1.0, plot_range = None, plot_xlim = None,
+                    plot_ylim = None, symmetrize = False,
+                    is_constrained = True):
+        """Create an accumulator that bins points on the surface over time.
+
+        The accumulator's bins span the surface (or the portion of it that is
+        specified), so points can be added to it as they are recorded rather
+        than re-binning every point each time the plot is updated. See
+        SurfaceAccumulator for more information
+
+        Parameters
+        ----------
+        bin_size : float (default: 1.0)
+            The length of each side of the square bins, in the units of the
+            surface
+
+        plot_range : str or None (default: None)
+            The portion of the surface spanned by the bins. See the surface's
+            draw() method for more information
+
+        plot_xlim : float, tuple (float, float), or None (default: None)
+            The x-directional limits of the bins
+
+        plot_ylim : float, tuple (float, float), or None (default: None)
+            The y-directional limits of the bins
+
+        symmetrize : bool (default: False)
+            Whether or not to also bin each point reflected over the x axis
+
+        is_constrained : bool (default: True)
+            Whether or not to ignore points that lie outside of the surface
+
+        Returns
+        -------
+        accumulator : SurfaceAccumulator
+            An empty accumulator in the surface's coordinate system
+        """
+        xlim, ylim = self.get_limits(
+            plot_range or 'full',
+            plot_xlim,
+            plot_ylim
+        )
+
+        return SurfaceAccumulator(
+            self,
+            xlim,
+            ylim,
+            bin_size,
+            symmetrize,
+            is_constrained
+        )
+
+    def load_accumulator(self, path):
+        """Load an accumulator that was saved from this kind of surface.
+
+        Parameters
+        ----------
+        path : str or file-like
+            Where the accumulator was saved
+
+        Returns
+        -------
+        accumulator : SurfaceAccumulator
+            The loaded accumulator, in the surface's coordinate system
+        """
+        return SurfaceAccumulator.load(path, self)
+
     def _constrain_plot(self, plot_features, ax, transform):
-        """Constrain the features."""
-        pass
+        """Clip plotted features to the boundary of the surface.
+
+        Parameters
+        ----------
+        plot_features : list of matplotlib.artist.Artist
+            The artists (e.g. a hexbin's hexagons) to clip
+
+        ax : matplotlib.Axes
+            The axes object on which the features are drawn
+
+        transform : matplotlib.transforms.Transform
+            The transform that maps the surface's coordinates onto the Axes
+
+        Returns
+        -------
+        Nothing, but each of the features is clipped so that nothing outside
+        of the surface's constraint is visible
+        """
+        from matplotlib.path import Path
+
+        constraint_pts = self._surface_constraint._translate_feature()
+
+        # A surface without a boundary (e.g. a baseball field) has nothing to
+        # clip its plots to
+        if len(constraint_pts) == 0:
+            return
+
+        constraint_path = Path(
+            constraint_pts[~np.isnan(constraint_pts).any(axis = 1)]
+        )
+
+        for plot_feature in plot_features:
+            plot_feature.set_clip_path(constraint_path, transform)
@@ -0,0 +1,347 @@
+"""Cache the geometry of surfaces on disk, to be shared by every process.
+
+A surface's geometry only depends on its class, the parameters it was created
+with, and the version of sportypy, so it can be computed once and reused by
+every later process. Once the cache is enabled, the coordinates of each
+surface's features are written to a .npy file the first time they're
+computed. Any other process that creates the same surface memory-maps that
+file, so that none of its features' coordinates are computed or copied.
+
+The cache is disabled by default. It may be enabled with
+enable_geometry_cache(), or by setting the SPORTYPY_CACHE_DIR environment
+variable to the directory to use (which also enables it in worker processes
+that don't inherit the settings of the process that started them).
+
+Each surface is stored as two files named by a hash of its key: the
+coordinates of all of its features (one after another) and the number of
+points in each feature. Once the files in the cache take up more than its
+maximum size, the least recently used surfaces are removed.
+
+@author: Ross Drucker
+"""
+import os
+import glob
+import time
+import hashlib
+import threading
+import numpy as np
+
+
+# The version of the cache's files. This is increased whenever a change to
+# the files would stop them from being read correctly
+_cache_format_version = 1
+
+# The environment variable that enables the cache in a directory
+_cache_dir_env = 'SPORTYPY_CACHE_DIR'
+
+# The settings of the cache. The directory is None while the cache is
+# disabled, unless the environment variable is set
+_settings = {
+    'directory': None,
+    'max_bytes': 256 * 1024 * 1024
+}
+_settings_lock = threading.Lock()
+
+# The age (in seconds) after which coordinates without counts are assumed to
+# have been left behind, rather than to be waiting for their counts to be
+# written
+_orphan_age = 60.0
+
+
+def get_default_cache_dir():
+    """Get the default directory of the geometry cache.
+
+    Returns
+    -------
+    directory : str
+        The geometry directory within the user's cache directory (which is
+        $XDG_CACHE_HOME, or ~/.cache if that isn't set)
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'),
+        '.cache'
+    )
+
+    return os.path.join(cache_home, 'sportypy', 'geometry')
+
+
+def enable_geometry_cache(directory = None, max_bytes = None):
+    """Cache the geometry of surfaces on disk.
+
+    Parameters
+    ----------
+    directory : str or None (default: None)
+        The directory to store the cached geometry in. If None, the default
+        directory (~/.cache/sportypy/geometry) is used
+
+    max_bytes : int or None (default: None)
+        The most space (in bytes) that the cached geometry may take up. If
+        None, the current limit (256 MiB by default) is kept
+
+    Returns
+    -------
+    Nothing, but the cache is enabled
+    """
+    with _settings_lock:
+        _settings['directory'] = directory or get_default_cache_dir()
+
+        if max_bytes is not None:
+            _settings['max_bytes'] = max(int(max_bytes), 0)
+
+
+def disable_geometry_cache():
+    """Stop caching the geometry of surfaces on disk.
+
+    The geometry that's already cached is kept. If the SPORTYPY_CACHE_DIR
+    environment variable is set, it must also be unset to disable the cache
+
+    Returns
+    -------
+    Nothing, but the cache is disabled
+    """
+    with _settings_lock:
+        _settings['directory'] = None
+
+
+def get_cache_dir():
+    """Get the directory of the geometry cache.
+
+    Returns
+    -------
+    directory : str or None
+        The directory of the cache, or None if the cache is disabled
+    """
+    return _settings['directory'] or os.environ.get(_cache_dir_env) or None
+
+
+def clear_geometry_cache():
+    """Remove every surface from the geometry cache.
+
+    Returns
+    -------
+    Nothing, but the cached geometry is removed
+    """
+    directory = get_cache_dir()
+
+    if directory is None:
+        return
+
+    for path in glob.glob(os.path.join(directory, '*.npy')):
+        try:
+            os.remove(path)
+
+        except OSError:
+            pass
+
+
+def _get_cache_paths(directory, surface_key):
+    """Get the paths of the files that a surface is cached in.
+
+    Parameters
+    ----------
+    directory : str
+        The directory of the cache
+
+    surface_key : tuple
+        The key under which the surface's template is cached
+
+    Returns
+    -------
+    paths : tuple (str, str) or None
+        The paths of the surface's coordinates and of its features' numbers
+        of points, or None if the surface's key can't be hashed reliably
+    """
+    from sportypy import __version__
+
+    key = repr((_cache_format_version, __version__, surface_key))
+
+    # Parameters whose representation includes their address in memory
+    # change from one process to the next, so they can't be cached
+    if ' at 0x' in key:
+        return None
+
+    key_hash = hashlib.sha1(key.encode()).hexdigest()
+
+    return (
+        os.path.join(directory, f'{key_hash}.npy'),
+        os.path.join(directory, f'{key_hash}.counts.npy')
+    )
+
+
+def load_geometry(surface_key):
+    """Load a surface's cached geometry, if it's in the cache.
+
+    Parameters
+    ----------
+    surface_key : tuple
+        The key under which the surface's template is cached
+
+    Returns
+    -------
+    arrays : list of numpy.ndarray or None
+        Read-only, memory-mapped views of the coordinates of each of the
+        surface's features (in the order of its features followed by its
+        constraint), or None if the cache is disabled or doesn't have them
+    """
+    directory = get_cache_dir()
+
+    if directory is None or surface_key is None:
+        return None
+
+    paths = _get_cache_paths(directory, surface_key)
+
+    if paths is None:
+        return None
+
+    coords_path, counts_path = paths
+
+    # The counts are written last, so the coordinates are complete if the
+    # counts exist
+    try:
+        counts = np.load(counts_path)
+        coords = np.load(coords_path, mmap_mode = 'r')
+
+    except (FileNotFoundError, ValueError, OSError):
+        return None
+
+    # Mark the surface as recently used, so that it's evicted last
+    try:
+        os.utime(counts_path)
+
+    except OSError:
+        pass
+
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    return [
+        coords[start:stop]
+        for start, stop in zip(offsets[:-1].tolist(), offsets[1:].tolist())
+    ]
+
+
+def store_geometry(surface_key, arrays):
+    """Write a surface's geometry to the cache.
+
+    The files are written under temporary names and then renamed, so that
+    another process never reads a partially-written surface
+
+    Parameters
+    ----------
+    surface_key : tuple
+        The key under which the surface's template is cached
+
+    arrays : list of numpy.ndarray
+        The coordinates of each of the surface's features, in the order of
+        its features followed by its constraint
+
+    Returns
+    -------
+    Nothing, but the geometry is cached if the cache is enabled
+    """
+    directory = get_cache_dir()
+
+    if directory is None or surface_key is None:
+        return
+
+    paths = _get_cache_paths(directory, surface_key)
+
+    if paths is None:
+        return
+
+    coords_path, counts_path = paths
+    coords = np.concatenate(
+        [np.asarray(pts, dtype = np.float64).reshape(-1, 2) for pts in arrays]
+        or [np.empty((0, 2))]
+    )
+    counts = np.array([len(pts) for pts in arrays], dtype = np.int64)
+
+    try:
+        os.makedirs(directory, exist_ok = True)
+
+        for path, array in ((coords_path, coords), (counts_path, counts)):
+            temp_path = f'{path[:-4]}.{os.getpid()}.tmp'
+
+            with open(temp_path, 'wb') as f:
+                np.save(f, array)
+
+            os.replace(temp_path, path)
+
+    except OSError:
+        # The cache is only an optimization, so a cache that can't be written
+        # to is ignored
+        return
+
+    _evict(directory)
+
+
+def _evict(directory):
+    """Remove the least recently used surfaces until the cache fits its limit.
+
+    Coordinates whose counts are missing (because they couldn't be removed
+    along with their counts, or because another process is still writing
+    their counts) are removed once they're old enough that they can't be
+    being written
+
+    Parameters
+    ----------
+    directory : str
+        The directory of the cache
+
+    Returns
+    -------
+    Nothing, but surfaces may be removed from the cache
+    """
+    max_bytes = _settings['max_bytes']
+    now = time.time()
+
+    surfaces = []
+    total_bytes = 0
+    for coords_path in glob.glob(os.path.join(directory, '*.npy')):
+        if coords_path.endswith('.counts.npy'):
+            continue
+
+        counts_path = coords_path[:-len('.npy')] + '.counts.npy'
+
+        try:
+            if os.path.exists(counts_path):
+                size = (
+                    os.path.getsize(counts_path) +
+                    os.path.getsize(coords_path)
+                )
+                last_used = os.path.getmtime(counts_path)
+
+            else:
+                size = os.path.getsize(coords_path)
+                last_used = os.path.getmtime(coords_path)
+
+                if now - last_used > _orphan_age:
+                    os.remove(coords_path)
+                    continue
+
+        except OSError:
+            continue
+
+        surfaces.append((last_used, counts_path, coords_path, size))
+        total_bytes += size
+
+    for _, counts_path, coords_path, size in sorted(surfaces):
+        if total_bytes <= max_bytes:
+            break
+
+        # Remove the counts first, so that no process reads the coordinates
+        # while they're being removed. A file that can't be removed (such as
+        # one memory-mapped by another process on Windows) is left for a
+        # later eviction
+        removed = True
+        for path in (counts_path, coords_path):
+            try:
+                os.remove(path)
+
+            except FileNotFoundError:
+                pass
+
+            except OSError:
+                removed = False
+
+        if removed:
+            total_bytes -= size
@@ -0,0 +1,329 @@
+"""Read and write the precomputed geometry of a surface.
+
+A surface's features are written with their translated coordinates, so that
+other tools (and sportypy itself, through PrecomputedSurface) can draw the
+surface without computing any of its geometry. Two formats are supported:
+
+    GeoJSON : a FeatureCollection with one feature per surface feature. Each
+        feature's subpaths are the polygons of a MultiPolygon, and its colors,
+        z-order, and visibility are in its properties. Everything else that is
+        needed to draw the surface is under the collection's "sportypy" member
+
+    Binary : the magic bytes b'SPYGEOM1', the length of the index as a
+        little-endian uint32, the index itself (UTF-8 JSON, padded with spaces
+        to a multiple of four bytes), and then the coordinates of every
+        feature as interleaved x and y little-endian float32 values. The index
+        holds the same information as the GeoJSON "sportypy" member, and gives
+        each feature's offset and count (in points) into the coordinates. Rows
+        of nan separate a feature's subpaths
+
+@author: Ross Drucker
+"""
+import json
+import struct
+import numpy as np
+
+
+# The bytes that every binary geometry file starts with
+_binary_magic = b'SPYGEOM1'
+
+# The version of the geometry files. This is increased whenever a change to
+# the files would stop them from being read by older versions of sportypy
+_geometry_version = 1
+
+# The number of decimal places kept in GeoJSON coordinates
+_geojson_precision = 6
+
+
+def _to_json_value(value):
+    """Convert numpy scalars and arrays to values that JSON can encode."""
+    if isinstance(value, np.generic):
+        return value.item()
+
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+
+    raise TypeError(
+        f'Object of type {type(value).__name__} is not JSON serializable'
+    )
+
+
+def _feature_record(feature):
+    """Get everything but the coordinates that's needed to draw a feature.
+
+    Parameters
+    ----------
+    feature : BaseFeature
+        The feature to describe
+
+    Returns
+    -------
+    record : dict
+        The feature's class name, visibility, z-order, and plotting arguments
+    """
+    return {
+        'class': getattr(
+            feature,
+            'feature_class',
+            type(feature).__name__
+        ),
+        'visible': bool(getattr(feature, 'visible', True)),
+        'zorder': feature.plot_kwargs.get('zorder', 1),
+        'plot_kwargs': dict(feature.plot_kwargs)
+    }
+
+
+def _split_subpaths(pts):
+    """Split a feature's coordinates into its subpaths.
+
+    Parameters
+    ----------
+    pts : numpy.ndarray
+        The (N, 2) array of the feature's coordinates. Rows of nan separate
+        the subpaths
+
+    Returns
+    -------
+    subpaths : list of numpy.ndarray
+        The non-empty subpaths of the feature
+    """
+    breaks = np.flatnonzero(np.isnan(pts).any(axis = 1))
+    subpaths = np.split(pts, breaks)
+
+    # Every subpath after the first starts with the row of nan that preceded
+    # it
+    return [
+        subpath[np.isfinite(subpath).all(axis = 1)]
+        for subpath in subpaths
+        if np.isfinite(subpath).all(axis = 1).any()
+    ]
+
+
+def write_geojson(path, metadata, features, constraint):
+    """Write a surface's geometry as a GeoJSON FeatureCollection.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file to write
+
+    metadata : dict
+        Everything other than the features that is needed to draw the surface
+
+    features : list of BaseFeature
+        The features to write
+
+    constraint : BaseFeature or None
+        The surface's constraint, if it has one
+
+    Returns
+    -------
+    Nothing, but the file is written
+    """
+    geojson_features = []
+    for feature in features + ([constraint] if constraint else []):
+        polygons = []
+        for subpath in _split_subpaths(feature._translate_feature()):
+            # GeoJSON requires each ring to end where it starts. The first
+            # point is repeated even if the subpath is already closed, so that
+            # the subpath is read back unchanged
+            ring = np.round(subpath, _geojson_precision)
+            ring = np.vstack((ring, ring[:1]))
+
+            polygons.append([ring.tolist()])
+
+        properties = _feature_record(feature)
+        properties['constraint'] = feature is constraint
+
+        geojson_features.append({
+            'type': 'Feature',
+            'geometry': {
+                'type': 'MultiPolygon',
+                'coordinates': polygons
+            },
+            'properties': properties
+        })
+
+    collection = {
+        'type': 'FeatureCollection',
+        'features': geojson_features,
+        'sportypy': metadata
+    }
+
+    with open(path, 'w', encoding = 'utf-8') as f:
+        json.dump(
+            collection,
+            f,
+            default = _to_json_value,
+            separators = (',', ':')
+        )
+
+
+def write_binary(path, metadata, features, constraint):
+    """Write a surface's geometry as an indexed array of float32 coordinates.
+
+    Parameters
+    ----------
+    See write_geojson() for a description of each parameter
+
+    Returns
+    -------
+    Nothing, but the file is written
+    """
+    index = dict(metadata)
+    index['features'] = []
+    index['constraint'] = None
+
+    coordinates = []
+    offset = 0
+    for feature in features + ([constraint] if constraint else []):
+        pts = feature._translate_feature()
+
+        record = _feature_record(feature)
+        record['offset'] = offset
+        record['count'] = len(pts)
+
+        if feature is constraint:
+            index['constraint'] = record
+        else:
+            index['features'].append(record)
+
+        coordinates.append(pts)
+        offset += len(pts)
+
+    index_bytes = json.dumps(
+        index,
+        default = _to_json_value,
+        separators = (',', ':')
+    ).encode('utf-8')
+
+    # Pad the index so that the coordinates are aligned to four bytes, which
+    # lets them be viewed directly as a Float32Array in JavaScript
+    index_bytes += b' ' * (-(len(_binary_magic) + 4 + len(index_bytes)) % 4)
+
+    if coordinates:
+        coordinates = np.concatenate(coordinates)
+    else:
+        coordinates = np.empty((0, 2))
+
+    with open(path, 'wb') as f:
+        f.write(_binary_magic)
+        f.write(struct.pack('<I', len(index_bytes)))
+        f.write(index_bytes)
+        f.write(coordinates.astype('<f4').tobytes())
+
+
+def _read_geojson(path):
+    """Read a geometry file written by write_geojson().
+
+    See read_geometry() for a description of the parameters and returns
+    """
+    with open(path, 'r', encoding = 'utf-8') as f:
+        collection = json.load(f)
+
+    metadata = collection['sportypy']
+    features = []
+    constraint = None
+
+    for geojson_feature in collection['features']:
+        # Separate each polygon's ring with a row of nan, dropping the point
+        # added to close it
+        rings = []
+        for polygon in geojson_feature['geometry']['coordinates']:
+            if rings:
+                rings.append([[np.nan, np.nan]])
+
+            rings.append(polygon[0][:-1])
+
+        if rings:
+            pts = np.concatenate([
+                np.asarray(ring, dtype = np.float64).reshape(-1, 2)
+                for ring in rings
+            ])
+        else:
+            pts = np.empty((0, 2))
+
+        record = dict(geojson_feature['properties'])
+        is_constraint = record.pop('constraint', False)
+
+        if is_constraint:
+            constraint = (record, pts)
+        else:
+            features.append((record, pts))
+
+    return metadata, features, constraint
+
+
+def _read_binary(path):
+    """Read a geometry file written by write_binary().
+
+    See read_geometry() for a description of the parameters and returns
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    start = len(_binary_magic)
+    (index_length,) = struct.unpack_from('<I', data, start)
+    start += 4
+
+    metadata = json.loads(data[start:start + index_length].decode('utf-8'))
+    start += index_length
+
+    coordinates = np.frombuffer(data, dtype = '<f4', offset = start)
+    coordinates = coordinates.reshape(-1, 2)
+
+    def slice_record(record):
+        record = dict(record)
+        offset = record.pop('offset')
+        count = record.pop('count')
+
+        return record, coordinates[offset:offset + count]
+
+    features = [slice_record(record) for record in metadata.pop('features')]
+
+    constraint = metadata.pop('constraint')
+    if constraint is not None:
+        constraint = slice_record(constraint)
+
+    return metadata, features, constraint
+
+
+def read_geometry(path):
+    """Read a surface's geometry from a file in either format.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file to read. Its format is determined by its contents
+
+    Returns
+    -------
+    metadata : dict
+        Everything other than the features that is needed to draw the surface
+
+    features : list of tuple (dict, numpy.ndarray)
+        The record (see _feature_record()) and coordinates of each feature
+
+    constraint : tuple (dict, numpy.ndarray) or None
+        The record and coordinates of the surface's constraint, if it has one
+
+    Raises
+    ------
+    ValueError
+        If the file was written by a newer version of sportypy
+    """
+    with open(path, 'rb') as f:
+        is_binary = f.read(len(_binary_magic)) == _binary_magic
+
+    if is_binary:
+        metadata, features, constraint = _read_binary(path)
+    else:
+        metadata, features, constraint = _read_geojson(path)
+
+    if metadata.get('version', 0) > _geometry_version:
+        raise ValueError(
+            f'{path} was written by a newer version of sportypy, and uses ' +
+            f'version {metadata.get("version")} of the geometry format'
+        )
+
+    return metadata, features, constraint
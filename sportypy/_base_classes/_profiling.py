@@ -0,0 +1,326 @@
+"""Record where the time goes when a surface is drawn.
+
+Profiling is opt-in: a surface's enable_profiling() method turns it on, after
+which each call to the surface's draw() method records how long every feature
+spends in each stage of being drawn:
+
+    geometry : computing the feature's coordinates (_get_centered_feature())
+    translate : reflecting and shifting the coordinates into place
+    polygon : creating the feature's matplotlib Polygon
+    add_patch : adding the Polygon to the Axes
+
+Work that isn't done for any one feature is recorded against the surface
+itself, in these stages:
+
+    instantiate : creating the surface's features (or copying them from the
+        surface's cached template)
+    collection : drawing batched collections of features
+    remainder : the rest of the time taken by draw(), such as setting up the
+        Axes
+
+A surface that was copied from a cached template shares the template's
+geometry, which is computed the first time any copy of the template needs it.
+That work is attributed to the copy's features that it was computed for. Each
+stage's time excludes the time spent in any stage nested inside of it, so the
+times add up to the total time taken by draw().
+
+When profiling is off, each stage costs a single attribute lookup.
+
+@author: Ross Drucker
+"""
+import time
+import threading
+from functools import wraps
+from contextlib import nullcontext
+
+
+# The stages of drawing a feature, in the order that they happen
+draw_stages = ('geometry', 'translate', 'polygon', 'add_patch')
+
+# The profile of the draw() call that is in progress on the current thread, if
+# it is being profiled
+_state = threading.local()
+
+# The stage used when nothing is being profiled. This does nothing, and is
+# reused for every stage
+_null_stage = nullcontext()
+
+
+class _Stage:
+    """Time one stage of drawing a feature, excluding any nested stages."""
+
+    __slots__ = ('profile', 'key', 'start', 'nested')
+
+    def __init__(self, profile, key):
+        self.profile = profile
+        self.key = key
+
+    def __enter__(self):
+        self.nested = 0.0
+        self.profile._stack.append(self)
+        self.start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        self.profile._stack.pop()
+
+        # Time spent in this stage counts against the stage that contains it
+        if self.profile._stack:
+            self.profile._stack[-1].nested += elapsed
+
+        times = self.profile._times
+        times[self.key] = times.get(self.key, 0.0) + (elapsed - self.nested)
+
+        return False
+
+
+class DrawProfile:
+    """The time taken by each feature of a surface during a call to draw().
+
+    Attributes
+    ----------
+    surface : str
+        The name of the class of the surface that was drawn
+
+    total : float
+        The total time (in seconds) taken by the call to draw()
+
+    features : list of dict
+        One dictionary per feature of the surface, in the order that the
+        features were added to the surface. Each has the feature's 'index',
+        the name of its class under 'feature', its number of 'vertices', the
+        time (in seconds) spent in each stage, and the 'total' of those times
+
+    other : dict
+        The time (in seconds) spent in each stage of work that isn't done for
+        any one feature
+    """
+
+    def __init__(self, surface):
+        self.surface = type(surface).__name__
+        self.total = None
+        self.features = []
+        self.other = {}
+
+        # The features aren't looked up until draw() is done, since looking
+        # them up may instantiate them and compute their geometry
+        self._surface = surface
+        self._times = {}
+        self._stack = []
+
+    def _stage(self, feature, stage):
+        """Get a context manager that times a stage of drawing a feature."""
+        feature_id = None if feature is None else id(feature)
+
+        return _Stage(self, (feature_id, stage))
+
+    def _get_features(self):
+        """Get the features that the recorded times are attributed to.
+
+        Returns
+        -------
+        features : dict
+            The index of each of the surface's features and the features that
+            its times were recorded against, keyed by the id() of each of
+            those features. The features of a surface copied from a template
+            are also keyed by the id() of the template's features, whose
+            geometry they share
+        """
+        surface = self._surface
+        features = {
+            id(feature): (index, feature)
+            for index, feature in enumerate(surface._get_all_features())
+        }
+
+        template = surface.__dict__.get('_template')
+        if template is not None:
+            pairs = list(zip(template._features, surface._features))
+            constraint = surface.__dict__.get('_constraint')
+
+            if constraint is not None:
+                pairs.append((template._surface_constraint, constraint))
+
+            for template_feature, feature in pairs:
+                if id(feature) in features:
+                    features.setdefault(
+                        id(template_feature),
+                        features[id(feature)]
+                    )
+
+        return features
+
+    def _finish(self, total):
+        """Summarize the recorded times once the call to draw() is done.
+
+        Parameters
+        ----------
+        total : float
+            The total time (in seconds) taken by the call to draw()
+
+        Returns
+        -------
+        Nothing, but the profile's features and other attributes are set
+        """
+        self.total = total
+
+        # Combine the times recorded against each feature and against the
+        # template feature it was copied from
+        feature_times = {}
+        for feature_id, (index, feature) in self._get_features().items():
+            times = feature_times.setdefault(
+                index,
+                (feature, dict.fromkeys(draw_stages, 0.0))
+            )[1]
+
+            for stage in draw_stages:
+                times[stage] += self._times.pop((feature_id, stage), 0.0)
+
+        for index, (feature, stages) in sorted(feature_times.items()):
+            # The coordinates are cached once computed, so counting them
+            # doesn't add to the time taken to draw the surface
+            geometry_cache = getattr(feature, '_geometry_cache', None)
+            vertices = len(geometry_cache[1]) if geometry_cache else 0
+
+            self.features.append({
+                'index': index,
+                'feature': type(feature).__name__,
+                'vertices': vertices,
+                **stages,
+                'total': sum(stages.values())
+            })
+
+        # Anything left over wasn't done for any of the surface's features
+        for (_, stage), seconds in self._times.items():
+            self.other[stage] = self.other.get(stage, 0.0) + seconds
+
+        recorded = (
+            sum(feature['total'] for feature in self.features) +
+            sum(self.other.values())
+        )
+        self.other['remainder'] = max(total - recorded, 0.0)
+
+        self._surface = None
+        self._times = {}
+
+    def to_dict(self):
+        """Get the profile as a dictionary.
+
+        Returns
+        -------
+        profile : dict
+            The profile's surface, total, features, and other attributes
+        """
+        return {
+            'surface': self.surface,
+            'total': self.total,
+            'features': [dict(feature) for feature in self.features],
+            'other': dict(self.other)
+        }
+
+    def to_frame(self):
+        """Get the time taken by each feature as a pandas data frame.
+
+        Returns
+        -------
+        profile : pandas.DataFrame
+            One row per feature, with the columns described by the profile's
+            features attribute
+        """
+        import pandas as pd
+
+        return pd.DataFrame(
+            self.features,
+            columns = ['index', 'feature', 'vertices', *draw_stages, 'total']
+        )
+
+    def slowest(self, n = 5):
+        """Get the features that took the longest to draw.
+
+        Parameters
+        ----------
+        n : int (default: 5)
+            The number of features to return
+
+        Returns
+        -------
+        features : list of dict
+            The n slowest features, slowest first
+        """
+        return sorted(
+            self.features,
+            key = lambda feature: feature['total'],
+            reverse = True
+        )[:n]
+
+
+def stage(feature, name):
+    """Time a stage of drawing a feature, if a draw() call is being profiled.
+
+    Parameters
+    ----------
+    feature : BaseFeature or None
+        The feature being drawn, or None if the work isn't done for any one
+        feature
+
+    name : str
+        The name of the stage
+
+    Returns
+    -------
+    stage : context manager
+        A context manager that times the stage, or does nothing if nothing is
+        being profiled
+    """
+    profile = getattr(_state, 'profile', None)
+
+    if profile is None:
+        return _null_stage
+
+    return profile._stage(feature, name)
+
+
+def profiled_draw(draw_function):
+    """Profile a surface's draw() method, if its profiling is enabled.
+
+    Parameters
+    ----------
+    draw_function : callable
+        The surface's draw() method
+
+    Returns
+    -------
+    wrapper : callable
+        The draw() method, which stores a DrawProfile as the surface's
+        last_draw_profile attribute (and passes it to the surface's profiling
+        callback, if it has one) when profiling is enabled
+    """
+    @wraps(draw_function)
+    def wrapper(self, *args, **kwargs):
+        profiling = getattr(self, '_draw_profiling', None)
+
+        # A draw() call made while another is being profiled is part of that
+        # profile
+        if profiling is None or getattr(_state, 'profile', None) is not None:
+            return draw_function(self, *args, **kwargs)
+
+        profile = DrawProfile(self)
+        _state.profile = profile
+        start = time.perf_counter()
+
+        try:
+            result = draw_function(self, *args, **kwargs)
+
+        finally:
+            _state.profile = None
+
+        profile._finish(time.perf_counter() - start)
+        self.last_draw_profile = profile
+
+        if profiling['callback'] is not None:
+            profiling['callback'](profile)
+
+        return result
+
+    return wrapper
@@ -0,0 +1,181 @@
+"""Share a surface's computed geometry between processes.
+
+Every process that builds a surface computes and holds its own copy of the
+coordinates of each of the surface's features. A SharedGeometry publishes
+those coordinates once, in a block of shared memory, and other processes
+attach to it: each of their features' cached coordinates becomes a read-only
+view of the shared block, so nothing is computed or copied.
+
+Example
+-------
+>>> with NHLRink().share_geometry() as shared:
+...     # In each worker process (shared may be pickled)
+...     rink = NHLRink()
+...     rink.attach_geometry(shared)
+
+@author: Ross Drucker
+"""
+import numpy as np
+from multiprocessing import shared_memory
+
+
+def _attach_shared_memory(name):
+    """Attach to an existing block of shared memory without owning it.
+
+    From Python 3.13, the block is attached without registering it with the
+    process' resource tracker, so that it's never removed by this process.
+    Before then it is registered, which does nothing for processes started by
+    multiprocessing: they share the resource tracker of the process that
+    published the geometry, which already holds the block
+
+    Parameters
+    ----------
+    name : str
+        The name of the block of shared memory
+
+    Returns
+    -------
+    shm : multiprocessing.shared_memory.SharedMemory
+        The attached block of shared memory
+    """
+    try:
+        return shared_memory.SharedMemory(name = name, track = False)
+
+    except TypeError:
+        return shared_memory.SharedMemory(name = name)
+
+
+class SharedGeometry:
+    """The coordinates of a surface's features, held in shared memory.
+
+    This is created by a surface's share_geometry() method. The process that
+    creates it owns the shared memory, and should close() it (or use it as a
+    context manager) once no other process needs it. It may be pickled and
+    sent to other processes, which attach to the same memory
+
+    Attributes
+    ----------
+    name : str
+        The name of the block of shared memory
+
+    surface : str
+        The name of the class of the surface that published the geometry
+
+    layout : list of tuple (int, int)
+        The offset (in coordinates) and number of points of each feature's
+        coordinates in the block, in the order of the surface's features
+        followed by its constraint
+
+    surface_key : str or None (default: None)
+        The representation of the key under which the publishing surface was
+        cached, which identifies the parameters it was created with
+    """
+
+    def __init__(self, name, surface, layout, surface_key = None):
+        self.name = name
+        self.surface = surface
+        self.layout = layout
+        self.surface_key = surface_key
+        self._shm = None
+        self._is_owner = False
+
+    @classmethod
+    def publish(cls, surface):
+        """Copy the coordinates of a surface's features into shared memory.
+
+        Parameters
+        ----------
+        surface : BaseSurface
+            The surface whose geometry should be shared
+
+        Returns
+        -------
+        shared : SharedGeometry
+            The shared geometry, owned by the current process
+        """
+        all_pts = [
+            feature._translate_feature()
+            for feature in surface._get_all_features()
+        ]
+
+        layout = []
+        offset = 0
+        for pts in all_pts:
+            layout.append((offset, len(pts)))
+            offset += len(pts)
+
+        # Shared memory can't be empty, so always allocate at least one point
+        shm = shared_memory.SharedMemory(
+            create = True,
+            size = max(offset, 1) * 2 * np.dtype(np.float64).itemsize
+        )
+
+        block = np.ndarray((max(offset, 1), 2), np.float64, buffer = shm.buf)
+        for (start, count), pts in zip(layout, all_pts):
+            block[start:start + count] = pts
+
+        shared = cls(shm.name, type(surface).__name__, layout)
+        shared._shm = shm
+        shared._is_owner = True
+
+        return shared
+
+    def get_arrays(self):
+        """Get read-only views of each feature's coordinates.
+
+        Returns
+        -------
+        arrays : list of numpy.ndarray
+            The (N, 2) array of each feature's coordinates, in the order of
+            the layout
+        """
+        if self._shm is None:
+            self._shm = _attach_shared_memory(self.name)
+
+        n_points = max(sum(count for _, count in self.layout), 1)
+        block = np.ndarray((n_points, 2), np.float64, buffer = self._shm.buf)
+        block.setflags(write = False)
+
+        return [block[start:start + count] for start, count in self.layout]
+
+    def close(self):
+        """Release the shared memory.
+
+        The process that published the geometry also removes the shared
+        memory, after which no other process can attach to it. The views
+        returned by get_arrays() must not be used once this is called
+
+        Returns
+        -------
+        Nothing, but the shared memory is released
+        """
+        if self._shm is None:
+            return
+
+        self._shm.close()
+
+        if self._is_owner:
+            self._shm.unlink()
+
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+        return False
+
+    def __getstate__(self):
+        # Other processes attach to the shared memory themselves, and never
+        # own it
+        return {
+            'name': self.name,
+            'surface': self.surface,
+            'layout': self.layout,
+            'surface_key': self.surface_key
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
@@ -0,0 +1,630 @@
+"""Write surfaces directly to vector (SVG and PDF) files.
+
+Drawing a surface with matplotlib and saving it as a vector image turns every
+arc of every feature into the many short line segments used to trace it. The
+functions in this module instead walk a surface's features, recover the arcs
+in each feature's outline, and write them as true arcs (SVG) or cubic Bézier
+curves (PDF), so that the files are small and quick to render.
+
+Arcs are recovered from the features' coordinates rather than from each
+feature's parameters: BaseFeature.create_circle() spaces the points of an arc
+evenly, so every run of equally-long chords that turn by the same (small)
+angle is an arc, whose center and radius follow from the chords. An arc that
+is traced with fewer than three chords can't be told apart from a corner, so
+it's written as lines, which are already within the feature's arc tolerance.
+
+@author: Ross Drucker
+"""
+import math
+import numpy as np
+
+
+# The largest angle (in radians) between consecutive chords of an arc. Turns
+# sharper than this are corners (e.g. of a rectangle), not parts of an arc
+_max_arc_turn = math.pi / 4.0
+
+# The relative tolerance within which chords are considered to be of the same
+# length, and the tolerance (in radians) within which turns are considered to
+# be equal
+_chord_rtol = 1e-7
+_turn_atol = 1e-7
+
+
+def _outline_segments(pts):
+    """Convert a feature's outline to a list of line and arc segments.
+
+    Parameters
+    ----------
+    pts : numpy.ndarray
+        The (N, 2) array of the feature's coordinates. Rows of nan separate
+        the outline's subpaths
+
+    Returns
+    -------
+    segments : list of tuple
+        The segments that make up the outline. These are ('M', x, y) to start
+        a subpath, ('L', x, y) for a line to a point, ('A', cx, cy, r, start,
+        end) for an arc of a circle from one angle to another, and ('Z',) to
+        close a subpath
+    """
+    segments = []
+
+    # Split the outline into its subpaths
+    is_missing = np.isnan(pts).any(axis = 1)
+    breaks = np.flatnonzero(is_missing)
+    starts = np.concatenate(([0], breaks + 1))
+    stops = np.concatenate((breaks, [len(pts)]))
+
+    for start, stop in zip(starts, stops):
+        subpath = pts[start:stop]
+
+        if len(subpath) < 2:
+            continue
+
+        segments.append(('M', subpath[0, 0], subpath[0, 1]))
+        segments.extend(_subpath_segments(subpath))
+        segments.append(('Z',))
+
+    return segments
+
+
+def _subpath_segments(pts):
+    """Find the lines and arcs that trace a subpath.
+
+    Parameters
+    ----------
+    pts : numpy.ndarray
+        The (N, 2) array of the subpath's coordinates
+
+    Returns
+    -------
+    segments : list of tuple
+        The segments that trace the subpath after its first point. See
+        _outline_segments() for a description of each segment
+    """
+    # Repeated points (where the pieces of an outline meet) would otherwise
+    # be drawn as lines of no length, and would split the arcs around them
+    is_repeated = np.concatenate((
+        [False],
+        (np.diff(pts, axis = 0) == 0.0).all(axis = 1)
+    ))
+    pts = pts[~is_repeated]
+
+    chords = np.diff(pts, axis = 0)
+    lengths = np.hypot(chords[:, 0], chords[:, 1])
+
+    # The angle through which each chord turns from the one before it
+    turns = np.arctan2(
+        (chords[:-1, 0] * chords[1:, 1]) - (chords[:-1, 1] * chords[1:, 0]),
+        (chords[:-1, 0] * chords[1:, 0]) + (chords[:-1, 1] * chords[1:, 1])
+    )
+
+    segments = []
+    n_chords = len(chords)
+    i = 0
+    while i < n_chords:
+        # Extend the arc beginning with this chord for as long as the chords
+        # are the same length and turn by the same angle
+        j = i
+        if i < n_chords - 1 and 0.0 < abs(turns[i]) <= _max_arc_turn:
+            while (
+                j < n_chords - 1 and
+                abs(turns[j] - turns[i]) <= _turn_atol and
+                abs(lengths[j + 1] - lengths[i]) <= _chord_rtol * lengths[i]
+            ):
+                j += 1
+
+        # An arc must be made of at least three chords to be distinguished
+        # from a corner
+        if j - i >= 2:
+            step = turns[i]
+            radius = lengths[i] / (2.0 * math.sin(abs(step) / 2.0))
+
+            # The center lies to the left of the chords if they turn
+            # counterclockwise, and to the right otherwise
+            direction = chords[i] / lengths[i]
+            normal = np.array([-direction[1], direction[0]])
+            if step < 0.0:
+                normal = -normal
+
+            midpoint = (pts[i] + pts[i + 1]) / 2.0
+            center = midpoint + (
+                normal * radius * math.cos(abs(step) / 2.0)
+            )
+
+            start_angle = math.atan2(
+                pts[i, 1] - center[1],
+                pts[i, 0] - center[0]
+            )
+            end_angle = start_angle + (step * (j - i + 1))
+
+            segments.append((
+                'A',
+                center[0],
+                center[1],
+                radius,
+                start_angle,
+                end_angle
+            ))
+
+            i = j + 1
+
+        else:
+            segments.append(('L', pts[i + 1, 0], pts[i + 1, 1]))
+            i += 1
+
+    return segments
+
+
+def _split_arc(start, end, max_sweep):
+    """Split an arc into pieces that each sweep through at most a given angle.
+
+    Parameters
+    ----------
+    start : float
+        The angle (in radians) at which the arc starts
+
+    end : float
+        The angle (in radians) at which the arc ends
+
+    max_sweep : float
+        The largest angle (in radians) that each piece may sweep through
+
+    Returns
+    -------
+    angles : numpy.ndarray
+        The angles at which the pieces start and end, from start to end
+    """
+    n_pieces = max(int(math.ceil(abs(end - start) / max_sweep - 1e-9)), 1)
+
+    return np.linspace(start, end, n_pieces + 1)
+
+
+def _resolve_color(color):
+    """Convert a matplotlib color to a hex string.
+
+    Parameters
+    ----------
+    color : str, tuple, or None
+        The color. Hex strings are used as-is, so matplotlib is only imported
+        to convert other colors
+
+    Returns
+    -------
+    color : str or None
+        The color as a hex string, or None if the color is empty
+    """
+    if color is None:
+        return None
+
+    if isinstance(color, str):
+        if color.lower() == 'none':
+            return None
+
+        if color.startswith('#'):
+            return color
+
+    from matplotlib.colors import to_hex
+
+    return to_hex(color, keep_alpha = True)
+
+
+def _feature_style(plot_kwargs):
+    """Get the fill, stroke, and opacity with which to draw a feature.
+
+    Colors are resolved the same way as when the feature is drawn as a
+    matplotlib Polygon
+
+    Parameters
+    ----------
+    plot_kwargs : dict
+        The feature's plotting arguments
+
+    Returns
+    -------
+    style : dict
+        The feature's 'fill' and 'stroke' colors (as hex strings, or None to
+        not fill or stroke the feature), its 'linewidth' (in points), and its
+        'alpha'
+    """
+    color = plot_kwargs.get('color')
+
+    facecolor = plot_kwargs.get('facecolor', plot_kwargs.get('fc', color))
+    if facecolor is None:
+        import matplotlib as mpl
+        facecolor = mpl.rcParams['patch.facecolor']
+
+    if not plot_kwargs.get('fill', True):
+        facecolor = None
+
+    edgecolor = plot_kwargs.get('edgecolor', plot_kwargs.get('ec', color))
+
+    linewidth = plot_kwargs.get('linewidth', plot_kwargs.get('lw'))
+    if linewidth is None:
+        linewidth = 1.0
+
+    alpha = plot_kwargs.get('alpha')
+
+    return {
+        'fill': _resolve_color(facecolor),
+        'stroke': _resolve_color(edgecolor),
+        'linewidth': float(linewidth),
+        'alpha': 1.0 if alpha is None else float(alpha)
+    }
+
+
+def _fmt(value):
+    """Format a number compactly for a vector file."""
+    text = f'{value:.4f}'.rstrip('0').rstrip('.')
+
+    return '0' if text in ('', '-0') else text
+
+
+def _svg_path_data(segments):
+    """Convert a feature's segments to the data of an SVG path.
+
+    Parameters
+    ----------
+    segments : list of tuple
+        The segments of the feature's outline. See _outline_segments()
+
+    Returns
+    -------
+    path_data : str
+        The path's data (the "d" attribute of an SVG path element)
+    """
+    commands = []
+
+    for segment in segments:
+        if segment[0] in ('M', 'L'):
+            commands.append(
+                f'{segment[0]}{_fmt(segment[1])} {_fmt(segment[2])}'
+            )
+
+        elif segment[0] == 'A':
+            _, cx, cy, r, start, end = segment
+
+            # Each piece sweeps through at most half of a circle, so none of
+            # them are large arcs, and a full circle is still drawn
+            angles = _split_arc(start, end, math.pi)
+            sweep = 1 if end > start else 0
+            for angle in angles[1:]:
+                commands.append(
+                    f'A{_fmt(r)} {_fmt(r)} 0 0 {sweep} ' +
+                    f'{_fmt(cx + r * math.cos(angle))} ' +
+                    f'{_fmt(cy + r * math.sin(angle))}'
+                )
+
+        else:
+            commands.append('Z')
+
+    return ''.join(commands)
+
+
+def _pdf_path_ops(segments):
+    """Convert a feature's segments to PDF path construction operators.
+
+    Parameters
+    ----------
+    segments : list of tuple
+        The segments of the feature's outline. See _outline_segments()
+
+    Returns
+    -------
+    ops : str
+        The PDF operators that construct the path
+    """
+    ops = []
+
+    for segment in segments:
+        if segment[0] == 'M':
+            ops.append(f'{_fmt(segment[1])} {_fmt(segment[2])} m')
+
+        elif segment[0] == 'L':
+            ops.append(f'{_fmt(segment[1])} {_fmt(segment[2])} l')
+
+        elif segment[0] == 'A':
+            _, cx, cy, r, start, end = segment
+
+            # Approximate each quarter (or smaller piece) of the arc with a
+            # cubic Bézier curve
+            angles = _split_arc(start, end, math.pi / 2.0)
+            for theta0, theta1 in zip(angles[:-1], angles[1:]):
+                k = (4.0 / 3.0) * math.tan((theta1 - theta0) / 4.0) * r
+                x0 = cx + (r * math.cos(theta0))
+                y0 = cy + (r * math.sin(theta0))
+                x3 = cx + (r * math.cos(theta1))
+                y3 = cy + (r * math.sin(theta1))
+                x1 = x0 - (k * math.sin(theta0))
+                y1 = y0 + (k * math.cos(theta0))
+                x2 = x3 + (k * math.sin(theta1))
+                y2 = y3 - (k * math.cos(theta1))
+
+                ops.append(
+                    ' '.join(_fmt(v) for v in (x1, y1, x2, y2, x3, y3)) +
+                    ' c'
+                )
+
+        else:
+            ops.append('h')
+
+    return '\n'.join(ops)
+
+
+def _get_drawn_features(surface):
+    """Get the surface's visible polygon features in the order they're drawn.
+
+    Parameters
+    ----------
+    surface : BaseSurface
+        The surface whose features should be drawn
+
+    Returns
+    -------
+    features : list
+        The surface's visible features, sorted by their zorder. Features that
+        draw themselves as something other than a polygon (like logos) are
+        left out
+    """
+    from sportypy._base_classes._base_feature import BaseFeature
+
+    features = [
+        feature for feature in surface._features
+        if getattr(feature, 'visible', True) and
+        type(feature).draw is BaseFeature.draw
+    ]
+
+    # Matplotlib draws patches in order of their zorder, keeping the order in
+    # which they were added among those with the same zorder
+    return sorted(
+        features,
+        key = lambda feature: feature.plot_kwargs.get('zorder', 1)
+    )
+
+
+def _get_page_transform(surface, extent):
+    """Get the affine transform from the surface's coordinates to the page.
+
+    Parameters
+    ----------
+    surface : BaseSurface
+        The surface being written
+
+    extent : tuple (float, float, float, float)
+        The (xmin, xmax, ymin, ymax) limits of the displayed region
+
+    Returns
+    -------
+    matrix : numpy.ndarray
+        The 3x3 matrix that rotates the surface's coordinates and shifts them
+        so that the displayed region starts at (0, 0)
+    """
+    matrix = np.identity(3)
+    if surface._rotation is not None:
+        matrix = np.array(surface._rotation.get_matrix(), dtype = np.float64)
+
+    shift = np.identity(3)
+    shift[0, 2] = -extent[0]
+    shift[1, 2] = -extent[2]
+
+    return shift @ matrix
+
+
+def write_svg(surface, width, extent, background):
+    """Write a surface's features as an SVG image.
+
+    Parameters
+    ----------
+    surface : BaseSurface
+        The surface to write
+
+    width : float
+        The width of the image, in pixels
+
+    extent : tuple (float, float, float, float)
+        The (xmin, xmax, ymin, ymax) limits of the displayed region
+
+    background : str or None
+        The color of the image's background, or None for a transparent
+        background
+
+    Returns
+    -------
+    svg : str
+        The SVG document
+    """
+    span_x = extent[1] - extent[0]
+    span_y = extent[3] - extent[2]
+    height = width * span_y / span_x
+    px_per_unit = width / span_x
+
+    # SVG's y axis points down, so the surface is flipped over the x axis
+    matrix = _get_page_transform(surface, extent)
+    flip = np.diag([1.0, -1.0, 1.0])
+    flip[1, 2] = span_y
+    matrix = flip @ matrix
+
+    lines = [
+        '<svg xmlns="http://www.w3.org/2000/svg" ' +
+        f'width="{_fmt(width)}" height="{_fmt(height)}" ' +
+        f'viewBox="0 0 {_fmt(span_x)} {_fmt(span_y)}">'
+    ]
+
+    background = _resolve_color(background)
+    if background is not None:
+        lines.append(
+            f'<rect width="{_fmt(span_x)}" height="{_fmt(span_y)}" ' +
+            f'fill="{background}"/>'
+        )
+
+    lines.append(
+        '<g transform="matrix(' +
+        ' '.join(_fmt(v) for v in (
+            matrix[0, 0], matrix[1, 0], matrix[0, 1],
+            matrix[1, 1], matrix[0, 2], matrix[1, 2]
+        )) +
+        ')" stroke-linejoin="miter">'
+    )
+
+    for feature in _get_drawn_features(surface):
+        segments = _outline_segments(feature._translate_feature())
+        if not segments:
+            continue
+
+        style = _feature_style(feature.plot_kwargs)
+
+        attributes = [
+            f'd="{_svg_path_data(segments)}"',
+            f'fill="{style["fill"] or "none"}"'
+        ]
+
+        # Line widths are in points, regardless of the size of the surface
+        if style['stroke'] is not None and style['linewidth'] > 0.0:
+            stroke_width = style['linewidth'] * (96.0 / 72.0) / px_per_unit
+            attributes.append(f'stroke="{style["stroke"]}"')
+            attributes.append(f'stroke-width="{_fmt(stroke_width)}"')
+
+        if style['alpha'] < 1.0:
+            attributes.append(f'opacity="{_fmt(style["alpha"])}"')
+
+        lines.append(f'<path {" ".join(attributes)}/>')
+
+    lines.append('</g>')
+    lines.append('</svg>')
+
+    return '\n'.join(lines) + '\n'
+
+
+def write_pdf(surface, width, extent, background):
+    """Write a surface's features as a single-page PDF document.
+
+    Parameters
+    ----------
+    surface : BaseSurface
+        The surface to write
+
+    width : float
+        The width of the page, in points
+
+    extent : tuple (float, float, float, float)
+        The (xmin, xmax, ymin, ymax) limits of the displayed region
+
+    background : str or None
+        The color of the page's background, or None for no background
+
+    Returns
+    -------
+    pdf : bytes
+        The PDF document
+    """
+    span_x = extent[1] - extent[0]
+    span_y = extent[3] - extent[2]
+    height = width * span_y / span_x
+    pt_per_unit = width / span_x
+
+    scale = np.diag([pt_per_unit, pt_per_unit, 1.0])
+    matrix = scale @ _get_page_transform(surface, extent)
+
+    def rgb(color):
+        color = color.lstrip('#')
+        return ' '.join(
+            _fmt(int(color[i:i + 2], 16) / 255.0) for i in (0, 2, 4)
+        )
+
+    content = []
+    alphas = {}
+
+    background = _resolve_color(background)
+    if background is not None:
+        content.append(
+            f'{rgb(background)} rg 0 0 {_fmt(width)} {_fmt(height)} re f'
+        )
+
+    # Draw the features in the surface's coordinates
+    content.append('q')
+    content.append(
+        ' '.join(_fmt(v) for v in (
+            matrix[0, 0], matrix[1, 0], matrix[0, 1],
+            matrix[1, 1], matrix[0, 2], matrix[1, 2]
+        )) + ' cm'
+    )
+
+    for feature in _get_drawn_features(surface):
+        segments = _outline_segments(feature._translate_feature())
+        if not segments:
+            continue
+
+        style = _feature_style(feature.plot_kwargs)
+        is_filled = style['fill'] is not None
+        is_stroked = (
+            style['stroke'] is not None and style['linewidth'] > 0.0
+        )
+
+        if not is_filled and not is_stroked:
+            continue
+
+        content.append('q')
+
+        if style['alpha'] < 1.0:
+            name = alphas.setdefault(style['alpha'], f'GS{len(alphas)}')
+            content.append(f'/{name} gs')
+
+        if is_filled:
+            content.append(f'{rgb(style["fill"])} rg')
+
+        if is_stroked:
+            content.append(f'{rgb(style["stroke"])} RG')
+            content.append(f'{_fmt(style["linewidth"] / pt_per_unit)} w')
+
+        content.append(_pdf_path_ops(segments))
+        content.append({
+            (True, True): 'B',
+            (True, False): 'f',
+            (False, True): 'S'
+        }[(is_filled, is_stroked)])
+        content.append('Q')
+
+    content.append('Q')
+    stream = '\n'.join(content).encode('latin-1')
+
+    ext_g_states = ' '.join(
+        f'/{name} << /ca {_fmt(alpha)} /CA {_fmt(alpha)} >>'
+        for alpha, name in alphas.items()
+    )
+
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        (
+            '<< /Type /Page /Parent 2 0 R ' +
+            f'/MediaBox [0 0 {_fmt(width)} {_fmt(height)}] ' +
+            f'/Resources << /ExtGState << {ext_g_states} >> >> ' +
+            '/Contents 4 0 R >>'
+        ).encode('latin-1'),
+        (
+            f'<< /Length {len(stream)} >>\nstream\n'.encode('latin-1') +
+            stream +
+            b'\nendstream'
+        ),
+    ]
+
+    # Assemble the document, keeping track of where each object starts for
+    # the cross-reference table
+    pdf = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, obj in enumerate(objects, start = 1):
+        offsets.append(len(pdf))
+        pdf += f'{number} 0 obj\n'.encode('latin-1') + obj + b'\nendobj\n'
+
+    xref_offset = len(pdf)
+    pdf += f'xref\n0 {len(objects) + 1}\n'.encode('latin-1')
+    pdf += b'0000000000 65535 f \n'
+    for offset in offsets:
+        pdf += f'{offset:010d} 00000 n \n'.encode('latin-1')
+
+    pdf += (
+        f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n' +
+        f'startxref\n{xref_offset}\n%%EOF\n'
+    ).encode('latin-1')
+
+    return bytes(pdf)
@@ -0,0 +1,753 @@
+"""Render many plots over the same surface across multiple processes.
+
+Generating a chart for every player on every team means drawing the same
+surface thousands of times. The functions in this module spread that work
+across a pool of worker processes: each worker builds the surface (and
+rasterizes it) only once, then reuses it for every chart that it's given, and
+writes each chart to disk itself so that no figures need to be sent back to
+the parent process.
+
+Example
+-------
+>>> from sportypy.batch import render_batch
+>>> from sportypy.surfaces.hockey import NHLRink
+>>> charts = [
+...     {
+...         'path': f'charts/{player}.png',
+...         'kind': 'scatter',
+...         'x': shots['x'],
+...         'y': shots['y']
+...     }
+...     for player, shots in shots_by_player.items()
+... ]
+>>> render_batch(NHLRink, charts, max_workers = 8)
+
+Long tracking replays are rendered the same way by render_replay(), which
+splits the replay's frames into chunks, writes each chunk as its own video
+segment (or set of PNG files) in a worker process, and joins the segments
+once they're all written:
+
+>>> from sportypy.batch import render_replay
+>>> render_replay(
+...     NHLRink,
+...     frames,
+...     'game.mp4',
+...     animation_kwargs = {'fps': 30},
+...     max_workers = 8
+... )
+
+@author: Ross Drucker
+"""
+import os
+import json
+import hashlib
+import tempfile
+import subprocess
+import matplotlib as mpl
+from matplotlib.figure import Figure
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+
+# The plotting methods of a surface that a chart may use
+_plot_kinds = ('scatter', 'hexbin', 'heatmap', 'contourf')
+
+# The surface and drawing options used by the current worker process. These
+# are set once when the worker starts, and reused for each of its charts
+_worker_state = {}
+
+
+def _build_worker_surface(surface_class, surface_kwargs, shared_geometry):
+    """Build a worker's surface, attaching it to any shared geometry.
+
+    Parameters
+    ----------
+    surface_class : type
+        The class of the surface to build
+
+    surface_kwargs : dict
+        The keyword arguments to use when creating the surface
+
+    shared_geometry : SharedGeometry or None
+        The coordinates of the surface's features published by the parent
+        process, if they were shared
+
+    Returns
+    -------
+    surface : BaseSurface
+        The worker's surface
+    """
+    surface = surface_class(**surface_kwargs)
+
+    if shared_geometry is not None:
+        surface.attach_geometry(shared_geometry)
+
+    return surface
+
+
+def _share_geometry(surface_class, surface_kwargs, share_geometry):
+    """Publish a surface's geometry for worker processes, if requested.
+
+    Parameters
+    ----------
+    See render_batch() for a description of each parameter
+
+    Returns
+    -------
+    shared_geometry : SharedGeometry or None
+        The published geometry, or None if it isn't to be shared
+    """
+    if not share_geometry:
+        return None
+
+    return surface_class(**surface_kwargs).share_geometry()
+
+
+def _iter_bounded(executor, function, tasks, max_in_flight):
+    """Run tasks in a pool of workers, with only a few submitted at a time.
+
+    Submitting every task up front would queue all of their arguments (such
+    as every chart's data, or every chunk of a replay's frames) at once, so
+    a new task is only taken from tasks once an earlier one is complete
+
+    Parameters
+    ----------
+    executor : concurrent.futures.Executor
+        The pool of workers to run the tasks in
+
+    function : callable
+        The function to call with each task
+
+    tasks : iterable
+        The argument of each call to the function. This is only advanced as
+        tasks are submitted, so it may be a generator
+
+    max_in_flight : int
+        The most tasks to have submitted but not yet completed at once
+
+    Yields
+    ------
+    result : object
+        The result of each task, in the order in which they're completed
+    """
+    pending = iter(tasks)
+    in_flight = set()
+
+    while True:
+        for task in pending:
+            in_flight.add(executor.submit(function, task))
+
+            if len(in_flight) >= max_in_flight:
+                break
+
+        if not in_flight:
+            break
+
+        done, in_flight = wait(in_flight, return_when = FIRST_COMPLETED)
+
+        for future in done:
+            yield future.result()
+
+
+def _init_worker(surface_class, surface_kwargs, draw_kwargs, figsize, dpi,
+                 use_background, shared_geometry = None):
+    """Build the surface that a worker process draws each chart on.
+
+    Parameters
+    ----------
+    See render_batch() for a description of each parameter. shared_geometry
+    is the geometry published by the parent process, if it was shared
+
+    Returns
+    -------
+    Nothing, but the worker's state is set
+    """
+    _worker_state['surface'] = _build_worker_surface(
+        surface_class,
+        surface_kwargs,
+        shared_geometry
+    )
+    _worker_state['draw_kwargs'] = draw_kwargs
+    _worker_state['figsize'] = figsize
+    _worker_state['dpi'] = dpi
+    _worker_state['use_background'] = use_background
+
+
+def _render_chart(chart):
+    """Draw a single chart on the worker's surface and save it to disk.
+
+    Parameters
+    ----------
+    chart : dict
+        The chart to draw. See render_batch() for more information
+
+    Returns
+    -------
+    path : str
+        The path to which the chart was saved
+    """
+    chart = dict(chart)
+    path = chart.pop('path')
+    layers = chart.pop('layers', None)
+    savefig_kwargs = chart.pop('savefig_kwargs', {})
+
+    # A chart with only one layer may describe that layer itself
+    if layers is None:
+        layers = [chart]
+
+    surface = _worker_state['surface']
+    draw_kwargs = _worker_state['draw_kwargs']
+
+    # Draw the chart without pyplot so that no figures are kept open by the
+    # worker
+    fig = Figure(
+        figsize = _worker_state['figsize'],
+        dpi = _worker_state['dpi']
+    )
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(1, 1, 1)
+
+    # The rasterized surface is cached, so only the first chart that a worker
+    # draws needs to render the surface's features
+    if _worker_state['use_background']:
+        surface.draw_background(ax = ax, **draw_kwargs)
+    else:
+        surface.draw(ax = ax, **draw_kwargs)
+
+    for layer in layers:
+        layer = dict(layer)
+        kind = layer.pop('kind', 'scatter')
+
+        if kind not in _plot_kinds:
+            raise ValueError(
+                f'kind must be one of {", ".join(_plot_kinds)}, not {kind}'
+            )
+
+        getattr(surface, kind)(ax = ax, **layer)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok = True)
+
+    fig.savefig(path, **savefig_kwargs)
+
+    return path
+
+
+def _render_charts(task):
+    """Draw a group of charts on the worker's surface and save them to disk.
+
+    Parameters
+    ----------
+    task : tuple (int, list of dict)
+        The index of the group's first chart, and the charts to draw
+
+    Returns
+    -------
+    task : tuple (int, list of str)
+        The index of the group's first chart, and the paths to which its
+        charts were saved
+    """
+    start, charts = task
+
+    return start, [_render_chart(chart) for chart in charts]
+
+
+def _group_charts(charts, chunksize):
+    """Split the charts into groups of consecutive charts.
+
+    Parameters
+    ----------
+    charts : iterable of dict
+        The charts to group. These are only read as the groups are needed
+
+    chunksize : int
+        The number of charts in each group
+
+    Yields
+    ------
+    task : tuple (int, list of dict)
+        The index of the group's first chart, and the group's charts
+    """
+    group = []
+    start = 0
+
+    for index, chart in enumerate(charts):
+        if not group:
+            start = index
+
+        group.append(chart)
+
+        if len(group) >= chunksize:
+            yield start, group
+            group = []
+
+    if group:
+        yield start, group
+
+
+def render_batch(surface_class, charts, surface_kwargs = None,
+                 draw_kwargs = None, figsize = None, dpi = None,
+                 use_background = True, max_workers = None, chunksize = 1,
+                 share_geometry = False):
+    """Draw many charts over the same surface in parallel.
+
+    Parameters
+    ----------
+    surface_class : type
+        The class of the surface to draw the charts on (e.g. NHLRink)
+
+    charts : iterable of dict
+        The charts to draw. Each chart is a dictionary with the path to save
+        the chart to under 'path' and its data layers under 'layers'. Each
+        layer is a dictionary naming the surface's plotting method to use
+        (one of 'scatter', 'hexbin', 'heatmap', or 'contourf') under 'kind',
+        along with the keyword arguments to pass to that method (e.g. 'x' and
+        'y'). A chart with only one layer may instead contain that layer's
+        keys itself. Any keyword arguments to pass to matplotlib's savefig()
+        function may be included under 'savefig_kwargs'
+
+    surface_kwargs : dict or None (default: None)
+        Any keyword arguments to use when creating the surface
+
+    draw_kwargs : dict or None (default: None)
+        Any keyword arguments to pass to the surface's draw() method (or its
+        draw_background() method)
+
+    figsize : tuple (float, float) or None (default: None)
+        The size (in inches) of each chart. If None, matplotlib's default
+        figure size is used
+
+    dpi : float or None (default: None)
+        The resolution (in dots per inch) of each chart. If None, matplotlib's
+        default resolution is used
+
+    use_background : bool (default: True)
+        Whether to draw the surface as a cached, pre-rendered image (see the
+        surface's draw_background() method). If False, the surface's features
+        are drawn for every chart
+
+    max_workers : int or None (default: None)
+        The number of worker processes to use. If None, one worker is used per
+        CPU. If 1, the charts are drawn in the current process
+
+    chunksize : int (default: 1)
+        The number of charts to send to a worker at a time. Larger values
+        reduce the overhead of distributing many small charts. Only about two
+        groups of charts per worker are sent ahead of time, so charts may be
+        a generator that loads each chart's data as it's needed
+
+    share_geometry : bool (default: False)
+        Whether to compute the surface's geometry once, in this process, and
+        share it with the workers through shared memory (see the surface's
+        share_geometry() method). This saves each worker from computing and
+        holding its own copy of the geometry
+
+    Returns
+    -------
+    paths : list of str
+        The paths to which the charts were saved, in the same order as the
+        charts
+    """
+    initargs = (
+        surface_class,
+        surface_kwargs or {},
+        draw_kwargs or {},
+        figsize or tuple(mpl.rcParams['figure.figsize']),
+        dpi or mpl.rcParams['figure.dpi'],
+        use_background
+    )
+
+    # Drawing in the current process is useful for debugging, and avoids the
+    # overhead of starting any workers for small batches
+    if max_workers == 1:
+        _init_worker(*initargs)
+
+        return [_render_chart(chart) for chart in charts]
+
+    shared_geometry = _share_geometry(
+        surface_class,
+        initargs[1],
+        share_geometry
+    )
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers = max_workers,
+            initializer = _init_worker,
+            initargs = (*initargs, shared_geometry)
+        ) as executor:
+            # Keep about two groups of charts per worker in flight, so that
+            # each worker has its next group waiting when it finishes one
+            max_in_flight = 2 * (max_workers or os.cpu_count() or 1)
+            groups = dict(_iter_bounded(
+                executor,
+                _render_charts,
+                _group_charts(charts, max(int(chunksize), 1)),
+                max_in_flight
+            ))
+
+        return [path for start in sorted(groups) for path in groups[start]]
+
+    finally:
+        if shared_geometry is not None:
+            shared_geometry.close()
+
+
+# The name of the file that records how a replay was split into chunks, so
+# that an interrupted replay is only resumed with the same chunks
+_replay_manifest = 'manifest.json'
+
+
+def _init_replay_worker(surface_class, surface_kwargs, frames,
+                        animation_kwargs, shared_geometry = None):
+    """Build the surface that a worker process renders replay frames over.
+
+    Parameters
+    ----------
+    See render_replay() for a description of each parameter. shared_geometry
+    is the geometry published by the parent process, if it was shared
+
+    Returns
+    -------
+    Nothing, but the worker's state is set
+    """
+    _worker_state['surface'] = _build_worker_surface(
+        surface_class,
+        surface_kwargs,
+        shared_geometry
+    )
+    _worker_state['frames'] = frames
+    _worker_state['animation_kwargs'] = animation_kwargs
+
+
+def _render_segment(task):
+    """Render one chunk of a replay's frames.
+
+    The chunk's video segment is written under a temporary name and only
+    renamed once it's complete, so an interrupted chunk is never mistaken for
+    a finished one
+
+    Parameters
+    ----------
+    task : tuple (int, int, int, str, str, list or None)
+        The chunk's index, the indices of its first frame and of the frame
+        after its last, the path to write to, the path of the file that marks
+        the chunk as complete, and the chunk's frames. If the frames are None,
+        they're loaded with the replay's frame-loading function
+
+    Returns
+    -------
+    index : int
+        The index of the chunk that was completed
+    """
+    index, start, stop, path, done_path, frames = task
+    surface = _worker_state['surface']
+
+    if frames is None:
+        frames = _worker_state['frames'](start, stop)
+
+    if '{' in path:
+        surface.write_animation(
+            frames,
+            path,
+            first_frame = start,
+            **_worker_state['animation_kwargs']
+        )
+
+    else:
+        root, ext = os.path.splitext(path)
+        partial_path = f'{root}.partial{ext}'
+        surface.write_animation(
+            frames,
+            partial_path,
+            **_worker_state['animation_kwargs']
+        )
+        os.replace(partial_path, path)
+
+    with open(done_path, 'w', encoding = 'utf-8') as f:
+        f.write(f'{start} {stop}\n')
+
+    return index
+
+
+def _concatenate_segments(segment_paths, path, work_dir):
+    """Join video segments into a single video without re-encoding them.
+
+    Parameters
+    ----------
+    segment_paths : list of str
+        The paths of the segments, in order
+
+    path : str
+        The path of the video to write
+
+    work_dir : str
+        The directory in which to write the list of segments for ffmpeg
+
+    Returns
+    -------
+    Nothing, but the video is written
+    """
+    list_path = os.path.join(work_dir, 'segments.txt')
+    with open(list_path, 'w', encoding = 'utf-8') as f:
+        for segment_path in segment_paths:
+            escaped = os.path.abspath(segment_path).replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+
+    subprocess.run(
+        [
+            mpl.rcParams['animation.ffmpeg_path'], '-y', '-loglevel', 'error',
+            '-f', 'concat', '-safe', '0', '-i', list_path,
+            '-c', 'copy', str(path)
+        ],
+        check = True
+    )
+
+
+def render_replay(surface_class, frames, path, n_frames = None,
+                  chunk_size = 1800, surface_kwargs = None,
+                  animation_kwargs = None, max_workers = None,
+                  work_dir = None, resume = True, progress = None,
+                  share_geometry = False):
+    """Render a long tracking replay in parallel, one chunk at a time.
+
+    The replay's frames are split into chunks of consecutive frames. Each
+    worker process builds the surface once, then renders each chunk it's given
+    with the surface's write_animation() method. Video chunks are written as
+    segments and joined in order (without being re-encoded) once they're all
+    written. Chunks that were completed by an earlier, interrupted call are
+    skipped, so a replay can be resumed by calling this again
+
+    Parameters
+    ----------
+    surface_class : type
+        The class of the surface to render the replay over (e.g. NHLRink)
+
+    frames : sequence or callable
+        The replay's frames. See the surface's animate() method for what
+        makes up a frame. This may be a sequence of frames (anything that
+        supports len() and slicing), or a function that takes the indices of
+        a chunk's first frame and of the frame after its last and returns
+        the chunk's frames. A function (which must be defined at the top
+        level of a module) lets each worker load only its own frames, rather
+        than having them sent to it by this process
+
+    path : str
+        The path to write to. A path with a '{frame}' field writes each frame
+        as its own PNG file, and any other path is the video to write. See
+        the surface's write_animation() method for more information
+
+    n_frames : int or None (default: None)
+        The number of frames in the replay. This is required if frames is a
+        function
+
+    chunk_size : int (default: 1800)
+        The number of frames in each chunk
+
+    surface_kwargs : dict or None (default: None)
+        Any keyword arguments to use when creating the surface
+
+    animation_kwargs : dict or None (default: None)
+        Any keyword arguments to pass to the surface's write_animation()
+        method (e.g. fps, styles, width, display_range). Every chunk must be
+        written the same way for the segments to be joined
+
+    max_workers : int or None (default: None)
+        The number of worker processes to use. If None, one worker is used per
+        CPU. If 1, the chunks are rendered in the current process
+
+    work_dir : str or None (default: None)
+        The directory in which to keep the video segments and the record of
+        which chunks are complete. If None, this is the path of the video
+        with '.parts' added to it. For PNG files, it's a directory (named
+        after the path) in the system's temporary directory instead, so that
+        the directory of the PNG files only holds frames. This isn't removed
+        once the replay is written, so that a replay may be resumed (or its
+        segments reused)
+
+    resume : bool (default: True)
+        Whether to skip the chunks that were completed by an earlier call. The
+        earlier call must have split the replay into the same chunks, and used
+        the same surface, surface_kwargs, and animation_kwargs. If False,
+        every chunk is rendered again
+
+    progress : callable or None (default: None)
+        A function to call each time a chunk is completed (or skipped). It is
+        passed the number of chunks completed so far and the total number of
+        chunks
+
+    share_geometry : bool (default: False)
+        Whether to share the surface's geometry with the workers through
+        shared memory. See render_batch() for more information
+
+    Returns
+    -------
+    path : str
+        The path of the video, or the pattern of the PNG files' paths
+
+    Raises
+    ------
+    ValueError
+        If the number of frames isn't known, or if work_dir holds the chunks
+        of a replay that was split or drawn differently
+    """
+    if n_frames is None:
+        if callable(frames):
+            raise ValueError('n_frames is required when frames is a function')
+
+        n_frames = len(frames)
+
+    animation_kwargs = dict(animation_kwargs or {})
+    is_png = '{' in str(path)
+
+    if work_dir is None:
+        if is_png:
+            # The directory is named after the path, so that the same replay
+            # finds it again when it's resumed
+            path_hash = hashlib.sha1(
+                os.path.abspath(str(path)).encode()
+            ).hexdigest()
+            work_dir = os.path.join(
+                tempfile.gettempdir(),
+                f'sportypy-replay-{path_hash[:16]}'
+            )
+
+        else:
+            work_dir = f'{path}.parts'
+
+    os.makedirs(work_dir, exist_ok = True)
+
+    png_dir = os.path.dirname(str(path))
+    if is_png and png_dir:
+        os.makedirs(png_dir, exist_ok = True)
+
+    # Only resume a replay that was split into the same chunks and drawn the
+    # same way, so that every segment matches. The surface and the settings
+    # used to draw it are recorded as a hash, since they may not be JSON
+    settings = json.dumps(
+        [
+            f'{surface_class.__module__}.{surface_class.__qualname__}',
+            surface_kwargs or {},
+            animation_kwargs
+        ],
+        sort_keys = True,
+        default = repr
+    )
+    manifest = {
+        'n_frames': n_frames,
+        'chunk_size': chunk_size,
+        'settings': hashlib.sha1(settings.encode()).hexdigest()
+    }
+    manifest_path = os.path.join(work_dir, _replay_manifest)
+
+    if resume and os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding = 'utf-8') as f:
+            previous = json.load(f)
+
+        if previous != manifest:
+            if previous.get('settings') != manifest['settings']:
+                difference = 'drawn with a different surface or settings'
+
+            else:
+                difference = (
+                    f'of {previous.get("n_frames")} frames in chunks of ' +
+                    f'{previous.get("chunk_size")}'
+                )
+
+            raise ValueError(
+                f'{work_dir} holds a replay {difference}. Use another ' +
+                'work_dir, or pass resume = False to start over'
+            )
+
+    with open(manifest_path, 'w', encoding = 'utf-8') as f:
+        json.dump(manifest, f)
+
+    ext = os.path.splitext(str(path))[1]
+    tasks = []
+    segment_paths = []
+    for index, start in enumerate(range(0, n_frames, chunk_size)):
+        stop = min(start + chunk_size, n_frames)
+        segment_path = (
+            str(path) if is_png
+            else os.path.join(work_dir, f'segment_{index:05d}{ext}')
+        )
+        done_path = os.path.join(work_dir, f'chunk_{index:05d}.done')
+
+        segment_paths.append(segment_path)
+        tasks.append((index, start, stop, segment_path, done_path))
+
+    n_chunks = len(tasks)
+
+    # Skip the chunks that are already complete
+    if resume:
+        remaining = [task for task in tasks if not os.path.exists(task[4])]
+
+    else:
+        remaining = tasks
+
+    completed = n_chunks - len(remaining)
+    if progress is not None and completed:
+        progress(completed, n_chunks)
+
+    # A sequence of frames is sent to the workers one chunk at a time (and
+    # only sliced when its chunk is submitted), while a function that loads
+    # the frames is given to each worker up front
+    is_loader = callable(frames)
+    initargs = (
+        surface_class,
+        surface_kwargs or {},
+        frames if is_loader else None,
+        animation_kwargs
+    )
+
+    def with_frames(task):
+        start, stop = task[1], task[2]
+        return (*task, None if is_loader else frames[start:stop])
+
+    if max_workers == 1:
+        _init_replay_worker(*initargs)
+
+        for task in remaining:
+            _render_segment(with_frames(task))
+            completed += 1
+
+            if progress is not None:
+                progress(completed, n_chunks)
+
+    elif remaining:
+        shared_geometry = _share_geometry(
+            surface_class,
+            initargs[1],
+            share_geometry
+        )
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers = max_workers,
+                initializer = _init_replay_worker,
+                initargs = (*initargs, shared_geometry)
+            ) as executor:
+                # Keep only about one chunk per worker in flight, so that
+                # the frames of a long replay aren't all queued at once
+                max_in_flight = max_workers or os.cpu_count() or 1
+
+                for _ in _iter_bounded(
+                    executor,
+                    _render_segment,
+                    (with_frames(task) for task in remaining),
+                    max_in_flight
+                ):
+                    completed += 1
+
+                    if progress is not None:
+                        progress(completed, n_chunks)
+
+        finally:
+            if shared_geometry is not None:
+                shared_geometry.close()
+
+    if not is_png and segment_paths:
+        _concatenate_segments(segment_paths, path, work_dir)
+
+    return path
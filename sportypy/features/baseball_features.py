@@ -10,7 +10,6 @@ baseball surfaces.
 """
 import math
 import numpy as np
-import pandas as pd
 from sportypy._base_classes._base_feature import BaseFeature
 
 
@@ -49,11 +48,35 @@ class BaseBaseballFeature(BaseFeature):
 class FieldConstraint(BaseBaseballFeature):
     """Constraint of the field.
 
-    This is simply a pass statement due to the irregular shape of baseball
-    fields.
+    Due to the irregular shape of baseball fields, the field is not
+    constrained. This feature has no coordinates, and every point is
+    considered to be inside of it.
     """
 
-    pass
+    def _get_centered_feature(self):
+        return np.empty((0, 2))
+
+    def contains(self, x, y):
+        """Determine which points lie inside of the field.
+
+        Parameters
+        ----------
+        x : float or array-like
+            The x coordinate(s) of the points
+
+        y : float or array-like
+            The y coordinate(s) of the points
+
+        Returns
+        -------
+        is_inside : numpy.ndarray
+            A boolean array that is True for every point whose coordinates
+            aren't missing
+        """
+        x = np.ravel(x)
+        y = np.ravel(y)
+
+        return ~(np.isnan(x) | np.isnan(y))
 
 
 class HomePlate(BaseBaseballFeature):
@@ -70,8 +93,8 @@ class HomePlate(BaseBaseballFeature):
         super().__init__(*args, **kwargs)
     
     def _get_centered_feature(self):
-        home_plate_df = pd.DataFrame({
-            'x': [
+        home_plate_pts = self.create_points(
+            x = [
                 0.0,
                 -self.home_plate_side_length / 2.0,
                 -self.home_plate_side_length / 2.0,
@@ -80,7 +103,7 @@ class HomePlate(BaseBaseballFeature):
                 0.0
             ],
 
-            'y': [
+            y = [
                 0.0,
                 np.sqrt(1 - ((self.home_plate_side_length / 2.0) ** 2)),
                 np.sqrt(1 - ((self.home_plate_side_length / 2.0) ** 2)) +
@@ -90,9 +113,9 @@ class HomePlate(BaseBaseballFeature):
                 np.sqrt(1 - ((self.home_plate_side_length / 2.0) ** 2)),
                 0.0
             ]
-        })
+        )
         
-        return home_plate_df
+        return home_plate_pts
 
 
 class Base(BaseBaseballFeature):
@@ -114,10 +137,10 @@ class Base(BaseBaseballFeature):
         lengths.
         """
 
-        base_df = self.create_diamond(
+        base_pts = self.create_diamond(
             height = self.base_side_length * np.sqrt(2) * 0.5,
             width = self.base_side_length * np.sqrt(2) * 0.5
         )
 
-        return base_df
+        return base_pts
 
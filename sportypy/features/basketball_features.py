@@ -10,7 +10,6 @@ consistent across all basketball surfaces.
 """
 import math
 import numpy as np
-import pandas as pd
 from sportypy._base_classes._base_feature import BaseFeature
 
 
@@ -70,14 +69,36 @@ class CourtConstraint(BaseBasketballFeature):
     """
 
     def _get_centered_feature(self):
-        court_constraint_df = self.create_rectangle(
+        court_constraint_pts = self.create_rectangle(
             x_min = -self.half_court_length,
             x_max = self.half_court_length,
             y_min = -self.half_court_width,
             y_max = self.half_court_width
         )
 
-        return court_constraint_df
+        return court_constraint_pts
+
+    def contains(self, x, y):
+        """Determine which points lie inside of the court.
+
+        Parameters
+        ----------
+        x : float or array-like
+            The x coordinate(s) of the points
+
+        y : float or array-like
+            The y coordinate(s) of the points
+
+        Returns
+        -------
+        is_inside : numpy.ndarray
+            A boolean array that is True for the points that lie inside of (or
+            on the boundary of) the court
+        """
+        dx = np.abs(np.ravel(x) - self.x_anchor)
+        dy = np.abs(np.ravel(y) - self.y_anchor)
+
+        return (dx <= self.half_court_length) & (dy <= self.half_court_width)
 
 
 class HalfCourt(BaseBasketballFeature):
@@ -103,14 +124,14 @@ class HalfCourt(BaseBasketballFeature):
             halfcourt_xmin = 0.0
             halfcourt_xmax = self.half_court_length
 
-        half_court_df = self.create_rectangle(
+        half_court_pts = self.create_rectangle(
             x_min = halfcourt_xmin,
             x_max = halfcourt_xmax,
             y_min = -self.half_court_width,
             y_max = self.half_court_width
         )
 
-        return half_court_df
+        return half_court_pts
 
 
 class CenterCircleOutline(BaseBasketballFeature):
@@ -124,16 +145,16 @@ class CenterCircleOutline(BaseBasketballFeature):
     def _get_centered_feature(self):
         # The circle should be created as a half-ring with the appropriate
         # thickness
-        center_circle_df = pd.concat([
-            pd.DataFrame({
-                'x': [
+        center_circle_pts = np.concatenate([
+            self.create_points(
+                x = [
                     0
                 ],
 
-                'y': [
+                y = [
                     self.feature_radius
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (0, 0),
@@ -142,17 +163,17 @@ class CenterCircleOutline(BaseBasketballFeature):
                 r = self.feature_radius
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     0,
                     0
                 ],
 
-                'y': [
+                y = [
                     -self.feature_radius,
                     -self.feature_radius + self.feature_thickness
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (0, 0),
@@ -161,18 +182,18 @@ class CenterCircleOutline(BaseBasketballFeature):
                 r = self.feature_radius - self.feature_thickness
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     0
                 ],
 
-                'y': [
+                y = [
                     self.feature_radius
                 ]
-            })
+            )
         ])
 
-        return center_circle_df
+        return center_circle_pts
 
 
 class CenterCircleFill(BaseBasketballFeature):
@@ -186,14 +207,14 @@ class CenterCircleFill(BaseBasketballFeature):
     def _get_centered_feature(self):
         # The circle should be created as a half-ring with the appropriate
         # thickness
-        center_circle_df = self.create_circle(
+        center_circle_pts = self.create_circle(
             center = (0, 0),
             start = 0.5,
             end = -0.5,
             r = self.feature_radius - self.feature_thickness
         )
 
-        return center_circle_df
+        return center_circle_pts
 
 
 class DivisionLine(BaseBasketballFeature):
@@ -203,14 +224,14 @@ class DivisionLine(BaseBasketballFeature):
     """
 
     def _get_centered_feature(self):
-        time_line_df = self.create_rectangle(
+        time_line_pts = self.create_rectangle(
             x_min = -self.feature_thickness / 2.0,
             x_max = self.feature_thickness / 2.0,
             y_min = -self.half_court_width,
             y_max = self.half_court_width
         )
 
-        return time_line_df
+        return time_line_pts
 
 
 class EndLine(BaseBasketballFeature):
@@ -222,14 +243,14 @@ class EndLine(BaseBasketballFeature):
     """
 
     def _get_centered_feature(self):
-        end_line_df = self.create_rectangle(
+        end_line_pts = self.create_rectangle(
             x_min = 0,
             x_max = self.feature_thickness,
             y_min = -self.half_court_width - self.feature_thickness,
             y_max = self.half_court_width + self.feature_thickness
         )
 
-        return end_line_df
+        return end_line_pts
 
 
 class SideLine(BaseBasketballFeature):
@@ -241,14 +262,14 @@ class SideLine(BaseBasketballFeature):
     """
 
     def _get_centered_feature(self):
-        side_line_df = self.create_rectangle(
+        side_line_pts = self.create_rectangle(
             x_min = -self.half_court_length - self.feature_thickness,
             x_max = self.half_court_length + self.feature_thickness,
             y_min = 0.0,
             y_max = self.feature_thickness
         )
 
-        return side_line_df
+        return side_line_pts
 
 
 class CourtApron(BaseBasketballFeature):
@@ -269,8 +290,8 @@ class CourtApron(BaseBasketballFeature):
     def _get_centered_feature(self):
         # The court's apron extends beyond the boundaries of the court's
         # playing surface
-        apron_df = pd.DataFrame({
-            'x': [
+        apron_pts = self.create_points(
+            x = [
                 0,
                 self.half_court_length + self.baseline_extension,
                 self.half_court_length + self.baseline_extension,
@@ -282,7 +303,7 @@ class CourtApron(BaseBasketballFeature):
                 0
             ],
 
-            'y': [
+            y = [
                 self.half_court_width + self.sideline_extension,
                 self.half_court_width + self.sideline_extension,
                 -self.half_court_width - self.sideline_extension,
@@ -293,9 +314,9 @@ class CourtApron(BaseBasketballFeature):
                 self.half_court_width,
                 self.half_court_width + self.sideline_extension
             ]
-        })
+        )
 
-        return apron_df
+        return apron_pts
 
 
 class ThreePointLine(BaseBasketballFeature):
@@ -348,16 +369,16 @@ class ThreePointLine(BaseBasketballFeature):
         start_angle_inner = -math.asin(start_y_inner / radius_inner) / np.pi
         end_angle_inner = -start_angle_inner
 
-        three_point_line_df = pd.concat([
-            pd.DataFrame({
-                'x': [
+        three_point_line_pts = np.concatenate([
+            self.create_points(
+                x = [
                     0.0
                 ],
 
-                'y': [
+                y = [
                     self.feature_width / 2.0
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (self.basket_to_baseline_dist, 0.0),
@@ -366,17 +387,17 @@ class ThreePointLine(BaseBasketballFeature):
                 r = radius_outer
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     0.0,
                     0.0
                 ],
 
-                'y': [
+                y = [
                     -self.feature_width / 2.0,
                     -(self.feature_width / 2.0) + self.feature_thickness
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (self.basket_to_baseline_dist, 0.0),
@@ -385,20 +406,20 @@ class ThreePointLine(BaseBasketballFeature):
                 r = radius_inner
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     0.0,
                     0.0
                 ],
 
-                'y': [
+                y = [
                     (self.feature_width / 2.0) - self.feature_thickness,
                     self.feature_width / 2.0
                 ]
-            })
+            )
         ])
 
-        return three_point_line_df
+        return three_point_line_pts
 
 
 class TwoPointRange(BaseBasketballFeature):
@@ -445,16 +466,16 @@ class TwoPointRange(BaseBasketballFeature):
         start_angle_inner = -math.asin(start_y_inner / radius_inner) / np.pi
         end_angle_inner = -start_angle_inner
 
-        two_point_range_df = pd.concat([
-            pd.DataFrame({
-                'x': [
+        two_point_range_pts = np.concatenate([
+            self.create_points(
+                x = [
                     0.0
                 ],
 
-                'y': [
+                y = [
                     -(self.feature_width / 2.0) + self.feature_thickness
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (self.basket_to_baseline_dist, 0.0),
@@ -463,18 +484,18 @@ class TwoPointRange(BaseBasketballFeature):
                 r = radius_inner
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     0.0
                 ],
 
-                'y': [
+                y = [
                     (self.feature_width / 2.0) - self.feature_thickness
                 ]
-            })
+            )
         ])
 
-        return two_point_range_df
+        return two_point_range_pts
 
 
 class FreeThrowLaneBoundary(BaseBasketballFeature):
@@ -492,8 +513,8 @@ class FreeThrowLaneBoundary(BaseBasketballFeature):
         super().__init__(*args, **kwargs)
 
     def _get_centered_feature(self):
-        free_throw_lane_boundary_df = pd.DataFrame({
-            'x': [
+        free_throw_lane_boundary_pts = self.create_points(
+            x = [
                 self.half_court_length,
                 self.half_court_length - self.lane_length,
                 self.half_court_length - self.lane_length,
@@ -507,7 +528,7 @@ class FreeThrowLaneBoundary(BaseBasketballFeature):
                 self.half_court_length
             ],
 
-            'y': [
+            y = [
                 self.lane_width / 2.0,
                 self.lane_width / 2.0,
                 -(self.lane_width / 2.0),
@@ -518,9 +539,9 @@ class FreeThrowLaneBoundary(BaseBasketballFeature):
                 (self.lane_width / 2.0) - self.feature_thickness,
                 self.lane_width / 2.0
             ]
-        })
+        )
 
-        return free_throw_lane_boundary_df
+        return free_throw_lane_boundary_pts
 
 
 class FreeThrowCircleOutline(BaseBasketballFeature):
@@ -568,7 +589,7 @@ class FreeThrowCircleOutline(BaseBasketballFeature):
             (self.feature_thickness / 2.0)
         y_cent = 0.0
 
-        free_throw_circle_df = pd.concat([
+        free_throw_circle_pts = np.concatenate([
             self.create_circle(
                 center = (x_cent, y_cent),
                 start = start_angle,
@@ -584,7 +605,7 @@ class FreeThrowCircleOutline(BaseBasketballFeature):
             )
         ])
 
-        return free_throw_circle_df
+        return free_throw_circle_pts
 
 
 class FreeThrowCircleOutlineDash(BaseBasketballFeature):
@@ -610,7 +631,7 @@ class FreeThrowCircleOutlineDash(BaseBasketballFeature):
             (self.feature_thickness / 2.0)
         y_cent = 0
 
-        free_throw_circle_df = pd.concat([
+        free_throw_circle_pts = np.concatenate([
             self.create_circle(
                 center = (x_cent, y_cent),
                 start = self.start_angle,
@@ -626,7 +647,7 @@ class FreeThrowCircleOutlineDash(BaseBasketballFeature):
             )
         ])
 
-        return free_throw_circle_df
+        return free_throw_circle_pts
 
 
 class Paint(BaseBasketballFeature):
@@ -644,7 +665,7 @@ class Paint(BaseBasketballFeature):
         super().__init__(*args, **kwargs)
 
     def _get_centered_feature(self):
-        paint_df = self.create_rectangle(
+        paint_pts = self.create_rectangle(
             x_min = (self.half_court_length) - self.lane_length +
             self.feature_thickness,
             x_max = (self.half_court_length),
@@ -652,7 +673,7 @@ class Paint(BaseBasketballFeature):
             y_max = (self.lane_width / 2.0) - self.feature_thickness
         )
 
-        return paint_df
+        return paint_pts
 
 
 class Block(BaseBasketballFeature):
@@ -671,14 +692,14 @@ class Block(BaseBasketballFeature):
         super().__init__(*args, **kwargs)
 
     def _get_centered_feature(self):
-        block_df = self.create_rectangle(
+        block_pts = self.create_rectangle(
             x_min = -self.block_length / 2.0,
             x_max = self.block_length / 2.0,
             y_min = -self.block_width / 2.0,
             y_max = self.block_width / 2.0
         )
 
-        return block_df
+        return block_pts
 
 
 class RestrictedArc(BaseBasketballFeature):
@@ -696,16 +717,16 @@ class RestrictedArc(BaseBasketballFeature):
         super().__init__(*args, **kwargs)
 
     def _get_centered_feature(self):
-        restricted_arc_df = pd.concat([
-            pd.DataFrame({
-                'x': [
+        restricted_arc_pts = np.concatenate([
+            self.create_points(
+                x = [
                     self.backboard_face_x
                 ],
 
-                'y': [
+                y = [
                     self.feature_radius
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (self.basket_center_x, 0.0),
@@ -714,17 +735,17 @@ class RestrictedArc(BaseBasketballFeature):
                 r = self.feature_radius
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     self.backboard_face_x,
                     self.backboard_face_x
                 ],
 
-                'y': [
+                y = [
                     -self.feature_radius,
                     -self.feature_radius + self.feature_thickness
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (self.basket_center_x, 0.0),
@@ -733,20 +754,20 @@ class RestrictedArc(BaseBasketballFeature):
                 r = self.feature_radius - self.feature_thickness
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     self.backboard_face_x,
                     self.backboard_face_x
                 ],
 
-                'y': [
+                y = [
                     self.feature_radius - self.feature_thickness,
                     self.feature_radius
                 ]
-            })
+            )
         ])
 
-        return restricted_arc_df
+        return restricted_arc_pts
 
 
 class Backboard(BaseBasketballFeature):
@@ -763,14 +784,14 @@ class Backboard(BaseBasketballFeature):
         super().__init__(*args, **kwargs)
 
     def _get_centered_feature(self):
-        backboard_df = self.create_rectangle(
+        backboard_pts = self.create_rectangle(
             x_min = 0.0,
             x_max = self.feature_thickness,
             y_min = -self.feature_width / 2.0,
             y_max = self.feature_width / 2.0
         )
 
-        return backboard_df
+        return backboard_pts
 
 
 class CoachesBox(BaseBasketballFeature):
@@ -790,7 +811,7 @@ class CoachesBox(BaseBasketballFeature):
 
     def _get_centered_feature(self):
         if self.extension_direction == 'inward':
-            coaches_box_df = self.create_rectangle(
+            coaches_box_pts = self.create_rectangle(
                 x_min = 0.0,
                 x_max = self.feature_thickness,
                 y_min = -self.feature_width,
@@ -798,7 +819,7 @@ class CoachesBox(BaseBasketballFeature):
             )
 
         elif self.extension_direction == 'outward':
-            coaches_box_df = self.create_rectangle(
+            coaches_box_pts = self.create_rectangle(
                 x_min = 0.0,
                 x_max = self.feature_thickness,
                 y_min = 0.0,
@@ -806,14 +827,14 @@ class CoachesBox(BaseBasketballFeature):
             )
 
         else:
-            coaches_box_df = self.create_rectangle(
+            coaches_box_pts = self.create_rectangle(
                 x_min = 0.0,
                 x_max = self.feature_thickness,
                 y_min = -self.feature_width / 2.0,
                 y_max = self.feature_width / 2.0
             )
 
-        return coaches_box_df
+        return coaches_box_pts
 
 
 class SubstitutionArea(BaseBasketballFeature):
@@ -830,14 +851,14 @@ class SubstitutionArea(BaseBasketballFeature):
         super().__init__(*args, **kwargs)
 
     def _get_centered_feature(self):
-        coaches_box_df = self.create_rectangle(
+        coaches_box_pts = self.create_rectangle(
             x_min = 0.0,
             x_max = self.feature_thickness,
             y_min = 0.0,
             y_max = self.feature_width
         )
 
-        return coaches_box_df
+        return coaches_box_pts
 
 
 class BasketRing(BaseBasketballFeature):
@@ -870,19 +891,19 @@ class BasketRing(BaseBasketballFeature):
         start_angle = np.pi - start_angle
         end_angle = -start_angle
 
-        basket_ring_df = pd.concat([
-            pd.DataFrame({
-                'x': [
+        basket_ring_pts = np.concatenate([
+            self.create_points(
+                x = [
                     self.backboard_face_x,
                     self.basket_center_x +
                     (self.feature_radius * math.cos(start_angle))
                 ],
 
-                'y': [
+                y = [
                     half_extension_width,
                     half_extension_width
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (self.basket_center_x, 0.0),
@@ -891,23 +912,23 @@ class BasketRing(BaseBasketballFeature):
                 r = self.feature_radius + self.feature_thickness
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     self.basket_center_x +
                     (self.feature_radius * math.cos(start_angle)),
                     self.backboard_face_x,
                     self.backboard_face_x
                 ],
 
-                'y': [
+                y = [
                     -half_extension_width,
                     -half_extension_width,
                     half_extension_width
                 ]
-            }),
+            ),
         ])
 
-        return basket_ring_df
+        return basket_ring_pts
 
 
 class Net(BaseBasketballFeature):
@@ -923,14 +944,14 @@ class Net(BaseBasketballFeature):
         super().__init__(*args, **kwargs)
 
     def _get_centered_feature(self):
-        net_df = self.create_circle(
+        net_pts = self.create_circle(
             center = (self.basket_center_x, 0.0),
             start = 0.0,
             end = 2.0,
             r = self.feature_radius
         )
 
-        return net_df
+        return net_pts
 
 
 class DefensiveBoxMark(BaseBasketballFeature):
@@ -949,14 +970,14 @@ class DefensiveBoxMark(BaseBasketballFeature):
         super().__init__(*args, **kwargs)
 
     def _get_centered_feature(self):
-        defensive_box_mark_df = self.create_rectangle(
+        defensive_box_mark_pts = self.create_rectangle(
             x_min = -self.mark_length,
             x_max = 0.0,
             y_min = 0.0,
             y_max = self.mark_width
         )
 
-        return defensive_box_mark_df
+        return defensive_box_mark_pts
 
 
 class TeamBenchArea(BaseBasketballFeature):
@@ -976,7 +997,7 @@ class TeamBenchArea(BaseBasketballFeature):
 
     def _get_centered_feature(self):
         if self.extension_direction == 'inward':
-            team_bench_df = self.create_rectangle(
+            team_bench_pts = self.create_rectangle(
                 x_min = 0.0,
                 x_max = self.feature_thickness,
                 y_min = -self.feature_width,
@@ -984,7 +1005,7 @@ class TeamBenchArea(BaseBasketballFeature):
             )
 
         elif self.extension_direction == 'outward':
-            team_bench_df = self.create_rectangle(
+            team_bench_pts = self.create_rectangle(
                 x_min = 0.0,
                 x_max = self.feature_thickness,
                 y_min = 0.0,
@@ -992,14 +1013,14 @@ class TeamBenchArea(BaseBasketballFeature):
             )
 
         else:
-            team_bench_df = self.create_rectangle(
+            team_bench_pts = self.create_rectangle(
                 x_min = 0.0,
                 x_max = self.feature_thickness,
                 y_min = -self.feature_width / 2.0,
                 y_max = self.feature_width / 2.0
             )
 
-        return team_bench_df
+        return team_bench_pts
 
 
 class ThrowInLine(BaseBasketballFeature):
@@ -1019,7 +1040,7 @@ class ThrowInLine(BaseBasketballFeature):
 
     def _get_centered_feature(self):
         if self.extension_direction == 'outward':
-            throw_in_line_df = self.create_rectangle(
+            throw_in_line_pts = self.create_rectangle(
                 x_min = 0.0,
                 x_max = self.feature_thickness,
                 y_min = -self.feature_width,
@@ -1027,7 +1048,7 @@ class ThrowInLine(BaseBasketballFeature):
             )
 
         elif self.extension_direction == 'inward':
-            throw_in_line_df = self.create_rectangle(
+            throw_in_line_pts = self.create_rectangle(
                 x_min = 0.0,
                 x_max = self.feature_thickness,
                 y_min = 0.0,
@@ -1035,11 +1056,11 @@ class ThrowInLine(BaseBasketballFeature):
             )
 
         else:
-            throw_in_line_df = self.create_rectangle(
+            throw_in_line_pts = self.create_rectangle(
                 x_min = 0.0,
                 x_max = self.feature_thickness,
                 y_min = -self.feature_width / 2.0,
                 y_max = self.feature_width / 2.0
             )
 
-        return throw_in_line_df
+        return throw_in_line_pts
@@ -10,7 +10,6 @@ hockey surfaces.
 """
 import math
 import numpy as np
-import pandas as pd
 from sportypy._base_classes._base_feature import BaseFeature
 
 
@@ -54,13 +53,13 @@ class BaseHockeyFeature(BaseFeature):
         self.feature_thickness = feature_thickness
         super().__init__(*args, **kwargs)
 
-    def _reflect(self, df, over_x = False, over_y = True):
-        """Reflect a data frame's coordinates over the desired axes.
+    def _reflect(self, pts, over_x = False, over_y = True):
+        """Reflect an array of coordinates over the desired axes.
 
         Parameters
         ----------
-        df : pandas.DataFrame
-            A data frame with points to reflect
+        pts : numpy.ndarray
+            An (N, 2) array of the x and y coordinates of the points to reflect
 
         over_x : bool (default: False)
             Whether or not to reflect the points over the x axis
@@ -70,16 +69,16 @@ class BaseHockeyFeature(BaseFeature):
 
         Returns
         -------
-        out_df : pandas.DataFrame
-            The data frame with the appropriate reflections
+        out_pts : numpy.ndarray
+            The array of points with the appropriate reflections
         """
-        out_df = df.copy()
+        out_pts = pts.copy()
         if over_x:
-            out_df['y'] = -1 * df['y']
+            out_pts[:, 1] = -1 * pts[:, 1]
         if over_y:
-            out_df['x'] = -1 * df['x']
+            out_pts[:, 0] = -1 * pts[:, 0]
 
-        return out_df
+        return out_pts
 
 
 class Boards(BaseHockeyFeature):
@@ -139,53 +138,53 @@ class Boards(BaseHockeyFeature):
 
         # Combine the boards' inner and outer arcs with its guaranteed
         # coordinates
-        boards_df = pd.concat([
+        boards_pts = np.concatenate([
             # Start at the top of the rink in TV view with the boards' inner
             # boundary
-            pd.DataFrame({
-                'x': [0],
-                'y': [half_width]
-            }),
+            self.create_points(
+                x = [0],
+                y = [half_width]
+            ),
 
             # Then add in its upper innner arc
             arc_inner_upper,
 
             # Then its guaranteed point at half the length of the rink
-            pd.DataFrame({
-                'x': [half_length],
-                'y': [0]
-            }),
+            self.create_points(
+                x = [half_length],
+                y = [0]
+            ),
 
             # Then its lower inner arc
             arc_inner_lower,
 
             # Then go to the bottom of the rink in TV view with the boards'
             # inner boundary before flipping to the outer boundary
-            pd.DataFrame({
-                'x': [0, 0],
-                'y': [-half_width, -half_width - self.feature_thickness]
-            }),
+            self.create_points(
+                x = [0, 0],
+                y = [-half_width, -half_width - self.feature_thickness]
+            ),
 
             # Back to the lower arc on the outer boundary
             arc_outer_lower,
 
             # Then back to the middle
-            pd.DataFrame({
-                'x': [half_length + self.feature_thickness],
-                'y': [0]
-            }),
+            self.create_points(
+                x = [half_length + self.feature_thickness],
+                y = [0]
+            ),
 
             # Then back to the upper arc
             arc_outer_upper,
 
             # Finally back to the top and original starting point
-            pd.DataFrame({
-                'x': [0, 0],
-                'y': [half_width + self.feature_thickness, half_width]
-            })
+            self.create_points(
+                x = [0, 0],
+                y = [half_width + self.feature_thickness, half_width]
+            )
         ])
 
-        return boards_df
+        return boards_pts
 
 
 class BoardsConstraint(BaseHockeyFeature):
@@ -248,52 +247,95 @@ class BoardsConstraint(BaseHockeyFeature):
 
         # Combine the boards' inner and outer arcs with its guaranteed
         # coordinates
-        boards_constraint_df = pd.concat([
+        boards_constraint_pts = np.concatenate([
             # Start at the top of the rink in TV view with the boards' inner
             # boundary
-            pd.DataFrame({
-                'x': [0],
-                'y': [half_width]
-            }),
+            self.create_points(
+                x = [0],
+                y = [half_width]
+            ),
 
             # Then add in its upper right corner
             arc_upper_right,
 
             # Then its guaranteed point at half the length of the rink
-            pd.DataFrame({
-                'x': [half_length],
-                'y': [0]
-            }),
+            self.create_points(
+                x = [half_length],
+                y = [0]
+            ),
 
             # Then its lower right corner
             arc_lower_right,
 
             # Then go to the bottom of the rink in TV view
-            pd.DataFrame({
-                'x': [0],
-                'y': [-half_width]
-            }),
+            self.create_points(
+                x = [0],
+                y = [-half_width]
+            ),
 
             # Now continue to the lower left corner
             arc_lower_left,
 
             # Then back to the middle
-            pd.DataFrame({
-                'x': [-half_length],
-                'y': [0]
-            }),
+            self.create_points(
+                x = [-half_length],
+                y = [0]
+            ),
 
             # Then the upper left corner
             arc_upper_left,
 
             # Finally back to the top and original starting point
-            pd.DataFrame({
-                'x': [0],
-                'y': [half_width]
-            })
+            self.create_points(
+                x = [0],
+                y = [half_width]
+            )
         ])
 
-        return boards_constraint_df
+        return boards_constraint_pts
+
+    def contains(self, x, y):
+        """Determine which points lie inside of the boards.
+
+        The boards form a rectangle with rounded corners, so a point is inside
+        of them if it's inside of the rectangle and isn't beyond the arc of the
+        nearest corner
+
+        Parameters
+        ----------
+        x : float or array-like
+            The x coordinate(s) of the points
+
+        y : float or array-like
+            The y coordinate(s) of the points
+
+        Returns
+        -------
+        is_inside : numpy.ndarray
+            A boolean array that is True for the points that lie inside of (or
+            on) the boards
+        """
+        # Specify the half-dimensions of the rink
+        half_length = self.rink_length / 2.0
+        half_width = self.rink_width / 2.0
+
+        # The rink is symmetric, so only the distance of each point from the
+        # center of the rink is needed
+        dx = np.abs(np.ravel(x) - self.x_anchor)
+        dy = np.abs(np.ravel(y) - self.y_anchor)
+
+        # Find how far each point is beyond the center of the nearest corner's
+        # arc. This is zero for points that aren't in the corners
+        corner_dx = np.maximum(dx - (half_length - self.feature_radius), 0.0)
+        corner_dy = np.maximum(dy - (half_width - self.feature_radius), 0.0)
+
+        is_inside = (dx <= half_length) & (dy <= half_width)
+        is_inside &= (
+            (corner_dx * corner_dx) + (corner_dy * corner_dy) <=
+            self.feature_radius ** 2
+        )
+
+        return is_inside
 
 
 class NeutralZone(BaseHockeyFeature):
@@ -310,14 +352,14 @@ class NeutralZone(BaseHockeyFeature):
 
         The zone is rectangular in shape, and usually is white in color.
         """
-        nzone_df = self.create_rectangle(
+        nzone_pts = self.create_rectangle(
             x_min = -self.feature_thickness / 2.0,
             x_max = self.feature_thickness / 2.0,
             y_min = -self.rink_width / 2.0,
             y_max = self.rink_width / 2.0
         )
 
-        return nzone_df
+        return nzone_pts
 
 
 class OffensiveZone(BaseHockeyFeature):
@@ -362,22 +404,22 @@ class OffensiveZone(BaseHockeyFeature):
             end = -0.5
         )
 
-        ozone_df = pd.concat([
+        ozone_pts = np.concatenate([
             # Start at the upper left corner of the zone line that is closest
             # to center ice
-            pd.DataFrame({
-                'x': [self.nzone_length / 2.0],
-                'y': [half_width]
-            }),
+            self.create_points(
+                x = [self.nzone_length / 2.0],
+                y = [half_width]
+            ),
 
             # Then draw the upper right corner of the boards
             arc_inner_upper,
 
             # Then its guaranteed point at half the length of the rink
-            pd.DataFrame({
-                'x': [half_length],
-                'y': [0.0]
-            }),
+            self.create_points(
+                x = [half_length],
+                y = [0.0]
+            ),
 
             # Then the lower right corner
             arc_inner_lower,
@@ -385,13 +427,13 @@ class OffensiveZone(BaseHockeyFeature):
             # Then go to the bottom of the rink in TV view with the boards'
             # inner boundary before closing the path by returning to the
             # starting point
-            pd.DataFrame({
-                'x': [self.nzone_length / 2.0, self.nzone_length / 2.0],
-                'y': [-half_width, half_width]
-            })
+            self.create_points(
+                x = [self.nzone_length / 2.0, self.nzone_length / 2.0],
+                y = [-half_width, half_width]
+            )
         ])
 
-        return ozone_df
+        return ozone_pts
 
 
 class DefensiveZone(BaseHockeyFeature):
@@ -436,22 +478,22 @@ class DefensiveZone(BaseHockeyFeature):
             end = 1.5
         )
 
-        dzone_df = pd.concat([
+        dzone_pts = np.concatenate([
             # Start at the upper right corner of the zone line that is closest
             # to center ice
-            pd.DataFrame({
-                'x': [-self.nzone_length / 2.0],
-                'y': [half_width]
-            }),
+            self.create_points(
+                x = [-self.nzone_length / 2.0],
+                y = [half_width]
+            ),
 
             # Then draw the upper left arc of the boards
             arc_inner_upper,
 
             # Then its guaranteed point at half the length of the rink
-            pd.DataFrame({
-                'x': [-half_length],
-                'y': [0.0]
-            }),
+            self.create_points(
+                x = [-half_length],
+                y = [0.0]
+            ),
 
             # Then the lower left arc
             arc_inner_lower,
@@ -459,13 +501,13 @@ class DefensiveZone(BaseHockeyFeature):
             # Then go to the bottom of the rink in TV view with the boards'
             # inner boundary before closing the path by returning to the
             # starting point
-            pd.DataFrame({
-                'x': [-self.nzone_length / 2.0, -self.nzone_length / 2.0],
-                'y': [-half_width, half_width]
-            })
+            self.create_points(
+                x = [-self.nzone_length / 2.0, -self.nzone_length / 2.0],
+                y = [-half_width, half_width]
+            )
         ])
 
-        return dzone_df
+        return dzone_pts
 
 
 class CenterLine(BaseHockeyFeature):
@@ -483,14 +525,14 @@ class CenterLine(BaseHockeyFeature):
         The line is rectangular in shape, and usually red in color.
         """
         # Create the center line
-        center_line_df = self.create_rectangle(
+        center_line_pts = self.create_rectangle(
             x_min = -self.feature_thickness / 2.0,
             x_max = self.feature_thickness / 2.0,
             y_min = -self.rink_width / 2.0,
             y_max = self.rink_width / 2.0
         )
 
-        return center_line_df
+        return center_line_pts
 
 
 class ZoneLine(BaseHockeyFeature):
@@ -511,14 +553,14 @@ class ZoneLine(BaseHockeyFeature):
         the inner edges of these lines are what comprise the neutral zone
         """
         # Create the neutral zone line
-        zone_line_df = self.create_rectangle(
+        zone_line_pts = self.create_rectangle(
             x_min = -self.feature_thickness / 2.0,
             x_max = self.feature_thickness / 2.0,
             y_min = -self.rink_width / 2.0,
             y_max = self.rink_width / 2.0
         )
 
-        return zone_line_df
+        return zone_line_pts
 
 
 class GoalLine(BaseHockeyFeature):
@@ -560,14 +602,14 @@ class GoalLine(BaseHockeyFeature):
         # of the center of the corner's arc, then the feature should be a
         # rectangle
         if min_x <= corner_arc_center_x:
-            goal_line_df = self.create_rectangle(
+            goal_line_pts = self.create_rectangle(
                 x_min = -self.feature_thickness / 2.0,
                 x_max = self.feature_thickness / 2.0,
                 y_min = -half_width,
                 y_max = half_width
             )
 
-            return goal_line_df
+            return goal_line_pts
 
         # Otherwise, more calculation is necessary
         else:
@@ -607,8 +649,8 @@ class GoalLine(BaseHockeyFeature):
             theta_start = math.asin(start_x / self.feature_radius) / np.pi
             theta_end = math.asin(end_x / self.feature_radius) / np.pi
 
-            # Now create the feature's data frame
-            goal_line_df = pd.concat([
+            # Now create the feature's coordinates
+            goal_line_pts = np.concatenate([
                 self.create_circle(
                     center = (corner_arc_center_x, corner_arc_center_y),
                     start = 0.5 - theta_start,
@@ -624,7 +666,7 @@ class GoalLine(BaseHockeyFeature):
                 )
             ])
 
-            return goal_line_df
+            return goal_line_pts
 
 
 class CenterFaceoffCircle(BaseHockeyFeature):
@@ -636,7 +678,7 @@ class CenterFaceoffCircle(BaseHockeyFeature):
     def _get_centered_feature(self):
         # The center circle has no external hash marks, so this circle just
         # needs to be a circle
-        faceoff_circle_df = pd.concat([
+        faceoff_circle_pts = np.concatenate([
             self.create_circle(
                 center = (0, 0),
                 start = 0.5,
@@ -644,17 +686,17 @@ class CenterFaceoffCircle(BaseHockeyFeature):
                 r = self.feature_radius
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     0,
                     0
                 ],
 
-                'y': [
+                y = [
                     -self.feature_radius,
                     -self.feature_radius - self.feature_thickness
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (0, 0),
@@ -664,7 +706,7 @@ class CenterFaceoffCircle(BaseHockeyFeature):
             )
         ])
 
-        return faceoff_circle_df
+        return faceoff_circle_pts
 
 
 class CenterFaceoffSpot(BaseHockeyFeature):
@@ -676,14 +718,14 @@ class CenterFaceoffSpot(BaseHockeyFeature):
     def _get_centered_feature(self):
         # The faceoff spot at center ice is a solid-colored dot, usually blue
         # in color
-        faceoff_spot_df = self.create_circle(
+        faceoff_spot_pts = self.create_circle(
             center = (0, 0),
             start = 0.0,
             end = 2.0,
             r = self.feature_radius
         )
 
-        return faceoff_spot_df
+        return faceoff_spot_pts
 
 
 class NonCenterFaceoffSpot(BaseHockeyFeature):
@@ -695,7 +737,7 @@ class NonCenterFaceoffSpot(BaseHockeyFeature):
     def _get_centered_feature(self):
         # The non-centered faceoff spots are comprised of an outer and inner
         # ring
-        faceoff_spot_df = pd.concat([
+        faceoff_spot_pts = np.concatenate([
             self.create_circle(
                 center = (0, 0),
                 start = 0.5,
@@ -703,15 +745,15 @@ class NonCenterFaceoffSpot(BaseHockeyFeature):
                 r = self.feature_radius
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     0
                 ],
 
-                'y': [
+                y = [
                     -self.feature_radius + self.feature_thickness
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (0, 0),
@@ -720,25 +762,25 @@ class NonCenterFaceoffSpot(BaseHockeyFeature):
                 r = self.feature_radius - self.feature_thickness
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     0,
                     0
                 ],
 
-                'y': [
+                y = [
                     self.feature_radius - self.feature_thickness,
                     self.feature_radius
                 ]
-            })
+            )
         ])
 
-        faceoff_spot_df = pd.concat([
-            faceoff_spot_df,
-            self._reflect(faceoff_spot_df, over_x = False, over_y = True)
+        faceoff_spot_pts = np.concatenate([
+            faceoff_spot_pts,
+            self._reflect(faceoff_spot_pts, over_x = False, over_y = True)
         ])
 
-        return faceoff_spot_df
+        return faceoff_spot_pts
 
 
 class FaceoffLines(BaseHockeyFeature):
@@ -762,8 +804,8 @@ class FaceoffLines(BaseHockeyFeature):
 
     def _get_centered_feature(self):
         # The L-shaped lines are traced via the following path
-        faceoff_line_df = pd.DataFrame({
-            'x': [
+        faceoff_line_pts = self.create_points(
+            x = [
                 -self.dist_from_spot_x,
                 -self.dist_from_spot_x - self.feature_length,
                 -self.dist_from_spot_x - self.feature_length,
@@ -773,7 +815,7 @@ class FaceoffLines(BaseHockeyFeature):
                 -self.dist_from_spot_x
             ],
 
-            'y': [
+            y = [
                 self.dist_from_spot_y,
                 self.dist_from_spot_y,
                 self.dist_from_spot_y + self.feature_thickness,
@@ -782,16 +824,16 @@ class FaceoffLines(BaseHockeyFeature):
                 self.dist_from_spot_y + self.feature_width,
                 self.dist_from_spot_y
             ]
-        })
+        )
 
         # Now, reflect the path over the x and y axes
-        faceoff_line_df = self._reflect(
-            faceoff_line_df,
+        faceoff_line_pts = self._reflect(
+            faceoff_line_pts,
             over_x = self.over_x,
             over_y = self.over_y
         )
 
-        return faceoff_line_df
+        return faceoff_line_pts
 
 
 class OzoneDzoneFaceoffCircle(BaseHockeyFeature):
@@ -848,16 +890,16 @@ class OzoneDzoneFaceoffCircle(BaseHockeyFeature):
         theta1 = math.asin(ext_spacing / self.feature_radius) / np.pi
         theta2 = math.asin(int_spacing / self.feature_radius) / np.pi
 
-        faceoff_circle_df = pd.concat([
-            pd.DataFrame({
-                'x': [
+        faceoff_circle_pts = np.concatenate([
+            self.create_points(
+                x = [
                     0
                 ],
 
-                'y': [
+                y = [
                     self.feature_radius
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (0, 0),
@@ -866,17 +908,17 @@ class OzoneDzoneFaceoffCircle(BaseHockeyFeature):
                 r = self.feature_radius
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     -int_spacing,
                     -ext_spacing
                 ],
 
-                'y': [
+                y = [
                     self.feature_radius + self.hashmark_width,
                     self.feature_radius + self.hashmark_width
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (0, 0),
@@ -885,17 +927,17 @@ class OzoneDzoneFaceoffCircle(BaseHockeyFeature):
                 r = self.feature_radius
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     -ext_spacing,
                     -int_spacing
                 ],
 
-                'y': [
+                y = [
                     -self.feature_radius - self.hashmark_width,
                     -self.feature_radius - self.hashmark_width,
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (0, 0),
@@ -904,10 +946,10 @@ class OzoneDzoneFaceoffCircle(BaseHockeyFeature):
                 r = self.feature_radius
             ),
 
-            pd.DataFrame({
-                'x': [0],
-                'y': [-self.feature_radius + self.feature_thickness]
-            }),
+            self.create_points(
+                x = [0],
+                y = [-self.feature_radius + self.feature_thickness]
+            ),
 
             self.create_circle(
                 center = (0, 0),
@@ -916,19 +958,19 @@ class OzoneDzoneFaceoffCircle(BaseHockeyFeature):
                 r = self.feature_radius - self.feature_thickness
             ),
 
-            pd.DataFrame({
-                'x': [0],
-                'y': [self.feature_radius]
-            })
+            self.create_points(
+                x = [0],
+                y = [self.feature_radius]
+            )
         ])
 
         # Reflect the half-circle just created over the y axis
-        faceoff_circle_df = pd.concat([
-            faceoff_circle_df,
-            self._reflect(faceoff_circle_df, over_x = False, over_y = True)
+        faceoff_circle_pts = np.concatenate([
+            faceoff_circle_pts,
+            self._reflect(faceoff_circle_pts, over_x = False, over_y = True)
         ])
 
-        return faceoff_circle_df
+        return faceoff_circle_pts
 
 
 class NonCenterFaceoffSpotStripe(BaseHockeyFeature):
@@ -975,7 +1017,7 @@ class NonCenterFaceoffSpotStripe(BaseHockeyFeature):
         # Calculate the angle
         theta = math.asin(stripe_thickness / ring_inner_radius) / np.pi
 
-        spot_stripe_df = pd.concat([
+        spot_stripe_pts = np.concatenate([
             self.create_circle(
                 center = (0, 0),
                 start = 0.5 - theta,
@@ -991,7 +1033,7 @@ class NonCenterFaceoffSpotStripe(BaseHockeyFeature):
             )
         ])
 
-        return spot_stripe_df
+        return spot_stripe_pts
 
 
 class RefereeCrease(BaseHockeyFeature):
@@ -1004,16 +1046,16 @@ class RefereeCrease(BaseHockeyFeature):
     def _get_centered_feature(self):
         # The referee's crease is a semi-circle. In TV view, it is at the
         # bottom of the ice,
-        referee_crease_df = pd.concat([
-            pd.DataFrame({
-                'x': [
+        referee_crease_pts = np.concatenate([
+            self.create_points(
+                x = [
                     self.feature_radius,
                 ],
 
-                'y': [
+                y = [
                     0
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (0, 0),
@@ -1022,17 +1064,17 @@ class RefereeCrease(BaseHockeyFeature):
                 r = self.feature_radius
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     -self.feature_radius,
                     -self.feature_radius + self.feature_thickness
                 ],
 
-                'y': [
+                y = [
                     0,
                     0
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (0, 0),
@@ -1041,18 +1083,18 @@ class RefereeCrease(BaseHockeyFeature):
                 r = self.feature_radius - self.feature_thickness
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     self.feature_radius,
                 ],
 
-                'y': [
+                y = [
                     0
                 ]
-            })
+            )
         ])
 
-        return referee_crease_df
+        return referee_crease_pts
 
 
 class GoalCreaseOutline(BaseHockeyFeature):
@@ -1099,18 +1141,18 @@ class GoalCreaseOutline(BaseHockeyFeature):
         theta = math.asin(self.goal_crease_width / self.feature_radius)
         theta /= np.pi
 
-        goal_crease_outline_df = pd.concat([
-            pd.DataFrame({
-                'x': [
+        goal_crease_outline_pts = np.concatenate([
+            self.create_points(
+                x = [
                     start_x,
                     start_x + self.goal_crease_length
                 ],
 
-                'y': [
+                y = [
                     self.goal_crease_width,
                     self.goal_crease_width
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (start_x, 0),
@@ -1119,8 +1161,8 @@ class GoalCreaseOutline(BaseHockeyFeature):
                 r = self.feature_radius
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     start_x + self.goal_crease_length,
                     start_x,
                     start_x,
@@ -1130,7 +1172,7 @@ class GoalCreaseOutline(BaseHockeyFeature):
                     start_x + self.crease_notch_dist + self.feature_thickness
                 ],
 
-                'y': [
+                y = [
                     -self.goal_crease_width,
                     -self.goal_crease_width,
                     -self.goal_crease_width + self.feature_thickness,
@@ -1141,7 +1183,7 @@ class GoalCreaseOutline(BaseHockeyFeature):
                     self.crease_notch_width,
                     -self.goal_crease_width + self.feature_thickness
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (start_x, 0),
@@ -1150,8 +1192,8 @@ class GoalCreaseOutline(BaseHockeyFeature):
                 r = self.feature_radius - self.feature_thickness
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     start_x + self.crease_notch_dist + self.feature_thickness,
                     start_x + self.crease_notch_dist + self.feature_thickness,
                     start_x + self.crease_notch_dist,
@@ -1160,7 +1202,7 @@ class GoalCreaseOutline(BaseHockeyFeature):
                     start_x
                 ],
 
-                'y': [
+                y = [
                     self.goal_crease_width - self.feature_thickness,
                     self.goal_crease_width - self.feature_thickness -
                     self.crease_notch_width,
@@ -1170,13 +1212,13 @@ class GoalCreaseOutline(BaseHockeyFeature):
                     self.goal_crease_width - self.feature_thickness,
                     self.goal_crease_width
                 ]
-            }),
+            ),
         ])
 
-        goal_crease_outline_df['x'] = goal_crease_outline_df['x'] +\
+        goal_crease_outline_pts[:, 0] = goal_crease_outline_pts[:, 0] +\
             self.goal_line_x
 
-        return goal_crease_outline_df
+        return goal_crease_outline_pts
 
 
 class GoalCreaseFill(BaseHockeyFeature):
@@ -1223,9 +1265,9 @@ class GoalCreaseFill(BaseHockeyFeature):
         theta = math.asin(self.goal_crease_width / self.feature_radius)
         theta /= np.pi
 
-        goal_crease_fill_df = pd.concat([
-            pd.DataFrame({
-                'x': [
+        goal_crease_fill_pts = np.concatenate([
+            self.create_points(
+                x = [
                     start_x,
                     start_x + self.crease_notch_dist,
                     start_x + self.crease_notch_dist,
@@ -1233,7 +1275,7 @@ class GoalCreaseFill(BaseHockeyFeature):
                     start_x + self.crease_notch_dist + self.feature_thickness
                 ],
 
-                'y': [
+                y = [
                     -self.goal_crease_width + self.feature_thickness,
                     -self.goal_crease_width + self.feature_thickness,
                     -self.goal_crease_width + self.feature_thickness +
@@ -1242,7 +1284,7 @@ class GoalCreaseFill(BaseHockeyFeature):
                     self.crease_notch_width,
                     -self.goal_crease_width + self.feature_thickness
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (start_x, 0),
@@ -1251,8 +1293,8 @@ class GoalCreaseFill(BaseHockeyFeature):
                 r = self.feature_radius - self.feature_thickness
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     start_x + self.crease_notch_dist + self.feature_thickness,
                     start_x + self.crease_notch_dist + self.feature_thickness,
                     start_x + self.crease_notch_dist,
@@ -1260,7 +1302,7 @@ class GoalCreaseFill(BaseHockeyFeature):
                     start_x
                 ],
 
-                'y': [
+                y = [
                     self.goal_crease_width - self.feature_thickness,
                     self.goal_crease_width - self.feature_thickness -
                     self.crease_notch_width,
@@ -1269,12 +1311,12 @@ class GoalCreaseFill(BaseHockeyFeature):
                     self.goal_crease_width - self.feature_thickness,
                     self.goal_crease_width - self.feature_thickness,
                 ]
-            }),
+            ),
         ])
 
-        goal_crease_fill_df['x'] = goal_crease_fill_df['x'] + self.goal_line_x
+        goal_crease_fill_pts[:, 0] = goal_crease_fill_pts[:, 0] + self.goal_line_x
 
-        return goal_crease_fill_df
+        return goal_crease_fill_pts
 
 
 class GoalFrame(BaseHockeyFeature):
@@ -1324,16 +1366,16 @@ class GoalFrame(BaseHockeyFeature):
             # half of its line's thickness from the goal line
             start_x = self.goal_line_x - (self.feature_thickness / 2.0)
 
-        goal_frame_df = pd.concat([
-            pd.DataFrame({
-                'x': [
+        goal_frame_pts = np.concatenate([
+            self.create_points(
+                x = [
                     start_x
                 ],
 
-                'y': [
+                y = [
                     half_goal_mouth + self.goal_post_diameter
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (
@@ -1355,17 +1397,17 @@ class GoalFrame(BaseHockeyFeature):
                 r = self.feature_radius
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     start_x,
                     start_x
                 ],
 
-                'y': [
+                y = [
                     -half_goal_mouth - self.goal_post_diameter,
                     -half_goal_mouth
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (
@@ -1387,20 +1429,20 @@ class GoalFrame(BaseHockeyFeature):
                 r = self.feature_radius - self.feature_thickness
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     start_x,
                     start_x
                 ],
 
-                'y': [
+                y = [
                     half_goal_mouth,
                     half_goal_mouth + self.goal_post_diameter
                 ]
-            })
+            )
         ])
 
-        return goal_frame_df
+        return goal_frame_pts
 
 
 class GoalFill(BaseHockeyFeature):
@@ -1450,16 +1492,16 @@ class GoalFill(BaseHockeyFeature):
             # half of its line's thickness from the goal line
             start_x = self.goal_line_x - (self.feature_thickness / 2.0)
 
-        goal_fill_df = pd.concat([
-            pd.DataFrame({
-                'x': [
+        goal_fill_pts = np.concatenate([
+            self.create_points(
+                x = [
                     start_x
                 ],
 
-                'y': [
+                y = [
                     -half_goal_mouth
                 ]
-            }),
+            ),
 
             self.create_circle(
                 center = (
@@ -1481,20 +1523,20 @@ class GoalFill(BaseHockeyFeature):
                 r = self.feature_radius - self.feature_thickness
             ),
 
-            pd.DataFrame({
-                'x': [
+            self.create_points(
+                x = [
                     start_x,
                     start_x
                 ],
 
-                'y': [
+                y = [
                     half_goal_mouth,
                     -half_goal_mouth
                 ]
-            })
+            )
         ])
 
-        return goal_fill_df
+        return goal_fill_pts
 
 
 class GoalkeepersRestrictedArea(BaseHockeyFeature):
@@ -1529,8 +1571,8 @@ class GoalkeepersRestrictedArea(BaseHockeyFeature):
             left_edge_x = self.goal_line_x - (self.feature_thickness / 2.0)
             right_edge_x = self.goal_line_x + (self.feature_thickness / 2.0)
 
-        goalkeepers_restricted_area_df = pd.DataFrame({
-            'x': [
+        goalkeepers_restricted_area_pts = self.create_points(
+            x = [
                 -self.rink_length / 2.0,
                 right_edge_x,
                 right_edge_x,
@@ -1542,7 +1584,7 @@ class GoalkeepersRestrictedArea(BaseHockeyFeature):
                 -self.rink_length / 2.0
             ],
 
-            'y': [
+            y = [
                 self.long_base_width / 2.0,
                 self.short_base_width / 2.0,
                 -self.short_base_width / 2.0,
@@ -1553,6 +1595,6 @@ class GoalkeepersRestrictedArea(BaseHockeyFeature):
                 (self.long_base_width / 2.0) - self.feature_thickness,
                 self.long_base_width / 2.0
             ]
-        })
+        )
 
-        return goalkeepers_restricted_area_df
+        return goalkeepers_restricted_area_pts
@@ -0,0 +1,69 @@
+"""A feature whose coordinates have already been computed.
+
+These features are created by PrecomputedSurface from a file written by a
+surface's export_geometry() method. Their coordinates are read from the file
+rather than being computed from the surface's parameters.
+
+@author: Ross Drucker
+"""
+import numpy as np
+from sportypy._base_classes._base_feature import BaseFeature
+
+
+class PrecomputedFeature(BaseFeature):
+    """A feature drawn from coordinates that were computed ahead of time.
+
+    For more information on inherited attributes, please see the BaseFeature
+    class definition.
+
+    Attributes
+    ----------
+    feature_pts : numpy.ndarray
+        The (N, 2) array of the feature's translated coordinates. Rows of nan
+        separate the feature's subpaths
+
+    feature_class : str or None (default: None)
+        The name of the class of the feature that the coordinates were
+        computed from
+    """
+
+    def __init__(self, feature_pts, feature_class = None, *args, **kwargs):
+        # The coordinates are shared by every copy of the feature, so they are
+        # made read-only
+        self.feature_pts = np.array(feature_pts, dtype = np.float64)
+        self.feature_pts.setflags(write = False)
+        self.feature_class = feature_class
+
+        super().__init__(*args, **kwargs)
+
+    def _geometry_key(self):
+        """Get the key that identifies the feature's current geometry.
+
+        The feature's coordinates can't be modified, so only its anchors and
+        reflections may change its geometry. This avoids hashing the
+        coordinates each time the feature is translated
+
+        Returns
+        -------
+        geometry_key : tuple
+            A hashable tuple of the feature's anchors and reflections
+        """
+        return (
+            self.x_anchor,
+            self.y_anchor,
+            self.x_reflection,
+            self.y_reflection
+        )
+
+    def _get_centered_feature(self):
+        """Get the feature's coordinates.
+
+        The coordinates were translated before they were written, so they are
+        already centered
+
+        Returns
+        -------
+        feature_pts : numpy.ndarray
+            The (N, 2) array of the feature's coordinates
+        """
+        return self.feature_pts
@@ -11,10 +11,10 @@ comprise the attributes of the class.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.transforms import Affine2D
 import sportypy.features.baseball_features as baseball
+from sportypy._base_classes._base_surface import _Rotation
 from sportypy._base_classes._base_surface_plot import BaseSurfacePlot
+from sportypy._base_classes._profiling import profiled_draw
 
 
 class BaseballField(BaseSurfacePlot):
@@ -53,6 +53,18 @@ class BaseballField(BaseSurfacePlot):
         second base bag. This point is used to anchor the second base bag, as
         well as determine the anchor points of the corners of the first and
         third base bags
+
+    arc_tolerance : float or None (default: None)
+        The maximum allowable distance between the arcs of the field's features
+        and the chords used to draw them. This should be provided in the same
+        units as the field. If supplied, this takes precedence over dpi
+
+    dpi : float or None (default: 300.0)
+        The resolution (in dots per inch) at which the field is expected to be
+        rendered. The field's arcs are traced with only as many points as are
+        needed to keep them accurate to within half of a pixel at this
+        resolution. If both arc_tolerance and dpi are None, each feature's
+        arcs are traced to within 0.1% of their radius
     """
 
     def __init__(self, rotation = 0.0, x_trans = 0.0, y_trans = 0.0,
@@ -61,11 +73,11 @@ class BaseballField(BaseSurfacePlot):
                  home_to_2b_dist = 127.0 + (3.0 / 12.0) + ((3.0 / 8.0) / 12.0),
                  baseline_length = 90.0,
                  home_plate = {}, first_base = {}, second_base = {},
-                 third_base = {}, colors_dict = {},
-                 **added_features):
+                 third_base = {}, colors_dict = {}, arc_tolerance = None,
+                 dpi = 300.0, **added_features):
         # Set the rotation of the plot to be the supplied rotation
         # value
-        self._rotation = Affine2D().rotate_deg(rotation)
+        self._rotation = _Rotation().rotate_deg(rotation)
 
         # Set the court's necessary shifts. This will overwrite the
         # default values of x_trans and y_trans inherited from the
@@ -79,6 +91,9 @@ class BaseballField(BaseSurfacePlot):
         self.home_to_2b_dist = home_to_2b_dist
         self.baseline_length = baseline_length
 
+        # Determine how closely the features' arcs must be traced
+        self.arc_tolerance = self._get_arc_tolerance(arc_tolerance, dpi)
+
         # Initialize the standard colors of the court
         standard_colors = {
             'field_background': '#9b7653',
@@ -95,6 +110,20 @@ class BaseballField(BaseSurfacePlot):
         # Create the final color set for the features
         self.feature_colors = {**standard_colors, **colors_dict}
 
+        # The field's background is the background of its plots
+        self.feature_colors.setdefault(
+            'plot_background',
+            self.feature_colors['field_background']
+        )
+
+        # Create a container for the relevant features of a baseball field
+        self._feature_specs = []
+
+        # Initialize the x and y limits for the plot to be None. These
+        # will get set when calling the draw() method below
+        self._feature_xlim = None
+        self._feature_ylim = None
+
         # Initialize the constraint of the field although no constraint is
         # required for this surface
         field_constraint = {
@@ -105,14 +134,12 @@ class BaseballField(BaseSurfacePlot):
             'y_justify': 'center',
             'reflect_x': False,
             'reflect_y': False,
-            'court_length': self.court_length,
-            'court_width': self.court_width,
             'feature_radius': 0.0,
             'feature_thickness': 0.0,
             'visible': False
         }
         self._initialize_feature(field_constraint)
-        self._surface_constraint = self._features.pop(-1)
+        self._surface_constraint = self._feature_specs.pop(-1)
 
         # Initialize home plate
         home_plate_params = {
@@ -188,8 +215,9 @@ class BaseballField(BaseSurfacePlot):
         for added_feature in added_features.values():
             self._initialize_feature(added_feature)
 
+    @profiled_draw
     def draw(self, ax = None, display_range = 'full', xlim = None, ylim = None,
-             rotation = None):
+             rotation = None, batched = False):
         """Draw the court.
 
         Parameters
@@ -204,7 +232,8 @@ class BaseballField(BaseSurfacePlot):
             limits what is shown in the final plot. The following explain what
             each display range corresponds to:
 
-
+                - 'full': The entire field. Only the infield's features are
+                  drawn, so this spans home plate and the three bases
 
         xlim : float, tuple (float, float), or None (default: None)
             The display range in the x direction to be used. If a single
@@ -228,14 +257,20 @@ class BaseballField(BaseSurfacePlot):
             self._rotation. A value of 0.0 will correspond to a TV View
             of the court, where +x is to the right and +y is on top. The
             rotation occurs counter clockwise
+
+        batched : bool (default: False)
+            Whether to draw the features of the court in a few batched
+            collections rather than as one patch per feature. The result
+            looks the same, but is much faster to draw and redraw
         """
         # If there is a rotation to be applied, apply it first and set it as
         # the class attribute self._rotation
         if rotation:
-            self._rotation = Affine2D().rotate_deg(rotation)
+            self._rotation = _Rotation().rotate_deg(rotation)
 
         # If an Axes object is not provided, create one to use for plotting
         if ax is None:
+            import matplotlib.pyplot as plt
             fig, ax = plt.subplots()
             fig.patch.set_facecolor(self.feature_colors['field_background'])
             fig.set_size_inches(50, 50)
@@ -249,10 +284,16 @@ class BaseballField(BaseSurfacePlot):
         # Get the transformation to apply
         transform = self._get_transform(ax)
 
+        # If the features are to be batched, add them all at once
+        if batched:
+            self._draw_features_batched(ax, transform)
+
         # Add each feature
         for feature in self._features:
-            # Start by adding the feature to the current Axes object
-            feature.draw(ax, transform)
+            # Start by adding the feature to the current Axes object, unless
+            # it's already been added in a batch
+            if not batched:
+                feature.draw(ax, transform)
 
             try:
                 # Check the feature's visibility
@@ -267,14 +308,14 @@ class BaseballField(BaseSurfacePlot):
             # bounds of the court
             if visible and not isinstance(feature, baseball.FieldConstraint):
                 try:
-                    feature_df = feature._translate_feature()
+                    feature_pts = feature._translate_feature()
 
                     # If the feature doesn't have a limitation on x, set its
                     # limits to be its minimum and maximum values of x
                     if self._feature_xlim is None:
                         self._feature_xlim = [
-                            feature_df['x'].min(),
-                            feature_df['x'].max()
+                            feature_pts[:, 0].min(),
+                            feature_pts[:, 0].max()
                         ]
 
                     # Otherwise, set the limits to be the smaller of its
@@ -282,16 +323,16 @@ class BaseballField(BaseSurfacePlot):
                     # of its specified maximum and largest x value
                     else:
                         self._feature_xlim = [
-                            min(self._feature_xlim[0], feature_df['x'].min()),
-                            max(self._feature_xlim[0], feature_df['x'].max())
+                            min(self._feature_xlim[0], feature_pts[:, 0].min()),
+                            max(self._feature_xlim[1], feature_pts[:, 0].max())
                         ]
 
                     # If the feature doesn't have a limitation on y, set its
                     # limits to be its minimum and maximum values of y
                     if self._feature_ylim is None:
                         self._feature_ylim = [
-                            feature_df['y'].min(),
-                            feature_df['y'].max()
+                            feature_pts[:, 1].min(),
+                            feature_pts[:, 1].max()
                         ]
 
                     # Otherwise, set the limits to be the smaller of its
@@ -299,8 +340,8 @@ class BaseballField(BaseSurfacePlot):
                     # of its specified maximum and largest y value
                     else:
                         self._feature_ylim = [
-                            min(self._feature_ylim[0], feature_df['y'].min()),
-                            max(self._feature_ylim[0], feature_df['y'].max())
+                            min(self._feature_ylim[0], feature_pts[:, 1].min()),
+                            max(self._feature_ylim[1], feature_pts[:, 1].max())
                         ]
 
                 except TypeError:
@@ -341,35 +382,34 @@ class BaseballField(BaseSurfacePlot):
         xlim = self.copy_(xlim)
         ylim = self.copy_(ylim)
 
-        # Determine the length of half of the court (including the thickness of
-        # the boards)
-        half_court_length = self.half_court_length +\
-            self.baseline_apron_extension_length + 1.0
-        half_court_width = self.half_court_width +\
-            self.sideline_apron_extension_width + 1.0
+        # Determine the extent of the field's features (plus one additional
+        # unit of buffer). The field's features extend from the back tip of
+        # home plate to second base, and between the outer corners of first
+        # and third base
+        half_field_width = (
+            self.baseline_length * np.cos(np.pi / 4.0) +
+            self.base_side_length +
+            1.0
+        )
+        field_y_min = -1.0
+        field_y_max = self.home_to_2b_dist + self.base_side_length + 1.0
+
+        # Convert the search key to lower case
+        display_range = display_range.lower().replace(' ', '')
 
         # Set the x limits of the plot if they are not provided
         if not xlim:
-            # Convert the search key to lower case
-            display_range = display_range.lower().replace(' ', '')
-
             # Get the limits from the viable display ranges
             xlims = {
                 # Full surface (default)
-                'full': (-250, 250),
-
-                # Half-court plots
-                'offense': (0.0, half_court_length),
-                'offence': (0.0, half_court_length),
-                'defense': (-half_court_length, 0.0),
-                'defence': (-half_court_length, 0.0)
+                'full': (-half_field_width, half_field_width)
             }
 
             # Extract the x limit from the dictionary, defaulting to the full
-            # court
+            # field
             xlim = xlims.get(
                 display_range,
-                (-half_court_length, half_court_length)
+                (-half_field_width, half_field_width)
             )
 
         # If an x limit is provided, try to use it
@@ -385,53 +425,27 @@ class BaseballField(BaseSurfacePlot):
                 # data
                 xlim = xlim - self.x_trans
 
-                # If the provided value for the x limit is beyond the end of
-                # the boards, display the entire court
-                if xlim >= half_court_length:
-                    xlim = -half_court_length
+                # If the provided value for the x limit is beyond the edge of
+                # the field, display the entire field
+                if xlim >= half_field_width:
+                    xlim = -half_field_width
 
                 # Set the x limit to be a tuple as described above
-                xlim = (xlim, half_court_length)
+                xlim = (xlim, half_field_width)
 
         # Set the y limits of the plot if they are not provided. The default
-        # will be the entire width of the court. Additional view regions may be
-        # added here
+        # will be the entire length of the field. Additional view regions may
+        # be added here
         if not ylim:
-            # Convert the search key to lower case
-            display_range = display_range.lower().replace(' ', '')
-
             # Get the limits from the viable display ranges
             ylims = {
                 # Full surface (default)
-                'full': (-half_court_width, half_court_width),
-
-                # Half-court plots
-                'offense': (-half_court_width, half_court_width),
-                'offence': (-half_court_width, half_court_width),
-                'defense': (-half_court_width, half_court_width),
-                'defence': (-half_court_width, half_court_width),
-
-                # Offensive zone
-                'ozone': (-half_court_width, half_court_width),
-                'offensive_zone': (-half_court_width, half_court_width),
-                'offensive zone': (-half_court_width, half_court_width),
-                'attacking_zone': (-half_court_width, half_court_width),
-                'attacking zone': (-half_court_width, half_court_width),
-
-                # Defensive zone
-                'dzone': (-half_court_width, half_court_width),
-                'defensive_zone': (-half_court_width, half_court_width),
-                'defensive zone': (-half_court_width, half_court_width),
-                'defending_zone': (-half_court_width, half_court_width),
-                'defending zone': (-half_court_width, half_court_width)
+                'full': (field_y_min, field_y_max)
             }
 
-            # Extract the x limit from the dictionary, defaulting to the full
-            # court
-            ylim = ylims.get(
-                display_range,
-                (-half_court_length, half_court_length)
-            )
+            # Extract the y limit from the dictionary, defaulting to the full
+            # field
+            ylim = ylims.get(display_range, (field_y_min, field_y_max))
 
         # Otherwise, repeat the process above but for y
         else:
@@ -441,10 +455,10 @@ class BaseballField(BaseSurfacePlot):
             except TypeError:
                 ylim = ylim - self.y_trans
 
-                if ylim >= half_court_width:
-                    ylim = -half_court_width
+                if ylim >= field_y_max:
+                    ylim = field_y_min
 
-                ylim = (ylim, half_court_width)
+                ylim = (ylim, field_y_max)
 
         # Smaller coordinate should always go first
         if xlim[0] > xlim[1]:
@@ -452,16 +466,16 @@ class BaseballField(BaseSurfacePlot):
         if ylim[0] > ylim[1]:
             ylim = (ylim[1], ylim[0])
 
-        # Constrain the limits from going beyond the end of the court (plus one
-        # additional unit of buffer)
+        # Constrain the limits from going beyond the edges of the field (plus
+        # one additional unit of buffer)
         xlim = (
-            max(xlim[0], -half_court_length),
-            min(xlim[1], half_court_length)
+            max(xlim[0], -half_field_width),
+            min(xlim[1], half_field_width)
         )
 
         ylim = (
-            max(ylim[0], -half_court_width),
-            min(ylim[1], half_court_width)
+            max(ylim[0], field_y_min),
+            min(ylim[1], field_y_max)
         )
 
         return xlim, ylim
@@ -12,10 +12,10 @@ comprise the attributes of the class.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.transforms import Affine2D
 import sportypy.features.basketball_features as basketball
+from sportypy._base_classes._base_surface import _Rotation
 from sportypy._base_classes._base_surface_plot import BaseSurfacePlot
+from sportypy._base_classes._profiling import profiled_draw
 
 
 class BasketballCourt(BaseSurfacePlot):
@@ -130,6 +130,18 @@ class BasketballCourt(BaseSurfacePlot):
     coaches_box_length : float (default: 28.0; 28')
         The length of the coaches box, when measured from the interior edge of
         the baseline to the edge of the coaches box nearest the baseline
+
+    arc_tolerance : float or None (default: None)
+        The maximum allowable distance between the arcs of the court's features
+        and the chords used to draw them. This should be provided in the same
+        units as the court. If supplied, this takes precedence over dpi
+
+    dpi : float or None (default: 300.0)
+        The resolution (in dots per inch) at which the court is expected to be
+        rendered. The court's arcs are traced with only as many points as are
+        needed to keep them accurate to within half of a pixel at this
+        resolution. If both arc_tolerance and dpi are None, each feature's
+        arcs are traced to within 0.1% of their radius
     """
 
     def __init__(self, rotation = 0.0, x_trans = 0.0, y_trans = 0.0,
@@ -162,10 +174,11 @@ class BasketballCourt(BaseSurfacePlot):
                  substitution_area = {}, free_throw_lane_boundary = {},
                  free_throw_circle_outline = {}, paint = {},
                  restricted_arc = {}, colors_dict = {}, backboard = {},
-                 basket_ring = {}, net = {}, **added_features):
+                 basket_ring = {}, net = {}, arc_tolerance = None,
+                 dpi = 300.0, **added_features):
         # Set the rotation of the plot to be the supplied rotation
         # value
-        self._rotation = Affine2D().rotate_deg(rotation)
+        self._rotation = _Rotation().rotate_deg(rotation)
 
         # Set the court's necessary shifts. This will overwrite the
         # default values of x_trans and y_trans inherited from the
@@ -236,8 +249,11 @@ class BasketballCourt(BaseSurfacePlot):
         # Substitution Area
         self.substitution_area_length = substitution_area_length
 
+        # Determine how closely the features' arcs must be traced
+        self.arc_tolerance = self._get_arc_tolerance(arc_tolerance, dpi)
+
         # Create a container for the relevant features of a basketball court
-        self._features = []
+        self._feature_specs = []
 
         # Initialize the x and y limits for the plot to be None. These
         # will get set when calling the draw() method below
@@ -292,7 +308,7 @@ class BasketballCourt(BaseSurfacePlot):
             'visible': False
         }
         self._initialize_feature(court_constraint)
-        self._surface_constraint = self._features.pop(-1)
+        self._surface_constraint = self._feature_specs.pop(-1)
 
         # Initialize the offensive half of the court
         offensive_halfcourt_params = {
@@ -793,8 +809,9 @@ class BasketballCourt(BaseSurfacePlot):
         for added_feature in added_features.values():
             self._initialize_feature(added_feature)
 
+    @profiled_draw
     def draw(self, ax = None, display_range = 'full', xlim = None, ylim = None,
-             rotation = None):
+             rotation = None, batched = False):
         """Draw the court.
 
         Parameters
@@ -831,14 +848,20 @@ class BasketballCourt(BaseSurfacePlot):
             self._rotation. A value of 0.0 will correspond to a TV View
             of the court, where +x is to the right and +y is on top. The
             rotation occurs counter clockwise
+
+        batched : bool (default: False)
+            Whether to draw the features of the court in a few batched
+            collections rather than as one patch per feature. The result
+            looks the same, but is much faster to draw and redraw
         """
         # If there is a rotation to be applied, apply it first and set it as
         # the class attribute self._rotation
         if rotation:
-            self._rotation = Affine2D().rotate_deg(rotation)
+            self._rotation = _Rotation().rotate_deg(rotation)
 
         # If an Axes object is not provided, create one to use for plotting
         if ax is None:
+            import matplotlib.pyplot as plt
             fig, ax = plt.subplots()
             fig.patch.set_facecolor(self.feature_colors['court_background'])
             fig.set_size_inches(50, 50)
@@ -852,10 +875,16 @@ class BasketballCourt(BaseSurfacePlot):
         # Get the transformation to apply
         transform = self._get_transform(ax)
 
+        # If the features are to be batched, add them all at once
+        if batched:
+            self._draw_features_batched(ax, transform)
+
         # Add each feature
         for feature in self._features:
-            # Start by adding the feature to the current Axes object
-            feature.draw(ax, transform)
+            # Start by adding the feature to the current Axes object, unless
+            # it's already been added in a batch
+            if not batched:
+                feature.draw(ax, transform)
 
             try:
                 # Check the feature's visibility
@@ -870,14 +899,14 @@ class BasketballCourt(BaseSurfacePlot):
             # within the bounds of the court
             if visible and not isinstance(feature, basketball.CourtConstraint):
                 try:
-                    feature_df = feature._translate_feature()
+                    feature_pts = feature._translate_feature()
 
                     # If the feature doesn't have a limitation on x, set its
                     # limits to be its minimum and maximum values of x
                     if self._feature_xlim is None:
                         self._feature_xlim = [
-                            feature_df['x'].min(),
-                            feature_df['x'].max()
+                            feature_pts[:, 0].min(),
+                            feature_pts[:, 0].max()
                         ]
 
                     # Otherwise, set the limits to be the smaller of its
@@ -885,16 +914,16 @@ class BasketballCourt(BaseSurfacePlot):
                     # of its specified maximum and largest x value
                     else:
                         self._feature_xlim = [
-                            min(self._feature_xlim[0], feature_df['x'].min()),
-                            max(self._feature_xlim[0], feature_df['x'].max())
+                            min(self._feature_xlim[0], feature_pts[:, 0].min()),
+                            max(self._feature_xlim[1], feature_pts[:, 0].max())
                         ]
 
                     # If the feature doesn't have a limitation on y, set its
                     # limits to be its minimum and maximum values of y
                     if self._feature_ylim is None:
                         self._feature_ylim = [
-                            feature_df['y'].min(),
-                            feature_df['y'].max()
+                            feature_pts[:, 1].min(),
+                            feature_pts[:, 1].max()
                         ]
 
                     # Otherwise, set the limits to be the smaller of its
@@ -902,8 +931,8 @@ class BasketballCourt(BaseSurfacePlot):
                     # of its specified maximum and largest y value
                     else:
                         self._feature_ylim = [
-                            min(self._feature_ylim[0], feature_df['y'].min()),
-                            max(self._feature_ylim[0], feature_df['y'].max())
+                            min(self._feature_ylim[0], feature_pts[:, 1].min()),
+                            max(self._feature_ylim[1], feature_pts[:, 1].max())
                         ]
 
                 except TypeError:
@@ -1069,6 +1098,147 @@ class BasketballCourt(BaseSurfacePlot):
 
         return xlim, ylim
 
+    # The zones that shots may be classified into by the classify_shots()
+    # method. A shot's zone is its index in this tuple
+    shot_zones = (
+        'restricted_area',
+        'paint',
+        'mid_range',
+        'corner_three',
+        'above_the_break_three',
+        'backcourt',
+        'out_of_bounds'
+    )
+
+    def classify_shots(self, x, y, side = None):
+        """Classify shots by the zone of the court they were taken from.
+
+        The zones are determined analytically from the court's dimensions, so
+        this is vectorized and works quickly over millions of shots. A shot
+        that lies in more than one zone is given the first of the following
+        that applies:
+
+            'out_of_bounds' : the shot was taken from outside of the court (or
+                a coordinate is missing)
+
+            'backcourt' : the shot was taken from the other half of the court
+                than the basket being shot at
+
+            'restricted_area' : the shot was taken inside of the restricted
+                arc (including the arc itself) and in front of the backboard
+
+            'paint' : the shot was taken inside of the free-throw lane
+
+            'corner_three' : the shot was taken beyond the straight part of
+                the three-point line, along the baseline
+
+            'above_the_break_three' : the shot was taken beyond the
+                three-point arc
+
+            'mid_range' : any other two-point shot
+
+        The three-point line itself is part of the two-point range
+
+        Parameters
+        ----------
+        x : float or array-like
+            The x coordinate(s) of the shots, in the same coordinate system as
+            the data being plotted
+
+        y : float or array-like
+            The y coordinate(s) of the shots, in the same coordinate system as
+            the data being plotted
+
+        side : str or None (default: None)
+            The basket being shot at. This may be 'right' (the TV-right basket)
+            or 'left' (the TV-left basket). If None, each shot is assumed to be
+            at the basket nearest to it, and no shots are in the backcourt
+
+        Returns
+        -------
+        zones : pandas.Categorical
+            The zone of each shot. The categories are given (in order) by the
+            shot_zones attribute
+
+        distance : numpy.ndarray
+            The distance of each shot from the center of the basket being shot
+            at, in the units of the court
+        """
+        import pandas as pd
+
+        # Undo the shift of the court so the shots are relative to center
+        # court
+        x = np.ravel(x) - self.x_trans
+        y = np.ravel(y) - self.y_trans
+
+        # Mirror the shots so that every shot is at the TV-right basket
+        if side is None:
+            x_basket = np.abs(x)
+        elif side.lower() == 'right':
+            x_basket = x
+        elif side.lower() == 'left':
+            x_basket = -x
+        else:
+            raise ValueError("side must be 'right', 'left', or None")
+
+        abs_y = np.abs(y)
+
+        # Find the distance of each shot from the center of the basket, as well
+        # as how far in front of the basket it was taken
+        x_from_basket = self.basket_center_x - x_basket
+        distance = np.hypot(x_from_basket, y)
+
+        # The corner threes lie beyond the straight part of the three-point
+        # line, which ends where it meets the arc
+        three_point_half_width = self.three_point_arc_width / 2.0
+        corner_depth = np.sqrt(max(
+            self.three_point_arc_distance ** 2 - three_point_half_width ** 2,
+            0.0
+        ))
+
+        # Assign the zones in reverse order of precedence, so that the zone
+        # with the highest precedence is assigned last
+        codes = np.full(x.shape, self.shot_zones.index('mid_range'),
+                        dtype = np.int8)
+
+        # Shots beyond the arc's radius but between the straight parts of the
+        # line (which happens behind the basket when the arc is wider than the
+        # straight parts, as it is outside of the NBA) are still twos
+        is_corner = (
+            (abs_y > three_point_half_width) &
+            (x_from_basket <= corner_depth)
+        )
+        is_above_the_break = (
+            ~is_corner &
+            (x_from_basket > corner_depth) &
+            (distance > self.three_point_arc_distance)
+        )
+        codes[is_corner] = self.shot_zones.index('corner_three')
+        codes[is_above_the_break] = self.shot_zones.index(
+            'above_the_break_three'
+        )
+
+        is_paint = (
+            (x_basket >= self.half_court_length - self.free_throw_lane_length) &
+            (abs_y <= self.free_throw_lane_width / 2.0)
+        )
+        codes[is_paint] = self.shot_zones.index('paint')
+
+        is_restricted_area = (
+            (distance <= self.restricted_arc_radius) &
+            (x_basket <= self.backboard_face_x)
+        )
+        codes[is_restricted_area] = self.shot_zones.index('restricted_area')
+
+        codes[x_basket < 0.0] = self.shot_zones.index('backcourt')
+
+        is_inside = self._surface_constraint.contains(x, y)
+        codes[~is_inside] = self.shot_zones.index('out_of_bounds')
+
+        zones = pd.Categorical.from_codes(codes, categories = self.shot_zones)
+
+        return zones, distance
+
 
 class NBACourt(BasketballCourt):
     """A regulation NBA basketball court.
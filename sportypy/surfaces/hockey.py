@@ -10,10 +10,11 @@ comprise the attributes of the class.
 @author: Ross Drucker
 """
 
-import matplotlib.pyplot as plt
-from matplotlib.transforms import Affine2D
+import numpy as np
 import sportypy.features.hockey_features as hockey
+from sportypy._base_classes._base_surface import _Rotation
 from sportypy._base_classes._base_surface_plot import BaseSurfacePlot
+from sportypy._base_classes._profiling import profiled_draw
 
 
 class HockeyRink(BaseSurfacePlot):
@@ -86,6 +87,18 @@ class HockeyRink(BaseSurfacePlot):
     goal_line_dist : float (default: 11.0)
         The distance from the end boards to the goal line. Be sure to set the
         'x_justify': and 'y_position' units correctly for this feature
+
+    arc_tolerance : float or None (default: None)
+        The maximum allowable distance between the arcs of the rink's features
+        and the chords used to draw them. This should be provided in the same
+        units as the rink. If supplied, this takes precedence over dpi
+
+    dpi : float or None (default: 300.0)
+        The resolution (in dots per inch) at which the rink is expected to be
+        rendered. The rink's arcs are traced with only as many points as are
+        needed to keep them accurate to within half of a pixel at this
+        resolution. If both arc_tolerance and dpi are None, each feature's
+        arcs are traced to within 0.1% of their radius
     """
 
     def __init__(self, rotation = 0.0, x_trans = 0.0, y_trans = 0.0,
@@ -115,10 +128,11 @@ class HockeyRink(BaseSurfacePlot):
                  nzone_faceoff_spot = {}, nzone_faceoff_spot_stripe = {},
                  referee_crease = {}, goal_crease_outline = {},
                  goal_crease_fill = {}, goal_frame_outline = {},
-                 goal_fill = {}, **added_features):
+                 goal_fill = {}, arc_tolerance = None,
+                 dpi = 300.0, **added_features):
         # Set the rotation of the plot to be the supplied rotation
         # value
-        self._rotation = Affine2D().rotate_deg(rotation)
+        self._rotation = _Rotation().rotate_deg(rotation)
 
         # Set the rink's necessary shifts. This will overwrite the
         # default values of x_trans and y_trans inherited from the
@@ -159,8 +173,11 @@ class HockeyRink(BaseSurfacePlot):
         self.nzone_faceoff_spot_x -= zone_line_nzone_faceoff_dist_x
         self.nzone_faceoff_spot_y = nzone_faceoff_spot_y
 
+        # Determine how closely the features' arcs must be traced
+        self.arc_tolerance = self._get_arc_tolerance(arc_tolerance, dpi)
+
         # Create a container for the relevant features of an ice rink
-        self._features = []
+        self._feature_specs = []
 
         # Initialize the x and y limits for the plot to be None. These
         # will get set when calling the draw() method below
@@ -241,7 +258,7 @@ class HockeyRink(BaseSurfacePlot):
         self._initialize_feature(boards_constraint_params)
 
         # Set this feature to be the surface's constraint
-        self._surface_constraint = self._features.pop(-1)
+        self._surface_constraint = self._feature_specs.pop(-1)
 
         # Initialize the neutral zone
         nzone_params = {
@@ -839,8 +856,9 @@ class HockeyRink(BaseSurfacePlot):
         }
         self._initialize_feature(goal_fill_params)
 
+    @profiled_draw
     def draw(self, ax = None, display_range = 'full', xlim = None, ylim = None,
-             rotation = None):
+             rotation = None, batched = False):
         """Draw the rink.
 
         Parameters
@@ -925,14 +943,20 @@ class HockeyRink(BaseSurfacePlot):
             self._rotation. A value of 0.0 will correspond to a TV View
             of the rink, where +x is to the right and +y is on top. The
             rotation occurs counter clockwise
+
+        batched : bool (default: False)
+            Whether to draw the features of the rink in a few batched
+            collections rather than as one patch per feature. The result
+            looks the same, but is much faster to draw and redraw
         """
         # If there is a rotation to be applied, apply it first and set it as
         # the class attribute self._rotation
         if rotation:
-            self._rotation = Affine2D().rotate_deg(rotation)
+            self._rotation = _Rotation().rotate_deg(rotation)
 
         # If an Axes object is not provided, create one to use for plotting
         if ax is None:
+            import matplotlib.pyplot as plt
             fig, ax = plt.subplots()
             fig.patch.set_facecolor(self.feature_colors['plot_background'])
             fig.set_size_inches(50, 50)
@@ -946,10 +970,16 @@ class HockeyRink(BaseSurfacePlot):
         # Get the transformation to apply
         transform = self._get_transform(ax)
 
+        # If the features are to be batched, add them all at once
+        if batched:
+            self._draw_features_batched(ax, transform)
+
         # Add each feature
         for feature in self._features:
-            # Start by adding the feature to the current Axes object
-            feature.draw(ax, transform)
+            # Start by adding the feature to the current Axes object, unless
+            # it's already been added in a batch
+            if not batched:
+                feature.draw(ax, transform)
 
             try:
                 # Check the feature's visibility
@@ -964,14 +994,14 @@ class HockeyRink(BaseSurfacePlot):
             # bounds of the rink
             if visible and not isinstance(feature, hockey.Boards):
                 try:
-                    feature_df = feature._translate_feature()
+                    feature_pts = feature._translate_feature()
 
                     # If the feature doesn't have a limitation on x, set its
                     # limits to be its minimum and maximum values of x
                     if self._feature_xlim is None:
                         self._feature_xlim = [
-                            feature_df['x'].min(),
-                            feature_df['x'].max()
+                            feature_pts[:, 0].min(),
+                            feature_pts[:, 0].max()
                         ]
 
                     # Otherwise, set the limits to be the smaller of its
@@ -979,16 +1009,16 @@ class HockeyRink(BaseSurfacePlot):
                     # of its specified maximum and largest x value
                     else:
                         self._feature_xlim = [
-                            min(self._feature_xlim[0], feature_df['x'].min()),
-                            max(self._feature_xlim[0], feature_df['x'].max())
+                            min(self._feature_xlim[0], feature_pts[:, 0].min()),
+                            max(self._feature_xlim[1], feature_pts[:, 0].max())
                         ]
 
                     # If the feature doesn't have a limitation on y, set its
                     # limits to be its minimum and maximum values of y
                     if self._feature_ylim is None:
                         self._feature_ylim = [
-                            feature_df['y'].min(),
-                            feature_df['y'].max()
+                            feature_pts[:, 1].min(),
+                            feature_pts[:, 1].max()
                         ]
 
                     # Otherwise, set the limits to be the smaller of its
@@ -996,8 +1026,8 @@ class HockeyRink(BaseSurfacePlot):
                     # of its specified maximum and largest y value
                     else:
                         self._feature_ylim = [
-                            min(self._feature_ylim[0], feature_df['y'].min()),
-                            max(self._feature_ylim[0], feature_df['y'].max())
+                            min(self._feature_ylim[0], feature_pts[:, 1].min()),
+                            max(self._feature_ylim[1], feature_pts[:, 1].max())
                         ]
 
                 except TypeError:
@@ -1189,6 +1219,160 @@ class HockeyRink(BaseSurfacePlot):
 
         return xlim, ylim
 
+    # The regions of the rink that points may be classified into by the
+    # classify() method. A point's region is its index in this tuple
+    rink_regions = (
+        'offensive_zone',
+        'neutral_zone',
+        'defensive_zone',
+        'goal_crease',
+        'faceoff_circle',
+        'trapezoid',
+        'outside'
+    )
+
+    def classify(self, x, y):
+        """Classify points by the region of the rink they lie in.
+
+        The regions are determined analytically from the rink's features, so
+        this is vectorized and works quickly over millions of points. A point
+        that lies in more than one region is given the first of the following
+        that applies:
+
+            'outside' : the point is beyond the boards (or a coordinate is
+                missing)
+
+            'goal_crease' : the point is inside of either goal crease,
+                including the crease's outline
+
+            'trapezoid' : the point is inside of either goalkeeper's
+                restricted area. This only applies to rinks where the
+                restricted area is visible
+
+            'faceoff_circle' : the point is inside of any of the faceoff
+                circles, including the one at center ice
+
+            'offensive_zone' : the point is beyond the TV-right zone line
+
+            'neutral_zone' : the point is between the outer edges of the zone
+                lines, so the zone lines are part of the neutral zone
+
+            'defensive_zone' : the point is beyond the TV-left zone line
+
+        Parameters
+        ----------
+        x : float or array-like
+            The x coordinate(s) of the points, in the same coordinate system as
+            the data being plotted
+
+        y : float or array-like
+            The y coordinate(s) of the points, in the same coordinate system as
+            the data being plotted
+
+        Returns
+        -------
+        regions : pandas.Categorical
+            The region of each point. The categories are given (in order) by
+            the rink_regions attribute
+        """
+        import pandas as pd
+
+        # Undo the shift of the rink so the points are relative to center ice
+        x = np.ravel(x) - self.x_trans
+        y = np.ravel(y) - self.y_trans
+
+        # Start by placing each point in its zone. The neutral zone includes
+        # the zone lines
+        zone_line_x = (self.nzone_length / 2.0) + self.major_line_thickness
+        codes = np.full(x.shape, self.rink_regions.index('neutral_zone'),
+                        dtype = np.int8)
+        codes[x > zone_line_x] = self.rink_regions.index('offensive_zone')
+        codes[x < -zone_line_x] = self.rink_regions.index('defensive_zone')
+
+        # Then assign the regions in reverse order of precedence, so that the
+        # region with the highest precedence is assigned last
+        # A reflected circle is the same circle, so each circle is only
+        # checked once
+        faceoff_circles = {
+            (feature.x_anchor, feature.y_anchor, feature.feature_radius)
+            for feature in self._features
+            if isinstance(feature, (hockey.CenterFaceoffCircle,
+                                    hockey.OzoneDzoneFaceoffCircle))
+        }
+
+        for circle_x, circle_y, circle_radius in faceoff_circles:
+            # Find the squared distance of each point from the circle's center
+            dist_sq = x - circle_x
+            dist_sq *= dist_sq
+            dy_sq = y - circle_y
+            dy_sq *= dy_sq
+            dist_sq += dy_sq
+
+            in_circle = dist_sq <= circle_radius ** 2
+            codes[in_circle] = self.rink_regions.index('faceoff_circle')
+
+        for feature in self._features:
+            if not (isinstance(feature, hockey.GoalkeepersRestrictedArea) and
+                    feature.visible):
+                continue
+
+            # Find the coordinates of each point relative to the feature's
+            # anchor, undoing any reflection of the feature
+            feature_x = (x - feature.x_anchor) * feature.x_reflection
+            feature_y = (y - feature.y_anchor) * feature.y_reflection
+
+            # The trapezoid narrows linearly from the end boards to the goal
+            # line
+            end_boards_x = -self.rink_length / 2.0
+            depth = feature.goal_line_x - end_boards_x
+            half_width = (feature.short_base_width / 2.0) + (
+                (feature.long_base_width - feature.short_base_width) / 2.0 *
+                (feature.goal_line_x - feature_x) / depth
+            )
+
+            in_trapezoid = (
+                (feature_x >= end_boards_x) &
+                (feature_x <= feature.goal_line_x) &
+                (np.abs(feature_y) <= half_width)
+            )
+            codes[in_trapezoid] = self.rink_regions.index('trapezoid')
+
+        for feature in self._features:
+            if not isinstance(feature, hockey.GoalCreaseFill):
+                continue
+
+            feature_x = (x - feature.x_anchor) * feature.x_reflection
+            feature_y = (y - feature.y_anchor) * feature.y_reflection
+
+            # The crease (including its outline) begins where it's drawn
+            # from, which is offset from the goal line by the crease's
+            # justification in the same way as the GoalCreaseOutline feature
+            if feature.x_justify == 'left':
+                start_x = 0.0
+
+            elif feature.x_justify == 'right':
+                start_x = feature.feature_thickness
+
+            else:
+                start_x = feature.feature_thickness / 2.0
+
+            # The crease is then the part of a circle centered at its start
+            # that lies in front of its start and within its half-width
+            crease_x = feature_x - feature.goal_line_x - start_x
+            in_crease = (
+                (crease_x >= 0.0) &
+                (np.abs(feature_y) <= feature.goal_crease_width) &
+                ((crease_x * crease_x) + (feature_y * feature_y) <=
+                 feature.feature_radius ** 2)
+            )
+            codes[in_crease] = self.rink_regions.index('goal_crease')
+
+        # Finally, mark the points that aren't on the ice at all
+        is_inside = self._surface_constraint.contains(x, y)
+        codes[~is_inside] = self.rink_regions.index('outside')
+
+        return pd.Categorical.from_codes(codes, categories = self.rink_regions)
+
 
 class IIHFRink(HockeyRink):
     """A regulation IIHF (International Ice Hockey Federation) rink.
@@ -0,0 +1,299 @@
+"""Extension of the BaseSurfacePlot class to load a surface from a file.
+
+A surface's export_geometry() method writes every one of its features with
+their coordinates already computed. This surface reads such a file and draws
+the features exactly as the original surface would, without computing any
+geometry, so that it is quick to create even in a fresh process.
+
+@author: Ross Drucker
+"""
+
+import os
+from sportypy._base_classes._geometry_io import read_geometry
+from sportypy._base_classes._base_surface import _Rotation, _FeatureSpec
+from sportypy._base_classes._base_surface_plot import BaseSurfacePlot
+from sportypy._base_classes._profiling import profiled_draw
+from sportypy.features.precomputed_features import PrecomputedFeature
+
+
+class PrecomputedSurface(BaseSurfacePlot):
+    """A surface whose features are loaded from a geometry file.
+
+    The file may be in either of the formats written by a surface's
+    export_geometry() method. As with any other surface, the surfaces loaded
+    from the same file are cached until the file is modified. Methods that
+    depend on the rules of a sport, such as classify(), are not available
+
+    Attributes
+    ----------
+    path : str
+        The path of the file the surface was loaded from
+
+    surface_name : str
+        The name of the class of the surface that wrote the file
+
+    feature_colors : dict
+        The colors of the original surface's features. Only the
+        'plot_background' color is used by this surface
+
+    rotation : float or None (default: None)
+        The angle (in degrees) through which to rotate the final plot. If
+        None, the rotation of the original surface is used
+    """
+
+    def __init__(self, path, rotation = None):
+        metadata, features, constraint = read_geometry(path)
+
+        self.path = path
+        self.surface_name = metadata.get('surface')
+        self.feature_colors = metadata.get('feature_colors') or {}
+
+        # Set the shift and units of the original surface
+        self.x_trans = metadata.get('x_trans', 0.0)
+        self.y_trans = metadata.get('y_trans', 0.0)
+        self.rulebook_unit = metadata.get('rulebook_unit', 'ft')
+
+        # Use the original surface's rotation unless another is supplied
+        if rotation is None:
+            self._rotation = _Rotation(metadata.get('rotation'))
+        else:
+            self._rotation = _Rotation().rotate_deg(rotation)
+
+        # The extent of the features and the display ranges were computed
+        # when the file was written
+        self._feature_xlim = metadata.get('feature_xlim')
+        self._feature_ylim = metadata.get('feature_ylim')
+        self._display_ranges = metadata.get('display_ranges') or {}
+
+        self.arc_tolerance = None
+        self._surface_key = None
+
+        # Store the features so that they're created when first needed, like
+        # those of any other surface
+        self._feature_specs = [
+            self._get_feature_spec(record, pts) for record, pts in features
+        ]
+
+        if constraint is not None:
+            self._surface_constraint = self._get_feature_spec(*constraint)
+
+        else:
+            self._surface_constraint = None
+
+    @classmethod
+    def _get_cache_token(cls, path, *args, **kwargs):
+        """Get the modification time and size of the surface's file.
+
+        This way, a surface that was cached is loaded again if its file is
+        rewritten
+
+        Returns
+        -------
+        token : tuple (int, int)
+            The modification time (in nanoseconds) and size of the file
+        """
+        stat = os.stat(path)
+
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _get_feature_spec(record, pts):
+        """Get the specification of a feature read from a geometry file.
+
+        Parameters
+        ----------
+        record : dict
+            The feature's class name, visibility, and plotting arguments
+
+        pts : numpy.ndarray
+            The (N, 2) array of the feature's coordinates
+
+        Returns
+        -------
+        spec : _FeatureSpec
+            The specification from which the feature will be instantiated
+        """
+        params = {
+            'feature_pts': pts,
+            'feature_class': record.get('class'),
+            'x_anchor': 0.0,
+            'y_anchor': 0.0,
+            'reflect_x': False,
+            'reflect_y': False,
+            'visible': record.get('visible', True),
+            **record.get('plot_kwargs', {})
+        }
+
+        return _FeatureSpec(PrecomputedFeature, params)
+
+    @profiled_draw
+    def draw(self, ax = None, display_range = 'full', xlim = None, ylim = None,
+             rotation = None, batched = False):
+        """Draw the surface.
+
+        Parameters
+        ----------
+        ax : matplotlib.Axes
+            An axes object onto which the plot can be drawn. If None is
+            supplied, then the currently-active Axes object will be used
+
+        display_range : str; default "full"
+            The portion of the surface to display. This may be any of the
+            display ranges that were written to the file by the original
+            surface's export_geometry() method. Any other value displays the
+            full surface
+
+        xlim : float, tuple (float, float), or None (default: None)
+            The display range in the x direction to be used. If a single
+            float is provided, this will be used as the lower bound of
+            the x coordinates to display and the upper bound will be the
+            +x end of the full surface. If a tuple, the two values will be
+            used to determine the bounds. If None, then the display_range
+            will be used instead to set the bounds
+
+        ylim : float, tuple (float, float), or None (default: None)
+            The display range in the y direction to be used. If a single
+            float is provided, this will be used as the lower bound of
+            the y coordinates to display and the upper bound will be the
+            +y end of the full surface. If a tuple, the two values will be
+            used to determine the bounds. If None, then the display_range
+            will be used instead to set the bounds
+
+        rotation : float or None (default: None)
+            Angle (in degrees) through which to rotate the surface when
+            drawing. If used, this will set the class attribute of
+            self._rotation
+
+        batched : bool (default: False)
+            Whether to draw the features of the surface in a few batched
+            collections rather than as one patch per feature. The result
+            looks the same, but is much faster to draw and redraw
+        """
+        # If there is a rotation to be applied, apply it first and set it as
+        # the class attribute self._rotation
+        if rotation:
+            self._rotation = _Rotation().rotate_deg(rotation)
+
+        # If an Axes object is not provided, create one to use for plotting
+        if ax is None:
+            import matplotlib.pyplot as plt
+            fig, ax = plt.subplots()
+            fig.patch.set_facecolor(
+                self.feature_colors.get('plot_background', 'none')
+            )
+            fig.set_size_inches(50, 50)
+            ax = plt.gca()
+
+        # Set the aspect ratio to be equal and remove the axis to leave only
+        # the plot
+        ax.set_aspect('equal')
+        ax.axis('off')
+
+        # Get the transformation to apply
+        transform = self._get_transform(ax)
+
+        # Add the features, either all at once or one at a time
+        if batched:
+            self._draw_features_batched(ax, transform)
+
+        else:
+            for feature in self._features:
+                feature.draw(ax, transform)
+
+        # Set the plot's display range
+        ax = self.set_plot_display_range(ax, display_range, xlim, ylim)
+
+        return ax
+
+    def _get_plot_range_limits(self, display_range = 'full', xlim = None,
+                               ylim = None):
+        """Get the x and y limits for the displayed plot.
+
+        Parameters
+        ----------
+            display_range : str (default: 'full')
+                The range of which to display the plot. This is a key that will
+                be searched for in the display ranges read from the file
+
+            xlim : float or None (default: None)
+                A specific limit on x for the plot
+
+            ylim : float or None (default: None)
+                A specific limit on y for the plot
+
+        Returns
+        -------
+            xlim : tuple
+                The x-directional limits for displaying the plot
+            ylim : tuple
+                The y-directional limits for displaying the plot
+        """
+        # Copy the supplied xlim and ylim parameters so as not to overwrite
+        # the initial memory
+        xlim = self.copy_(xlim)
+        ylim = self.copy_(ylim)
+
+        # The full surface bounds every other display range
+        full = self._display_ranges.get('full')
+        if full is None:
+            full = {
+                'xlim': self._feature_xlim or (0.0, 0.0),
+                'ylim': self._feature_ylim or (0.0, 0.0)
+            }
+
+        full_xlim = tuple(full['xlim'])
+        full_ylim = tuple(full['ylim'])
+
+        # Find the display range, defaulting to the full surface
+        display_range = display_range.lower()
+        limits = self._display_ranges.get(
+            display_range,
+            self._display_ranges.get(display_range.replace(' ', ''), full)
+        )
+
+        # Set the x limits of the plot if they are not provided
+        if not xlim:
+            xlim = tuple(limits['xlim'])
+
+        # If an x limit is provided, try to use it
+        else:
+            try:
+                xlim = (xlim[0] - self.x_trans, xlim[1] - self.x_trans)
+
+            # If the limit provided is not a tuple, use the provided value as
+            # the lower limit of x, and display any x values greater than it
+            except TypeError:
+                xlim = xlim - self.x_trans
+
+                if xlim >= full_xlim[1]:
+                    xlim = full_xlim[0]
+
+                xlim = (xlim, full_xlim[1])
+
+        # Otherwise, repeat the process above but for y
+        if not ylim:
+            ylim = tuple(limits['ylim'])
+
+        else:
+            try:
+                ylim = (ylim[0] - self.y_trans, ylim[1] - self.y_trans)
+
+            except TypeError:
+                ylim = ylim - self.y_trans
+
+                if ylim >= full_ylim[1]:
+                    ylim = full_ylim[0]
+
+                ylim = (ylim, full_ylim[1])
+
+        # Smaller coordinate should always go first
+        if xlim[0] > xlim[1]:
+            xlim = (xlim[1], xlim[0])
+        if ylim[0] > ylim[1]:
+            ylim = (ylim[1], ylim[0])
+
+        # Constrain the limits from going beyond the full surface
+        xlim = (max(xlim[0], full_xlim[0]), min(xlim[1], full_xlim[1]))
+        ylim = (max(ylim[0], full_ylim[0]), min(ylim[1], full_ylim[1]))
+
+        return xlim, ylim
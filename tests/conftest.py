@@ -0,0 +1,9 @@
+"""Shared configuration of the tests.
+
+@author: Ross Drucker
+"""
+import matplotlib
+
+
+# Draw every plot without a display
+matplotlib.use('Agg')
@@ -0,0 +1,217 @@
+"""Tests of binning points for the surfaces' density plots.
+
+@author: Ross Drucker
+"""
+import numpy as np
+import pytest
+import matplotlib.pyplot as plt
+from sportypy._base_classes._aggregation import _GridAggregator, _HexAggregator
+from sportypy.surfaces.hockey import NHLRink
+
+
+def _get_points(n_points = 5000):
+    """Get random points, and values for them."""
+    rng = np.random.default_rng(0)
+
+    return (
+        rng.uniform(-3.0, 3.0, n_points),
+        rng.uniform(-2.0, 2.0, n_points),
+        rng.normal(size = n_points)
+    )
+
+
+def test_grid_statistics_match_a_histogram():
+    x, y, values = _get_points()
+    aggregator = _GridAggregator((-3.0, 3.0), (-2.0, 2.0), 0.5)
+
+    # Adding the points in chunks gives the same bins as adding them at once
+    aggregator.add(x[:1000], y[:1000], values[:1000])
+    aggregator.add(x[1000:], y[1000:], values[1000:])
+
+    counts, _, _ = np.histogram2d(
+        y,
+        x,
+        bins = (aggregator.y_edges, aggregator.x_edges)
+    )
+    sums, _, _ = np.histogram2d(
+        y,
+        x,
+        bins = (aggregator.y_edges, aggregator.x_edges),
+        weights = values
+    )
+
+    assert aggregator.shape == (8, 12)
+    assert np.array_equal(aggregator.reduce('count'), counts)
+    assert np.allclose(aggregator.reduce('sum'), sums)
+    assert np.allclose(aggregator.reduce('mean'), sums / counts)
+
+
+def test_grid_edges_and_minimum_counts():
+    aggregator = _GridAggregator((0.0, 2.0), (0.0, 1.0), 1.0)
+    aggregator.add(
+        [0.0, 2.0, 2.0, 2.5, -0.5, np.nan],
+        [0.0, 1.0, 0.5, 0.5, 0.5, 0.5]
+    )
+
+    # Points on the upper edges belong to the last bins, and points beyond
+    # the edges (or missing a coordinate) aren't binned
+    assert aggregator.reduce('count').tolist() == [[1.0, 2.0]]
+    assert np.isnan(aggregator.reduce('count', mincnt = 2)[0, 0])
+    assert aggregator.reduce('mean').tolist() == [[1.0, 1.0]]
+
+    with pytest.raises(ValueError):
+        aggregator.reduce('median')
+
+
+@pytest.mark.parametrize('gridsize', [20, (15, 9)])
+def test_hexagons_match_matplotlib(gridsize):
+    x, y, values = _get_points()
+    extent = (-3.0, 3.0, -2.0, 2.0)
+    aggregator = _HexAggregator(extent, gridsize)
+    aggregator.add(x, y, values)
+
+    fig, ax = plt.subplots()
+    counts = ax.hexbin(x, y, gridsize = gridsize, extent = extent, mincnt = 0)
+    sums = ax.hexbin(
+        x,
+        y,
+        C = values,
+        gridsize = gridsize,
+        extent = extent,
+        reduce_C_function = np.sum
+    )
+    plt.close(fig)
+
+    reduced = aggregator.reduce('sum', mincnt = 1)
+    is_drawn = ~np.isnan(reduced)
+
+    assert np.array_equal(aggregator.reduce('count'), counts.get_array())
+    assert np.allclose(aggregator.get_centers(), counts.get_offsets())
+    assert np.allclose(reduced[is_drawn], sums.get_array())
+    assert np.allclose(
+        aggregator.get_centers()[is_drawn],
+        sums.get_offsets()
+    )
+
+
+def test_binned_plots_keep_the_same_points_as_scatter():
+    rink = NHLRink(x_trans = 100.0, y_trans = 42.5)
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-10.0, 210.0, 20000)
+    y = rng.uniform(-10.0, 95.0, 20000)
+    values = rng.normal(size = 20000)
+    values[::50] = np.nan
+
+    fig, ax = plt.subplots()
+    points = rink.scatter(
+        x,
+        y,
+        values = values,
+        plot_range = 'offense',
+        symmetrize = True,
+        ax = ax
+    )
+    plt.close(fig)
+
+    xlim, ylim = rink.get_limits('offense')
+    chunks = list(rink._iter_plot_chunks(
+        x,
+        y,
+        values,
+        xlim,
+        ylim,
+        symmetrize = True,
+        chunk_size = 7000
+    ))
+
+    def _sort(pts):
+        return pts[np.lexsort(pts.T[::-1])]
+
+    # Each chunk is reflected on its own, so the points are in another order
+    binned = np.concatenate([
+        np.column_stack(chunk) for chunk in chunks
+    ])
+    scattered = np.column_stack((
+        points.get_offsets(),
+        points.get_array()
+    ))
+
+    assert len(scattered) > 0
+    assert np.array_equal(_sort(scattered), _sort(binned))
+
+
+def test_accumulator_bins_points_in_the_surface_coordinates():
+    rink = NHLRink(x_trans = 100.0, y_trans = 42.5)
+    accumulator = rink.accumulator(bin_size = 10.0)
+
+    # The center of the rink, a point reflected into another bin, a point
+    # beyond the boards and a missing point
+    accumulator.add(
+        [100.0, 150.0, 100.0, np.nan],
+        [42.5, 50.0, 100.0, 0.0],
+        [2.0, 4.0, 8.0, 16.0]
+    )
+
+    counts = accumulator.reduce('count')
+    x_centers, y_centers = accumulator.get_centers()
+
+    assert counts.sum() == 2
+    assert accumulator.reduce('sum').sum() == 6.0
+    assert counts[
+        np.searchsorted(accumulator.y_edges, 7.5) - 1,
+        np.searchsorted(accumulator.x_edges, 50.0) - 1
+    ] == 1
+
+    # A symmetrized point is also binned after being reflected over y = 0
+    symmetric = NHLRink().accumulator(bin_size = 10.0, symmetrize = True)
+    symmetric.add([50.0], [20.0], [3.0])
+
+    assert symmetric.reduce('count').sum() == 2
+    assert symmetric.reduce('count')[
+        np.searchsorted(symmetric.y_edges, -20.0) - 1,
+        np.searchsorted(symmetric.x_edges, 50.0) - 1
+    ] == 1
+    assert symmetric.reduce('sum').sum() == 6.0
+
+
+def test_merged_accumulators_match_one_accumulator():
+    rink = NHLRink()
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-100.0, 100.0, 10000)
+    y = rng.uniform(-42.5, 42.5, 10000)
+
+    whole = rink.accumulator(bin_size = 5.0).add(x, y)
+    first = rink.accumulator(bin_size = 5.0).add(x[:4000], y[:4000])
+    second = rink.accumulator(bin_size = 5.0).add(x[4000:], y[4000:])
+    first += second
+
+    assert np.array_equal(first.counts, whole.counts)
+    assert np.allclose(first.sums, whole.sums)
+
+    with pytest.raises(ValueError):
+        first.merge(rink.accumulator(bin_size = 2.0))
+
+
+def test_saved_accumulator_loads_unchanged(tmp_path):
+    rink = NHLRink(x_trans = 100.0)
+    rng = np.random.default_rng(0)
+    accumulator = rink.accumulator(bin_size = 5.0, symmetrize = True).add(
+        rng.uniform(0.0, 200.0, 1000),
+        rng.uniform(-42.5, 42.5, 1000),
+        rng.normal(size = 1000)
+    )
+
+    path = str(tmp_path / 'accumulator.npz')
+    accumulator.save(path)
+    loaded = rink.load_accumulator(path)
+
+    assert loaded.is_compatible(accumulator)
+    assert np.array_equal(loaded.counts, accumulator.counts)
+    assert np.array_equal(loaded.sums, accumulator.sums)
+
+    # Points added after loading are binned as they were before saving
+    loaded.add([150.0], [10.0])
+    assert loaded.counts.sum() == accumulator.counts.sum() + 2
+
+    with pytest.raises(ValueError):
+        NHLRink().load_accumulator(path)
@@ -0,0 +1,124 @@
+"""Tests of writing frames of tracking data over a surface.
+
+@author: Ross Drucker
+"""
+import numpy as np
+import pytest
+import matplotlib as mpl
+import matplotlib.image as mpimg
+from sportypy.surfaces.hockey import NHLRink
+
+
+def _get_frames(n):
+    """Get frames of a puck moving along the center of a rink."""
+    for i in range(n):
+        yield {'puck': ([-80.0 + (20.0 * i)], [0.0])}
+
+
+def _get_pixel(rink, image, x, y):
+    """Get the pixel of an image of a full rink at a point on the rink."""
+    x_min, x_max, y_min, y_max = rink._get_display_extent('full')
+    height, width = image.shape[:2]
+
+    column = int((x - x_min) / (x_max - x_min) * width)
+    row = int((y_max - y) / (y_max - y_min) * height)
+
+    return image[row, column]
+
+
+def test_writes_one_png_per_frame(tmp_path):
+    rink = NHLRink()
+    path = str(tmp_path / 'frame_{frame:03d}.png')
+
+    n_frames = rink.write_animation(
+        _get_frames(4),
+        path,
+        width = 201,
+        styles = {'puck': {'color': '#123456', 's': 200}}
+    )
+
+    assert n_frames == 4
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        f'frame_{i:03d}.png' for i in range(4)
+    ]
+
+    # Each frame is sized to the rink, rounded up to even dimensions
+    images = [
+        mpimg.imread(str(tmp_path / f'frame_{i:03d}.png')) for i in range(4)
+    ]
+    x_min, x_max, y_min, y_max = rink._get_display_extent('full')
+    height = int(round(202 * (y_max - y_min) / (x_max - x_min)))
+    height += height % 2
+
+    for image in images:
+        assert image.shape[:2] == (height, 202)
+
+    # The puck is only drawn where it is in each frame
+    puck_color = np.array([0x12, 0x34, 0x56]) / 255.0
+    for i, image in enumerate(images):
+        for j in range(4):
+            pixel = _get_pixel(rink, image, -80.0 + (20.0 * j), 0.0)
+            assert np.allclose(pixel[:3], puck_color, atol = 0.01) == (i == j)
+
+
+def test_numbers_frames_from_the_first_frame(tmp_path):
+    rink = NHLRink()
+    path = str(tmp_path / '{frame}.png')
+
+    n_frames = rink.write_animation(
+        _get_frames(3),
+        path,
+        width = 100,
+        first_frame = 10
+    )
+
+    assert n_frames == 3
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        '10.png', '11.png', '12.png'
+    ]
+
+
+def test_groups_missing_from_a_frame_are_hidden(tmp_path):
+    rink = NHLRink()
+    path = str(tmp_path / '{frame}.png')
+    frames = [
+        {'puck': ([0.0], [20.0])},
+        {}
+    ]
+
+    rink.write_animation(
+        frames,
+        path,
+        width = 200,
+        styles = {'puck': {'color': '#123456', 's': 200}}
+    )
+
+    puck_color = np.array([0x12, 0x34, 0x56]) / 255.0
+    first = mpimg.imread(str(tmp_path / '0.png'))
+    second = mpimg.imread(str(tmp_path / '1.png'))
+
+    assert np.allclose(
+        _get_pixel(rink, first, 0.0, 20.0)[:3],
+        puck_color,
+        atol = 0.01
+    )
+    assert not np.allclose(
+        _get_pixel(rink, second, 0.0, 20.0)[:3],
+        puck_color,
+        atol = 0.01
+    )
+
+
+def test_missing_ffmpeg_is_reported(tmp_path, monkeypatch):
+    monkeypatch.setitem(
+        mpl.rcParams,
+        'animation.ffmpeg_path',
+        str(tmp_path / 'missing-ffmpeg')
+    )
+
+    with pytest.raises(FileNotFoundError, match = 'ffmpeg'):
+        NHLRink().write_animation(
+            _get_frames(2),
+            str(tmp_path / 'replay.mp4'),
+            width = 100
+        )
@@ -0,0 +1,105 @@
+"""Tests of the shot zones of basketball courts.
+
+@author: Ross Drucker
+"""
+import numpy as np
+import pytest
+from matplotlib.path import Path
+import sportypy.features.basketball_features as basketball
+from sportypy.surfaces.basketball import (
+    NBACourt,
+    WNBACourt,
+    NCAACourt,
+    FIBACourt,
+    NFHSCourt
+)
+
+
+_courts = [NBACourt, WNBACourt, NCAACourt, FIBACourt, NFHSCourt]
+
+
+def _get_two_point_region(court):
+    """Get the region inside of the outer edge of the left three-point line.
+
+    The three-point line is traced from the baseline around its outer edge to
+    the baseline on the other side of the basket, so its points up to that
+    corner of the baseline enclose every two-point shot (including the line
+    itself)
+    """
+    line = next(
+        feature for feature in court._features
+        if isinstance(feature, basketball.ThreePointLine) and
+        feature.x_anchor < 0.0
+    )
+    pts = line._translate_feature()
+    half_width = court.three_point_arc_width / 2.0
+
+    corner = np.flatnonzero(
+        np.isclose(pts[:, 0], pts[0, 0]) &
+        np.isclose(pts[:, 1], -half_width)
+    )[0]
+
+    return Path(pts[:corner + 1], closed = False)
+
+
+@pytest.mark.parametrize('court_class', _courts)
+def test_three_point_shots_match_the_drawn_line(court_class):
+    court = court_class()
+    region = _get_two_point_region(court)
+
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-court.half_court_length, 0.0, 200000)
+    y = rng.uniform(-court.half_court_width, court.half_court_width, 200000)
+
+    zones, _ = court.classify_shots(x, y, side = 'left')
+    is_three = np.isin(
+        np.asarray(zones),
+        ['corner_three', 'above_the_break_three']
+    )
+    is_inbounds = np.asarray(zones) != 'out_of_bounds'
+
+    is_two = region.contains_points(np.column_stack((x, y)))
+
+    # The drawn arc is traced with chords, so points within the arc's
+    # tolerance of it may fall on either side
+    distance = np.hypot(x + court.basket_center_x, y)
+    is_clear = np.abs(distance - court.three_point_arc_distance) > (
+        2.0 * court.arc_tolerance
+    )
+
+    assert not np.any(is_three & is_two & is_inbounds & is_clear)
+    assert np.all(is_three | is_two | ~is_inbounds | ~is_clear)
+
+
+@pytest.mark.parametrize('court_class', _courts)
+def test_shots_along_the_baseline_inside_the_corner_are_twos(court_class):
+    court = court_class()
+    half_width = court.three_point_arc_width / 2.0
+
+    # Just inside of the corner line, at the baseline
+    x = np.array([-court.half_court_length + 0.01])
+    y = np.array([half_width - 0.01])
+
+    zones, _ = court.classify_shots(x, y, side = 'left')
+
+    assert zones[0] not in ('corner_three', 'above_the_break_three')
+
+
+@pytest.mark.parametrize('court_class', _courts)
+def test_zone_precedence(court_class):
+    court = court_class()
+    basket_x = -court.basket_center_x
+
+    zones, distance = court.classify_shots(
+        [basket_x + 0.1, court.half_court_length / 2.0, 0.0],
+        [0.0, 0.0, court.half_court_width + 1.0],
+        side = 'left'
+    )
+
+    # Courts without a restricted arc have the paint under the basket
+    under_the_basket = (
+        'restricted_area' if court.restricted_arc_radius > 0.1 else 'paint'
+    )
+
+    assert list(zones) == [under_the_basket, 'backcourt', 'out_of_bounds']
+    assert distance[0] == pytest.approx(0.1)
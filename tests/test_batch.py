@@ -0,0 +1,241 @@
+"""Tests of rendering many plots and long replays in parallel.
+
+@author: Ross Drucker
+"""
+import os
+import sys
+import tempfile
+import threading
+import numpy as np
+import pytest
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
+from sportypy.batch import _iter_bounded, render_batch, render_replay
+from sportypy.surfaces.hockey import NHLRink
+
+
+def _get_charts(directory, n_charts):
+    """Get charts of a few random shots each."""
+    rng = np.random.default_rng(0)
+
+    for i in range(n_charts):
+        yield {
+            'path': os.path.join(directory, 'charts', f'{i}.png'),
+            'layers': [
+                {
+                    'kind': 'scatter',
+                    'x': rng.uniform(-100.0, 100.0, 20),
+                    'y': rng.uniform(-42.5, 42.5, 20)
+                },
+                {
+                    'kind': 'heatmap',
+                    'x': rng.uniform(-100.0, 100.0, 20),
+                    'y': rng.uniform(-42.5, 42.5, 20),
+                    'bin_size': 10.0
+                }
+            ]
+        }
+
+
+def _get_frames(n_frames):
+    """Get frames of a puck sliding across the rink."""
+    return [
+        {'puck': ([-90.0 + i], [0.0])}
+        for i in range(n_frames)
+    ]
+
+
+def test_bounded_tasks_are_only_taken_as_they_are_needed():
+    lock = threading.Lock()
+    state = {'taken': 0, 'done': 0, 'most_ahead': 0}
+
+    def tasks():
+        for i in range(50):
+            with lock:
+                state['taken'] += 1
+                state['most_ahead'] = max(
+                    state['most_ahead'],
+                    state['taken'] - state['done']
+                )
+
+            yield i
+
+    def square(i):
+        with lock:
+            state['done'] += 1
+
+        return i * i
+
+    with ThreadPoolExecutor(max_workers = 2) as executor:
+        results = list(_iter_bounded(executor, square, tasks(), 3))
+
+    assert sorted(results) == [i * i for i in range(50)]
+    assert state['most_ahead'] <= 3
+
+
+@pytest.mark.parametrize(
+    'max_workers, chunksize',
+    [(1, 1), (2, 1), (2, 3)]
+)
+def test_render_batch_writes_every_chart_in_order(tmp_path, max_workers,
+                                                  chunksize):
+    paths = render_batch(
+        NHLRink,
+        _get_charts(str(tmp_path), 7),
+        figsize = (4.0, 2.0),
+        dpi = 50,
+        max_workers = max_workers,
+        chunksize = chunksize
+    )
+
+    assert paths == [
+        os.path.join(str(tmp_path), 'charts', f'{i}.png') for i in range(7)
+    ]
+
+    for path in paths:
+        image = plt.imread(path)
+        assert image.shape[:2] == (100, 200)
+
+
+def test_render_batch_rejects_unknown_plots(tmp_path):
+    chart = {'path': str(tmp_path / 'chart.png'), 'kind': 'pie'}
+
+    with pytest.raises(ValueError):
+        render_batch(NHLRink, [chart], max_workers = 1)
+
+
+def test_png_replay_work_is_kept_apart_from_frames(tmp_path, monkeypatch):
+    temp_dir = tmp_path / 'tmp'
+    temp_dir.mkdir()
+    monkeypatch.setattr(tempfile, 'tempdir', str(temp_dir))
+    path = str(tmp_path / 'frames' / 'frame_{frame:03d}.png')
+
+    render_replay(
+        NHLRink,
+        _get_frames(5),
+        path,
+        chunk_size = 2,
+        animation_kwargs = {'width': 100},
+        max_workers = 1
+    )
+
+    assert sorted(os.listdir(tmp_path / 'frames')) == [
+        f'frame_{i:03d}.png' for i in range(5)
+    ]
+
+    # The record of the completed chunks is in the temporary directory
+    work_dirs = os.listdir(temp_dir)
+    assert len(work_dirs) == 1
+    assert 'manifest.json' in os.listdir(temp_dir / work_dirs[0])
+
+
+def _load_frames(start, stop):
+    """Load a chunk of the frames of a puck sliding across the rink."""
+    return _get_frames(stop)[start:stop]
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path, monkeypatch):
+    """Stand in for ffmpeg with a script that stores the raw frames.
+
+    A segment is written as the raw frames piped to it, and joining segments
+    concatenates them, so the joined video holds every frame in order
+    """
+    script = tmp_path / 'ffmpeg'
+    script.write_text(
+        f'#!{sys.executable}\n'
+        'import sys, shutil\n'
+        'args = sys.argv[1:]\n'
+        'with open(args[-1], "wb") as out:\n'
+        '    if "concat" in args:\n'
+        '        for line in open(args[args.index("-i") + 1]):\n'
+        '            with open(line.strip()[6:-1], "rb") as segment:\n'
+        '                shutil.copyfileobj(segment, out)\n'
+        '    else:\n'
+        '        shutil.copyfileobj(sys.stdin.buffer, out)\n'
+    )
+    script.chmod(0o755)
+    monkeypatch.setitem(mpl.rcParams, 'animation.ffmpeg_path', str(script))
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_replay_segments_are_joined_in_order(tmp_path, fake_ffmpeg,
+                                             max_workers):
+    frames = _get_frames(7)
+    animation_kwargs = {'width': 100}
+
+    whole_path = str(tmp_path / 'whole.mp4')
+    NHLRink().write_animation(frames, whole_path, **animation_kwargs)
+
+    progress = []
+    path = str(tmp_path / 'replay.mp4')
+    render_replay(
+        NHLRink,
+        _load_frames,
+        path,
+        n_frames = 7,
+        chunk_size = 3,
+        animation_kwargs = animation_kwargs,
+        max_workers = max_workers,
+        progress = lambda done, total: progress.append((done, total))
+    )
+
+    with open(path, 'rb') as f, open(whole_path, 'rb') as g:
+        assert f.read() == g.read()
+
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    assert sorted(
+        name for name in os.listdir(f'{path}.parts')
+        if name.startswith('segment_')
+    ) == ['segment_00000.mp4', 'segment_00001.mp4', 'segment_00002.mp4']
+
+
+def test_replay_resumes_from_its_completed_chunks(tmp_path, fake_ffmpeg):
+    path = str(tmp_path / 'replay.mp4')
+    render_replay(NHLRink, _get_frames(5), path, chunk_size = 2,
+                  animation_kwargs = {'width': 100}, max_workers = 1)
+
+    # Forget that the last chunk was completed, as if the replay had been
+    # interrupted while writing it
+    os.remove(os.path.join(f'{path}.parts', 'chunk_00002.done'))
+    first_segment = os.path.join(f'{path}.parts', 'segment_00000.mp4')
+    modified = os.path.getmtime(first_segment)
+
+    progress = []
+    render_replay(
+        NHLRink,
+        _get_frames(5),
+        path,
+        chunk_size = 2,
+        animation_kwargs = {'width': 100},
+        max_workers = 1,
+        progress = lambda done, total: progress.append((done, total))
+    )
+
+    assert progress == [(2, 3), (3, 3)]
+    assert os.path.getmtime(first_segment) == modified
+
+
+def test_replay_is_not_resumed_with_other_settings(tmp_path, fake_ffmpeg):
+    path = str(tmp_path / 'replay.mp4')
+    render_replay(NHLRink, _get_frames(4), path, chunk_size = 2,
+                  animation_kwargs = {'width': 100}, max_workers = 1)
+
+    with pytest.raises(ValueError, match = 'different surface or settings'):
+        render_replay(NHLRink, _get_frames(4), path, chunk_size = 2,
+                      animation_kwargs = {'width': 200}, max_workers = 1)
+
+    with pytest.raises(ValueError, match = 'chunks of 2'):
+        render_replay(NHLRink, _get_frames(4), path, chunk_size = 3,
+                      animation_kwargs = {'width': 100}, max_workers = 1)
+
+    # Starting over replaces the earlier chunks
+    render_replay(NHLRink, _get_frames(4), path, chunk_size = 3,
+                  animation_kwargs = {'width': 200}, max_workers = 1,
+                  resume = False)
+
+
+def test_replay_of_a_loader_needs_its_length(tmp_path):
+    with pytest.raises(ValueError, match = 'n_frames'):
+        render_replay(NHLRink, _load_frames, str(tmp_path / 'replay.mp4'))
@@ -0,0 +1,101 @@
+"""Tests of which points lie inside of each surface.
+
+@author: Ross Drucker
+"""
+import numpy as np
+import pytest
+from matplotlib.path import Path
+from sportypy.surfaces.baseball import BaseballField
+from sportypy.surfaces.basketball import (
+    NBACourt,
+    WNBACourt,
+    NCAACourt,
+    FIBACourt,
+    NFHSCourt
+)
+from sportypy.surfaces.hockey import IIHFRink, NCAARink, NHLRink, NWHLRink
+
+
+_surfaces = [
+    NBACourt, WNBACourt, NCAACourt, FIBACourt, NFHSCourt,
+    IIHFRink, NCAARink, NHLRink, NWHLRink
+]
+
+
+def _get_points(surface, n_points = 200000):
+    """Get random points around a surface's constraint."""
+    pts = surface._surface_constraint._translate_feature()
+    pts = pts[~np.isnan(pts).any(axis = 1)]
+    lower = pts.min(axis = 0) - 2.0
+    upper = pts.max(axis = 0) + 2.0
+
+    rng = np.random.default_rng(0)
+
+    return rng.uniform(lower, upper, (n_points, 2))
+
+
+@pytest.mark.parametrize('surface_class', _surfaces)
+def test_contains_matches_the_constraint_polygon(surface_class):
+    surface = surface_class()
+    constraint = surface._surface_constraint
+    points = _get_points(surface)
+
+    pts = constraint._translate_feature()
+    path = Path(pts[~np.isnan(pts).any(axis = 1)])
+
+    # The polygon traces any arcs with chords, so points within the arc's
+    # tolerance of the polygon's edge may fall on either side of it
+    is_clear = ~(
+        path.contains_points(points, radius = 2.0 * surface.arc_tolerance) ^
+        path.contains_points(points, radius = -2.0 * surface.arc_tolerance)
+    )
+
+    is_inside = constraint.contains(points[:, 0], points[:, 1])
+
+    assert np.array_equal(
+        is_inside[is_clear],
+        path.contains_points(points)[is_clear]
+    )
+    assert is_inside.any() and not is_inside.all()
+
+
+@pytest.mark.parametrize('surface_class', _surfaces)
+def test_contains_undoes_the_surface_shift(surface_class):
+    shifted = surface_class(x_trans = 10.0, y_trans = -5.0)
+    points = _get_points(shifted, 10000)
+
+    assert np.array_equal(
+        shifted.contains(points[:, 0] + 10.0, points[:, 1] - 5.0),
+        surface_class().contains(points[:, 0], points[:, 1])
+    )
+
+
+def test_missing_coordinates_are_never_inside():
+    x = np.array([0.0, np.nan, 0.0])
+    y = np.array([0.0, 0.0, np.nan])
+
+    assert list(NBACourt().contains(x, y)) == [True, False, False]
+    assert list(NHLRink().contains(x, y)) == [True, False, False]
+    assert list(BaseballField().contains(x, y)) == [True, False, False]
+
+
+def test_every_point_is_on_a_baseball_field():
+    is_inside = BaseballField().contains(
+        [-1000.0, 0.0, 1000.0],
+        [-1.0, 0.0, 500.0]
+    )
+
+    assert is_inside.all()
+
+
+def test_features_contain_their_polygon():
+    field = BaseballField()
+    second_base = field._features[2]
+    anchor = (second_base.x_anchor, second_base.y_anchor)
+
+    is_inside = second_base.contains(
+        [anchor[0], anchor[0] + field.base_side_length],
+        [anchor[1], anchor[1]]
+    )
+
+    assert list(is_inside) == [True, False]
@@ -0,0 +1,113 @@
+"""Tests of the conversion of coordinates to a surface's position.
+
+@author: Ross Drucker
+"""
+import numpy as np
+import pytest
+from sportypy._base_classes import _base_surface
+from sportypy.surfaces.hockey import NHLRink
+
+
+def _get_expected(rink, x, y):
+    """Shift and rotate coordinates with the rink's rotation."""
+    shifted = np.column_stack((
+        np.asarray(x, dtype = np.float64) - rink.x_trans,
+        np.asarray(y, dtype = np.float64) - rink.y_trans
+    ))
+    converted = rink._rotation.transform(shifted)
+
+    return converted[:, 0], converted[:, 1]
+
+
+def _get_coordinates(n, dtype = np.float64):
+    """Get n random coordinates on a rink."""
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-100.0, 100.0, n).astype(dtype)
+    y = rng.uniform(-42.5, 42.5, n).astype(dtype)
+
+    return x, y
+
+
+@pytest.mark.parametrize('rotation', [0.0, 30.0, 90.0])
+def test_matches_the_rotation(rotation):
+    rink = NHLRink(rotation = rotation, x_trans = 5.0, y_trans = -3.0)
+    x, y = _get_coordinates(1000)
+
+    x_new, y_new = rink.convert_xy(x, y)
+    x_expected, y_expected = _get_expected(rink, x, y)
+
+    assert np.allclose(x_new, x_expected)
+    assert np.allclose(y_new, y_expected)
+
+
+@pytest.mark.parametrize('rotation', [0.0, 30.0])
+def test_blocks_match_a_single_pass(rotation):
+    rink = NHLRink(rotation = rotation, x_trans = 5.0)
+    n = (2 * _base_surface._convert_block_size) + 17
+    x, y = _get_coordinates(n)
+
+    x_new, y_new = rink.convert_xy(x, y)
+    x_expected, y_expected = _get_expected(rink, x, y)
+
+    assert len(x_new) == len(y_new) == n
+    assert np.allclose(x_new, x_expected)
+    assert np.allclose(y_new, y_expected)
+
+
+@pytest.mark.parametrize('rotation', [0.0, 30.0])
+def test_writes_to_the_given_arrays(rotation):
+    rink = NHLRink(rotation = rotation, y_trans = 2.0)
+    n = _base_surface._convert_block_size + 17
+    x, y = _get_coordinates(n)
+    x_out = np.empty(n)
+    y_out = np.empty(n)
+
+    x_new, y_new = rink.convert_xy(x, y, out = (x_out, y_out))
+
+    assert x_new is x_out
+    assert y_new is y_out
+    assert np.array_equal(x_out, rink.convert_xy(x, y)[0])
+    assert np.array_equal(y_out, rink.convert_xy(x, y)[1])
+
+
+@pytest.mark.parametrize('rotation', [0.0, 30.0])
+def test_converts_the_coordinates_in_place(rotation):
+    rink = NHLRink(rotation = rotation, x_trans = 5.0, y_trans = 2.0)
+    n = (2 * _base_surface._convert_block_size) + 17
+    x, y = _get_coordinates(n)
+    x_expected, y_expected = rink.convert_xy(x, y)
+
+    # Each block of both coordinates must be read before either is written
+    x_new, y_new = rink.convert_xy(x, y, out = (x, y))
+
+    assert x_new is x
+    assert y_new is y
+    assert np.array_equal(x, x_expected)
+    assert np.array_equal(y, y_expected)
+
+
+@pytest.mark.parametrize('rotation', [0.0, 30.0])
+def test_keeps_the_precision_of_the_coordinates(rotation):
+    rink = NHLRink(rotation = rotation, x_trans = 5.0)
+    x, y = _get_coordinates(1000, dtype = np.float32)
+
+    x_new, y_new = rink.convert_xy(x, y)
+    x_expected, y_expected = _get_expected(rink, x, y)
+
+    assert x_new.dtype == y_new.dtype == np.float32
+    assert np.allclose(x_new, x_expected, atol = 1e-4)
+    assert np.allclose(y_new, y_expected, atol = 1e-4)
+
+    # Integer coordinates are converted to float64
+    x_new, y_new = rink.convert_xy(np.arange(10), np.arange(10))
+
+    assert x_new.dtype == y_new.dtype == np.float64
+
+
+def test_converts_scalars():
+    rink = NHLRink(rotation = 90.0, x_trans = 5.0)
+
+    x_new, y_new = rink.convert_xy(15.0, 0.0)
+
+    assert np.allclose(x_new, [0.0])
+    assert np.allclose(y_new, [10.0])
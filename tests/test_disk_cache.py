@@ -0,0 +1,140 @@
+"""Tests of the on-disk geometry cache.
+
+@author: Ross Drucker
+"""
+import os
+import glob
+import numpy as np
+import pytest
+import sportypy
+from sportypy._base_classes import _base_surface, _disk_cache
+from sportypy.surfaces.basketball import NBACourt
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Enable the cache in a temporary directory for the test."""
+    monkeypatch.delenv(_disk_cache._cache_dir_env, raising = False)
+    monkeypatch.setitem(_disk_cache._settings, 'max_bytes', 256 * 1024 ** 2)
+    _disk_cache.enable_geometry_cache(str(tmp_path))
+    _base_surface.clear_surface_cache()
+
+    yield str(tmp_path)
+
+    _disk_cache.disable_geometry_cache()
+    _base_surface.clear_surface_cache()
+
+
+def _arrays(n_points):
+    """Get the coordinates of two features with n_points points each."""
+    pts = np.arange(n_points * 2, dtype = np.float64).reshape(-1, 2)
+
+    return [pts, pts + 1.0]
+
+
+def test_stored_geometry_is_loaded_without_copying(cache_dir):
+    _disk_cache.store_geometry(('surface', 1), _arrays(10))
+
+    arrays = _disk_cache.load_geometry(('surface', 1))
+
+    assert len(arrays) == 2
+    assert np.array_equal(arrays[1], _arrays(10)[1])
+    assert isinstance(arrays[0], np.memmap)
+    assert not arrays[0].flags.writeable
+
+
+def test_surfaces_draw_from_the_cache(cache_dir):
+    expected = [
+        feature._translate_feature().copy()
+        for feature in NBACourt()._get_all_features()
+    ]
+    assert len(glob.glob(os.path.join(cache_dir, '*.counts.npy'))) == 1
+
+    # A new template (as in another process) reads its geometry back from
+    # the cache, without copying it
+    _base_surface.clear_surface_cache()
+    features = NBACourt()._get_all_features()
+
+    for feature, pts in zip(features, expected):
+        cached = feature._translate_feature()
+
+        assert isinstance(cached, np.memmap)
+        assert np.array_equal(cached, pts, equal_nan = True)
+
+
+def test_new_version_misses_the_cache(cache_dir, monkeypatch):
+    _disk_cache.store_geometry(('surface', 1), _arrays(10))
+
+    monkeypatch.setattr(sportypy, '__version__', 'a-later-version')
+
+    assert _disk_cache.load_geometry(('surface', 1)) is None
+
+
+def test_least_recently_used_surfaces_are_evicted(cache_dir, monkeypatch):
+    _disk_cache.store_geometry(('surface', 1), _arrays(1000))
+    _disk_cache.store_geometry(('surface', 2), _arrays(1000))
+
+    # Make the second surface the least recently used
+    paths = _disk_cache._get_cache_paths(cache_dir, ('surface', 2))
+    os.utime(paths[1], (0, 0))
+
+    # Leave room for two surfaces, but not three
+    size = sum(os.path.getsize(path) for path in paths)
+    monkeypatch.setitem(_disk_cache._settings, 'max_bytes', int(2.5 * size))
+    _disk_cache.store_geometry(('surface', 3), _arrays(1000))
+
+    assert _disk_cache.load_geometry(('surface', 1)) is not None
+    assert _disk_cache.load_geometry(('surface', 2)) is None
+    assert _disk_cache.load_geometry(('surface', 3)) is not None
+    assert not any(os.path.exists(path) for path in paths)
+
+
+def test_files_that_cannot_be_removed_are_kept(cache_dir, monkeypatch):
+    _disk_cache.store_geometry(('surface', 1), _arrays(1000))
+
+    def remove(path):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(_disk_cache.os, 'remove', remove)
+    monkeypatch.setitem(_disk_cache._settings, 'max_bytes', 0)
+    _disk_cache.store_geometry(('surface', 2), _arrays(1000))
+
+    assert _disk_cache.load_geometry(('surface', 1)) is not None
+    assert _disk_cache.load_geometry(('surface', 2)) is not None
+
+
+def test_orphaned_coordinates_are_removed(cache_dir):
+    _disk_cache.store_geometry(('surface', 1), _arrays(10))
+    coords_path, counts_path = _disk_cache._get_cache_paths(
+        cache_dir,
+        ('surface', 1)
+    )
+    os.remove(counts_path)
+
+    # Coordinates that may still be waiting for their counts are kept
+    _disk_cache._evict(cache_dir)
+    assert os.path.exists(coords_path)
+
+    old = os.path.getmtime(coords_path) - 2.0 * _disk_cache._orphan_age
+    os.utime(coords_path, (old, old))
+    _disk_cache._evict(cache_dir)
+    assert not os.path.exists(coords_path)
+
+
+def test_unwritable_cache_is_ignored(tmp_path, monkeypatch):
+    # A directory that can't be created, because a file is in its way
+    blocked = tmp_path / 'blocked'
+    blocked.write_text('')
+    monkeypatch.delenv(_disk_cache._cache_dir_env, raising = False)
+    _disk_cache.enable_geometry_cache(str(blocked / 'geometry'))
+    _base_surface.clear_surface_cache()
+
+    try:
+        _disk_cache.store_geometry(('surface', 1), _arrays(10))
+
+        assert _disk_cache.load_geometry(('surface', 1)) is None
+        assert len(NBACourt()._features) > 0
+
+    finally:
+        _disk_cache.disable_geometry_cache()
+        _base_surface.clear_surface_cache()
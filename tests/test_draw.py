@@ -0,0 +1,34 @@
+"""Tests of drawing surfaces.
+
+@author: Ross Drucker
+"""
+import numpy as np
+import pytest
+import matplotlib.pyplot as plt
+from sportypy.surfaces.baseball import BaseballField
+from sportypy.surfaces.basketball import NBACourt
+from sportypy.surfaces.hockey import NHLRink
+
+
+@pytest.mark.parametrize('surface_class', [BaseballField, NBACourt, NHLRink])
+def test_feature_limits_span_every_feature(surface_class):
+    surface = surface_class()
+    fig, ax = plt.subplots()
+    surface.draw(ax = ax)
+    plt.close(fig)
+
+    pts = np.concatenate([
+        feature._translate_feature()
+        for feature in surface._features
+        if getattr(feature, 'visible', True) and
+        type(feature).__name__ not in (
+            'FieldConstraint', 'CourtConstraint', 'Boards'
+        )
+    ])
+
+    assert surface._feature_xlim == pytest.approx(
+        [pts[:, 0].min(), pts[:, 0].max()]
+    )
+    assert surface._feature_ylim == pytest.approx(
+        [pts[:, 1].min(), pts[:, 1].max()]
+    )
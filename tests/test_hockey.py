@@ -0,0 +1,186 @@
+"""Tests of the regions of hockey rinks.
+
+@author: Ross Drucker
+"""
+import numpy as np
+import pytest
+from matplotlib.path import Path
+import sportypy.features.hockey_features as hockey
+from sportypy.surfaces.hockey import (
+    IIHFRink,
+    NCAARink,
+    NHLRink,
+    NWHLRink
+)
+
+
+_rinks = [IIHFRink, NCAARink, NHLRink, NWHLRink]
+
+
+def _classify(rink, x, y):
+    """Classify points on a rink, returning their regions as a list."""
+    return list(rink.classify(np.asarray(x), np.asarray(y)))
+
+
+def _get_crease_region(rink):
+    """Get the region inside of the outer edge of the left goal crease.
+
+    The outline of the crease is traced around its outer edge first, so its
+    points up to the far corner by the goal line enclose the crease (including
+    its outline)
+    """
+    outline = next(
+        feature for feature in rink._features
+        if isinstance(feature, hockey.GoalCreaseOutline) and
+        feature.x_reflection == 1
+    )
+    pts = outline._translate_feature()
+
+    corner = np.flatnonzero(
+        np.isclose(pts[:, 0], pts[0, 0]) &
+        np.isclose(pts[:, 1], -outline.goal_crease_width)
+    )[0]
+
+    return outline, Path(pts[:corner + 1], closed = False)
+
+
+def test_zone_boundaries():
+    rink = NHLRink()
+    zone_line_x = (rink.nzone_length / 2.0) + rink.major_line_thickness
+
+    regions = _classify(
+        rink,
+        [zone_line_x, zone_line_x + 0.01, -zone_line_x, -zone_line_x - 0.01],
+        [-40.0, -40.0, -40.0, -40.0]
+    )
+
+    assert regions == [
+        'neutral_zone',
+        'offensive_zone',
+        'neutral_zone',
+        'defensive_zone'
+    ]
+
+
+def test_faceoff_circle_boundaries():
+    rink = NHLRink()
+    radius = rink.faceoff_circle_radius
+
+    # Points on, just inside of, and just outside of the circles in the
+    # offensive zone and at center ice
+    angle = np.pi / 3.0
+    regions = _classify(
+        rink,
+        [
+            69.0 + (radius * np.cos(angle)),
+            69.0 + ((radius - 0.01) * np.cos(angle)),
+            69.0 + ((radius + 0.01) * np.cos(angle)),
+            radius - 0.01,
+            radius + 0.01
+        ],
+        [
+            22.0 + (radius * np.sin(angle)),
+            22.0 + ((radius - 0.01) * np.sin(angle)),
+            22.0 + ((radius + 0.01) * np.sin(angle)),
+            0.0,
+            0.0
+        ]
+    )
+
+    assert regions == [
+        'faceoff_circle',
+        'faceoff_circle',
+        'offensive_zone',
+        'faceoff_circle',
+        'neutral_zone'
+    ]
+
+
+def test_trapezoid_corners():
+    rink = NHLRink()
+    trapezoid = next(
+        feature for feature in rink._features
+        if isinstance(feature, hockey.GoalkeepersRestrictedArea)
+    )
+    goal_line_x = trapezoid.goal_line_x
+    end_boards_x = -rink.rink_length / 2.0
+    short_half_width = trapezoid.short_base_width / 2.0
+    long_half_width = trapezoid.long_base_width / 2.0
+
+    regions = _classify(
+        rink,
+        [
+            goal_line_x,
+            goal_line_x - 0.01,
+            goal_line_x + 0.01,
+            end_boards_x + 0.01,
+            end_boards_x + 0.01,
+            -goal_line_x + 0.01
+        ],
+        [
+            short_half_width,
+            -short_half_width + 0.01,
+            short_half_width - 0.01,
+            long_half_width - 0.01,
+            -long_half_width - 0.05,
+            short_half_width - 0.01
+        ]
+    )
+
+    assert regions == [
+        'trapezoid',
+        'trapezoid',
+        'defensive_zone',
+        'trapezoid',
+        'defensive_zone',
+        'trapezoid'
+    ]
+
+
+@pytest.mark.parametrize('rink_class', _rinks)
+def test_goal_crease_matches_the_drawn_crease(rink_class):
+    rink = rink_class()
+    outline, region = _get_crease_region(rink)
+
+    rng = np.random.default_rng(0)
+    x = rng.uniform(
+        outline.goal_line_x - 1.0,
+        outline.goal_line_x + outline.feature_radius + 1.0,
+        100000
+    )
+    y = rng.uniform(
+        -outline.goal_crease_width - 1.0,
+        outline.goal_crease_width + 1.0,
+        100000
+    )
+
+    in_crease = np.asarray(_classify(rink, x, y)) == 'goal_crease'
+    is_drawn = region.contains_points(np.column_stack((x, y)))
+
+    # The drawn arc is traced with chords, so points within the arc's
+    # tolerance of it may fall on either side. The same goes for points on
+    # the crease's straight edges
+    start_x = outline.goal_line_x + outline.feature_thickness / 2.0
+    is_clear = (
+        (np.abs(np.hypot(x - start_x, y) - outline.feature_radius) >
+         2.0 * rink.arc_tolerance) &
+        (np.abs(x - start_x) > 1e-6) &
+        (np.abs(np.abs(y) - outline.goal_crease_width) > 1e-6)
+    )
+
+    assert np.array_equal(in_crease[is_clear], is_drawn[is_clear])
+
+    # The goal line in front of the crease isn't part of it
+    assert not np.any(in_crease & (x < start_x))
+
+
+def test_points_beyond_the_boards_are_outside():
+    rink = NHLRink()
+
+    regions = _classify(
+        rink,
+        [0.0, rink.rink_length / 2.0 + 1.0, 0.0, np.nan],
+        [rink.rink_width / 2.0 + 1.0, 0.0, 0.0, 0.0]
+    )
+
+    assert regions == ['outside', 'outside', 'faceoff_circle', 'outside']
@@ -0,0 +1,173 @@
+"""Tests of exporting a surface's geometry and loading it again.
+
+@author: Ross Drucker
+"""
+import numpy as np
+import pytest
+from matplotlib.figure import Figure
+from sportypy._base_classes import _base_surface
+from sportypy._base_classes._base_feature import BaseFeature
+from sportypy._base_classes._geometry_io import _split_subpaths
+from sportypy.surfaces.baseball import BaseballField
+from sportypy.surfaces.basketball import NBACourt
+from sportypy.surfaces.hockey import NHLRink
+from sportypy.surfaces.precomputed import PrecomputedSurface
+
+
+_surfaces = [BaseballField, NBACourt, NHLRink]
+
+# The tolerance of the coordinates in each format. GeoJSON rounds them to six
+# decimal places, and the binary format stores them as float32
+_formats = [
+    ('geojson', 'surface.geojson', 1e-6),
+    ('binary', 'surface.bin', 1e-3)
+]
+
+
+@pytest.fixture(autouse = True)
+def empty_cache():
+    """Keep surfaces loaded by one test from being reused by another."""
+    _base_surface.clear_surface_cache()
+
+    yield
+
+    _base_surface.clear_surface_cache()
+
+
+def _get_exported_features(surface):
+    """Get the features of a surface that export_geometry() writes."""
+    return [
+        feature for feature in surface._features
+        if type(feature).draw is BaseFeature.draw
+    ]
+
+
+def _assert_same_subpaths(pts, loaded_pts, atol):
+    """Check that two features' coordinates trace the same subpaths."""
+    subpaths = _split_subpaths(np.asarray(pts, dtype = np.float64))
+    loaded_subpaths = _split_subpaths(loaded_pts)
+
+    assert len(subpaths) == len(loaded_subpaths)
+
+    for subpath, loaded_subpath in zip(subpaths, loaded_subpaths):
+        assert subpath.shape == loaded_subpath.shape
+        assert np.allclose(subpath, loaded_subpath, rtol = 0.0, atol = atol)
+
+
+def _get_drawn_points(patch, atol):
+    """Get the points of a drawn polygon that survive being exported.
+
+    GeoJSON doesn't keep the rows of nan that separate subpaths, and rounding
+    may make a polygon's last point equal to its first, in which case
+    matplotlib doesn't add another point to close it. Neither changes what's
+    drawn, so the points that close each polygon are dropped
+    """
+    vertices = patch.get_path().vertices
+    vertices = vertices[np.isfinite(vertices).all(axis = 1)]
+
+    while len(vertices) > 1 and np.allclose(vertices[0], vertices[-1],
+                                            rtol = 0.0, atol = atol):
+        vertices = vertices[:-1]
+
+    return vertices
+
+
+@pytest.mark.parametrize('surface_class', _surfaces)
+@pytest.mark.parametrize('fmt, filename, atol', _formats)
+def test_loaded_features_match_the_original(tmp_path, surface_class, fmt,
+                                            filename, atol):
+    surface = surface_class()
+    path = surface.export_geometry(str(tmp_path / filename), fmt = fmt)
+    loaded = PrecomputedSurface(path)
+
+    features = _get_exported_features(surface)
+
+    assert loaded.surface_name == surface_class.__name__
+    assert len(loaded._features) == len(features)
+
+    for feature, loaded_feature in zip(features, loaded._features):
+        assert loaded_feature.feature_class == type(feature).__name__
+        assert loaded_feature.visible == feature.visible
+        assert (
+            loaded_feature.plot_kwargs.get('zorder', 1) ==
+            feature.plot_kwargs.get('zorder', 1)
+        )
+
+        _assert_same_subpaths(
+            feature._translate_feature(),
+            loaded_feature._translate_feature(),
+            atol
+        )
+
+    _assert_same_subpaths(
+        surface._surface_constraint._translate_feature(),
+        loaded._surface_constraint._translate_feature(),
+        atol
+    )
+
+
+@pytest.mark.parametrize('fmt, filename, atol', _formats)
+def test_loaded_surface_draws_like_the_original(tmp_path, fmt, filename,
+                                                atol):
+    rink = NHLRink(x_trans = 100.0, y_trans = 42.5, rotation = 90.0)
+    path = rink.export_geometry(
+        str(tmp_path / filename),
+        fmt = fmt,
+        display_ranges = ('full', 'offense')
+    )
+    loaded = PrecomputedSurface(path)
+
+    assert np.array_equal(
+        loaded._rotation.get_matrix(),
+        rink._rotation.get_matrix()
+    )
+
+    for display_range in ('full', 'offense'):
+        assert np.allclose(
+            loaded._get_plot_range_limits(display_range),
+            rink._get_plot_range_limits(display_range)
+        )
+
+    # Draw both surfaces, checking that the drawn polygons are stacked in the
+    # same order
+    patches = []
+    limits = []
+    for surface in (rink, loaded):
+        ax = Figure().add_subplot()
+        surface.draw(ax = ax, display_range = 'offense')
+        patches.append([
+            patch for patch in ax.patches
+            if patch.get_path().vertices.size
+        ])
+        limits.append((ax.get_xlim(), ax.get_ylim()))
+
+    assert np.allclose(limits[0], limits[1])
+    assert (
+        [patch.get_zorder() for patch in patches[0]] ==
+        [patch.get_zorder() for patch in patches[1]]
+    )
+
+    for patch, loaded_patch in zip(*patches):
+        assert np.allclose(
+            _get_drawn_points(patch, atol),
+            _get_drawn_points(loaded_patch, atol),
+            rtol = 0.0,
+            atol = atol
+        )
+
+
+def test_rewritten_files_are_loaded_again(tmp_path):
+    path = str(tmp_path / 'surface.geojson')
+
+    NHLRink().export_geometry(path)
+
+    assert PrecomputedSurface(path).surface_name == 'NHLRink'
+
+    NBACourt().export_geometry(path)
+
+    assert PrecomputedSurface(path).surface_name == 'NBACourt'
+
+
+def test_rejects_unknown_formats(tmp_path):
+    with pytest.raises(ValueError):
+        NHLRink().export_geometry(str(tmp_path / 'surface.svg'), fmt = 'svg')
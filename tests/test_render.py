@@ -0,0 +1,102 @@
+"""Tests of rendering surfaces without pyplot.
+
+@author: Ross Drucker
+"""
+import io
+import numpy as np
+import pytest
+import matplotlib.image as mpimg
+import matplotlib.pyplot as plt
+from sportypy.surfaces.basketball import NBACourt
+from sportypy.surfaces.hockey import NHLRink
+
+
+def test_renders_a_png_sized_to_the_surface():
+    rink = NHLRink()
+    png = rink.render(width = 400)
+
+    assert png.startswith(b'\x89PNG\r\n\x1a\n')
+
+    image = mpimg.imread(io.BytesIO(png))
+    x0, x1, y0, y1 = rink._get_display_extent('full')
+    height = int(round(400 * (y1 - y0) / (x1 - x0)))
+
+    assert image.shape[:2] == (height, 400)
+
+
+def test_renders_rgba_pixels():
+    rink = NHLRink()
+    pixels = rink.render(width = 300, output = 'rgba')
+
+    assert pixels.dtype == np.uint8
+    assert pixels.ndim == 3
+    assert pixels.shape[1:] == (300, 4)
+
+    # The rink's background is opaque, and its features are drawn on it
+    assert np.all(pixels[..., 3] == 255)
+    assert len(np.unique(pixels.reshape(-1, 4), axis = 0)) > 1
+
+
+def test_the_background_defaults_to_the_surface_background():
+    court = NBACourt()
+    pixels = court.render(width = 300, output = 'rgba')
+
+    # The court has no plot background, so the image's corners are clear
+    assert pixels[0, 0, 3] == 0
+
+    pixels = court.render(width = 300, output = 'rgba', facecolor = '#123456')
+
+    assert np.array_equal(pixels[0, 0], [0x12, 0x34, 0x56, 255])
+
+
+def test_the_image_follows_the_display_range():
+    rink = NHLRink()
+    full = rink.render(width = 400, output = 'rgba')
+    half = rink.render(width = 400, output = 'rgba', display_range = 'offense')
+
+    assert full.shape[1] == half.shape[1] == 400
+    assert half.shape[0] > full.shape[0]
+
+    rotated = rink.render(width = 400, output = 'rgba', rotation = 90.0)
+
+    assert rotated.shape[0] > rotated.shape[1]
+
+
+def test_leaves_no_figures_open():
+    plt.close('all')
+    rink = NHLRink()
+
+    rink.render(width = 200)
+    rink.render(width = 200, output = 'rgba')
+
+    assert plt.get_fignums() == []
+
+
+def test_draws_layers():
+    rink = NHLRink()
+    blank = rink.render(width = 200, output = 'rgba')
+    layered = rink.render(
+        width = 200,
+        output = 'rgba',
+        layers = [{
+            'kind': 'scatter',
+            'x': np.linspace(-80.0, 80.0, 50),
+            'y': np.zeros(50),
+            'color': '#123456',
+            's': 100
+        }]
+    )
+
+    assert blank.shape == layered.shape
+    assert not np.array_equal(blank, layered)
+    assert np.any(np.all(layered[..., :3] == [0x12, 0x34, 0x56], axis = -1))
+
+
+def test_rejects_unknown_outputs_and_layers():
+    rink = NHLRink()
+
+    with pytest.raises(ValueError):
+        rink.render(width = 100, output = 'jpeg')
+
+    with pytest.raises(ValueError):
+        rink.render(width = 100, layers = [{'kind': 'violin'}])
@@ -0,0 +1,83 @@
+"""Tests of the process-wide cache of surface templates.
+
+@author: Ross Drucker
+"""
+import numpy as np
+import pytest
+from sportypy._base_classes import _base_surface
+from sportypy.surfaces.hockey import NHLRink
+
+
+@pytest.fixture(autouse = True)
+def empty_cache():
+    """Start each test with an empty cache of the default size."""
+    _base_surface.clear_surface_cache()
+    maxsize = _base_surface._surface_templates_maxsize
+
+    yield
+
+    _base_surface.set_surface_cache_size(maxsize)
+    _base_surface.clear_surface_cache()
+
+
+def test_same_surfaces_share_a_template():
+    first = NHLRink()
+    second = NHLRink()
+    other = NHLRink(rotation = 90)
+
+    assert first is not second
+    assert first._template is second._template
+    assert other._template is not first._template
+    assert len(_base_surface._surface_templates) == 2
+
+    # The clones share their features' geometry, but not the features
+    assert first._features[0] is not second._features[0]
+    assert (
+        first._features[0]._translate_feature() is
+        second._features[0]._translate_feature()
+    )
+
+
+def test_clones_are_independent():
+    first = NHLRink()
+    second = NHLRink()
+
+    first.feature_colors['plot_background'] = '#123456'
+    first._features[0].plot_kwargs['facecolor'] = '#123456'
+    first._features[0].x_anchor += 10.0
+    first._rotation.rotate_deg(90)
+
+    third = NHLRink()
+    for surface in (second, third):
+        assert surface.feature_colors['plot_background'] != '#123456'
+        assert surface._features[0].plot_kwargs.get('facecolor') != '#123456'
+        assert np.array_equal(surface._rotation.get_matrix(), np.eye(3))
+
+    # Moving a feature recomputes only its own geometry
+    assert not np.array_equal(
+        first._features[0]._translate_feature(),
+        third._features[0]._translate_feature()
+    )
+
+
+def test_least_recently_used_templates_are_evicted():
+    _base_surface.set_surface_cache_size(2)
+
+    first = NHLRink(x_trans = 1.0)
+    NHLRink(x_trans = 2.0)
+    NHLRink(x_trans = 1.0)
+    NHLRink(x_trans = 3.0)
+
+    keys = list(_base_surface._surface_templates)
+    assert len(keys) == 2
+    assert keys[0] == first._surface_key
+
+
+def test_disabled_cache_builds_every_surface():
+    _base_surface.set_surface_cache_size(0)
+
+    rink = NHLRink()
+
+    assert len(_base_surface._surface_templates) == 0
+    assert rink._surface_key is None
+    assert len(rink._features) == len(NHLRink()._features)
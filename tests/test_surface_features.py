@@ -0,0 +1,83 @@
+"""Tests of the features of surfaces cloned from cached templates.
+
+@author: Ross Drucker
+"""
+import pickle
+import sportypy.features.hockey_features as hockey
+from sportypy._base_classes._base_surface import _FromTemplate
+from sportypy.surfaces.hockey import NHLRink
+
+
+def _extra_spot():
+    """Get the parameters of a feature to add to a rink."""
+    return {
+        'class': hockey.CenterFaceoffSpot,
+        'x_anchor': 10.0,
+        'y_anchor': 0.0,
+        'rink_length': 200.0,
+        'rink_width': 85.0,
+        'feature_radius': 0.5,
+        'feature_thickness': 2.0 / 12.0,
+        'facecolor': '#c8102e'
+    }
+
+
+def test_clone_keeps_features_added_before_they_are_built():
+    n_features = len(NHLRink()._features)
+
+    rink = NHLRink()
+    rink._initialize_feature(_extra_spot())
+
+    assert len(rink._features) == n_features + 1
+    assert isinstance(rink._features[-1], hockey.CenterFaceoffSpot)
+    assert rink._features[-1].x_anchor == 10.0
+
+
+def test_clone_keeps_features_added_after_they_are_built():
+    rink = NHLRink()
+    n_features = len(rink._features)
+    rink._initialize_feature(_extra_spot())
+
+    assert len(rink._features) == n_features + 1
+
+
+def test_added_features_do_not_change_the_template():
+    n_features = len(NHLRink()._features)
+
+    rink = NHLRink()
+    rink._initialize_feature(_extra_spot())
+    rink._features
+
+    assert len(NHLRink()._features) == n_features
+    assert rink._surface_key is None
+
+
+def test_clones_share_read_only_geometry():
+    first = NHLRink()._features[0]._translate_feature()
+    second = NHLRink()._features[0]._translate_feature()
+
+    assert second is first
+    assert not first.flags.writeable
+
+
+def test_features_are_built_when_first_needed():
+    rink = NHLRink()
+
+    assert rink.__dict__['_built_features'] is None
+    assert rink.__dict__['_constraint'] is _FromTemplate
+
+    assert len(rink._features) > 0
+    assert rink.__dict__['_built_features'] is rink._features
+    assert isinstance(rink._surface_constraint, hockey.BoardsConstraint)
+
+
+def test_unbuilt_surfaces_can_be_pickled():
+    rink = NHLRink()
+    rink._initialize_feature(_extra_spot())
+
+    restored = pickle.loads(pickle.dumps(rink))
+
+    assert [type(feature) for feature in restored._features] == [
+        type(feature) for feature in rink._features
+    ]
+    assert restored._surface_constraint.contains([0.0], [0.0])[0]
@@ -0,0 +1,150 @@
+"""Tests of writing surfaces directly to vector files.
+
+@author: Ross Drucker
+"""
+import math
+import numpy as np
+import pytest
+import sportypy.features.basketball_features as basketball
+import sportypy.features.hockey_features as hockey
+from sportypy._base_classes import _vector_export
+from sportypy.surfaces.basketball import NBACourt
+from sportypy.surfaces.hockey import NHLRink
+
+
+def _get_arcs(feature):
+    """Get the center and radius of each arc recovered from a feature."""
+    return sorted({
+        (round(cx, 9) + 0.0, round(cy, 9) + 0.0, round(radius, 9))
+        for kind, cx, cy, radius, *_ in (
+            segment for segment in
+            _vector_export._outline_segments(feature._translate_feature())
+            if segment[0] == 'A'
+        )
+    })
+
+
+def _get_features(surface, feature_class):
+    """Get the drawn features of a surface that are of a given class."""
+    return [
+        feature for feature in _vector_export._get_drawn_features(surface)
+        if isinstance(feature, feature_class)
+    ]
+
+
+def _get_sweep(start, angle, end):
+    """Get the angle swept from the start of an arc to reach another angle.
+
+    The angle is swept in the same direction as the arc
+    """
+    direction = 1.0 if end >= start else -1.0
+
+    return ((angle - start) * direction) % (2.0 * math.pi)
+
+
+def test_faceoff_circle_arcs_are_recovered():
+    rink = NHLRink()
+    circles = _get_features(rink, hockey.OzoneDzoneFaceoffCircle)
+    assert len(circles) == 4
+
+    for circle in circles:
+        outer = circle.feature_radius
+        inner = outer - circle.feature_thickness
+
+        assert _get_arcs(circle) == [
+            (circle.x_anchor, circle.y_anchor, round(inner, 9)),
+            (circle.x_anchor, circle.y_anchor, round(outer, 9))
+        ]
+
+
+def test_board_corner_arcs_are_recovered():
+    rink = NHLRink()
+
+    # Each end of the boards is its own feature
+    ends = _get_features(rink, hockey.Boards)
+    boards = ends[0]
+    corner_x = (rink.rink_length / 2.0) - boards.feature_radius
+    corner_y = (rink.rink_width / 2.0) - boards.feature_radius
+    radii = (
+        boards.feature_radius,
+        round(boards.feature_radius + boards.feature_thickness, 9)
+    )
+
+    assert sorted(sum((_get_arcs(end) for end in ends), [])) == sorted(
+        (x, y, radius)
+        for x in (-corner_x, corner_x)
+        for y in (-corner_y, corner_y)
+        for radius in radii
+    )
+
+
+def test_three_point_arcs_are_recovered():
+    court = NBACourt()
+
+    for line in _get_features(court, basketball.ThreePointLine):
+        basket_x = math.copysign(court.basket_center_x, line.x_anchor)
+
+        assert _get_arcs(line) == [
+            (
+                basket_x,
+                0.0,
+                round(
+                    court.three_point_arc_distance - line.feature_thickness,
+                    9
+                )
+            ),
+            (basket_x, 0.0, court.three_point_arc_distance)
+        ]
+
+
+@pytest.mark.parametrize('surface_class', [NBACourt, NHLRink])
+def test_segments_trace_every_point(surface_class):
+    for feature in _vector_export._get_drawn_features(surface_class()):
+        pts = feature._translate_feature()
+        pts = pts[~np.isnan(pts).any(axis = 1)]
+        segments = _vector_export._outline_segments(
+            feature._translate_feature()
+        )
+
+        ends = [segment[1:3] for segment in segments if segment[0] in 'ML']
+        arcs = [segment[1:] for segment in segments if segment[0] == 'A']
+        for cx, cy, radius, start, end in arcs:
+            ends.append((
+                cx + (radius * math.cos(end)),
+                cy + (radius * math.sin(end))
+            ))
+
+        # Each point of the outline is the end of a line, or lies on one of
+        # the arcs between its ends
+        for x, y in pts:
+            is_end = any(
+                math.isclose(x, end_x, abs_tol = 1e-9) and
+                math.isclose(y, end_y, abs_tol = 1e-9)
+                for end_x, end_y in ends
+            )
+            is_on_arc = any(
+                math.isclose(
+                    math.hypot(x - cx, y - cy),
+                    radius,
+                    abs_tol = 1e-9
+                ) and
+                _get_sweep(start, math.atan2(y - cy, x - cx), end) <=
+                abs(end - start) + 1e-9
+                for cx, cy, radius, start, end in arcs
+            )
+
+            assert is_end or is_on_arc
+
+
+def test_repeated_points_are_not_drawn():
+    pts = np.array([
+        [0.0, 0.0], [1.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]
+    ])
+
+    assert _vector_export._outline_segments(pts) == [
+        ('M', 0.0, 0.0),
+        ('L', 1.0, 0.0),
+        ('L', 1.0, 1.0),
+        ('L', 0.0, 0.0),
+        ('Z',)
+    ]